@@ -0,0 +1,48 @@
+"""Regenerate src/engine/_macrs_data.py from data/macrs_tables.json.
+
+The JSON file stays the editable source of truth; the engine imports the
+baked tuples so the depreciation path never parses JSON at runtime.
+
+Usage: python scripts/bake_macrs_tables.py
+"""
+
+import json
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SOURCE = ROOT / "data" / "macrs_tables.json"
+TARGET = ROOT / "src" / "engine" / "_macrs_data.py"
+
+
+def _row(values: list[float]) -> str:
+    return "(" + ", ".join(repr(float(v)) for v in values) + ")"
+
+
+def bake() -> str:
+    with open(SOURCE) as f:
+        tables = json.load(f)
+
+    residential = tables["residential_27_5"]["table"]
+    lines = [
+        '"""MACRS percentage tables (IRS Pub 946), baked from data/macrs_tables.json.',
+        "",
+        "Generated by scripts/bake_macrs_tables.py -- do not edit by hand.",
+        '"""',
+        "",
+        "# Row = year (1-29), column = month placed in service (1-12)",
+        "RESIDENTIAL_27_5 = (",
+    ]
+    for year in range(1, len(residential) + 1):
+        lines.append(f"    {_row(residential[str(year)])},")
+    lines.append(")")
+    lines.append("")
+    for macrs_class in ("5", "7", "15"):
+        percentages = tables[f"macrs_{macrs_class}_year"]["percentages"]
+        lines.append(f"MACRS_{macrs_class} = {_row(percentages)}")
+    lines.append("")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    TARGET.write_text(bake())
+    print(f"Wrote {TARGET.relative_to(ROOT)}")
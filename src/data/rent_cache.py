@@ -3,7 +3,8 @@
 import json
 import logging
 import sqlite3
-from datetime import datetime, timedelta, timezone
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta, timezone
 
 from src.models.rent_estimate import UsageStats
 
@@ -106,6 +107,16 @@ class RentCache:
                 (tier, address, now, cost, cache_hit),
             )
 
+    def log_usage_many(self, rows: Iterable[tuple[str, str, float, bool]]) -> None:
+        """Record many (tier, address, cost, cache_hit) usage events in one transaction."""
+        now = datetime.now(UTC).isoformat()
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT INTO api_usage (tier, address, called_at, cost_estimate, cache_hit) "
+                "VALUES (?, ?, ?, ?, ?)",
+                ((tier, address, now, cost, cache_hit) for tier, address, cost, cache_hit in rows),
+            )
+
     def get_rentcast_calls_this_month(self) -> int:
         """Count RentCast API calls (non-cache-hit) in the current calendar month."""
         now = datetime.now(timezone.utc)
@@ -0,0 +1,18 @@
+"""Optional numba JIT shim shared by the engine's float kernels.
+
+With numba installed (the ``perf`` extra) kernels decorated with ``njit``
+are compiled; without it the decorator is a no-op and they run as plain
+Python, so callers pass lists rather than arrays to avoid boxing a numpy
+scalar per element.
+"""
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:  # numba is optional; kernels run as plain Python
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
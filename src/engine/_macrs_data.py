@@ -0,0 +1,41 @@
+"""MACRS percentage tables (IRS Pub 946), baked from data/macrs_tables.json.
+
+Generated by scripts/bake_macrs_tables.py -- do not edit by hand.
+"""
+
+# Row = year (1-29), column = month placed in service (1-12)
+RESIDENTIAL_27_5 = (
+    (3.485, 3.182, 2.879, 2.576, 2.273, 1.97, 1.667, 1.364, 1.061, 0.758, 0.455, 0.152),
+    (3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636),
+    (3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636),
+    (3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636),
+    (3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636),
+    (3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636),
+    (3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636),
+    (3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636),
+    (3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636),
+    (3.637, 3.637, 3.637, 3.637, 3.637, 3.637, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636),
+    (3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.637, 3.637, 3.637, 3.637, 3.637, 3.637),
+    (3.637, 3.637, 3.637, 3.637, 3.637, 3.637, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636),
+    (3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.637, 3.637, 3.637, 3.637, 3.637, 3.637),
+    (3.637, 3.637, 3.637, 3.637, 3.637, 3.637, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636),
+    (3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.637, 3.637, 3.637, 3.637, 3.637, 3.637),
+    (3.637, 3.637, 3.637, 3.637, 3.637, 3.637, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636),
+    (3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.637, 3.637, 3.637, 3.637, 3.637, 3.637),
+    (3.637, 3.637, 3.637, 3.637, 3.637, 3.637, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636),
+    (3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.637, 3.637, 3.637, 3.637, 3.637, 3.637),
+    (3.637, 3.637, 3.637, 3.637, 3.637, 3.637, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636),
+    (3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.637, 3.637, 3.637, 3.637, 3.637, 3.637),
+    (3.637, 3.637, 3.637, 3.637, 3.637, 3.637, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636),
+    (3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.637, 3.637, 3.637, 3.637, 3.637, 3.637),
+    (3.637, 3.637, 3.637, 3.637, 3.637, 3.637, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636),
+    (3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.637, 3.637, 3.637, 3.637, 3.637, 3.637),
+    (3.637, 3.637, 3.637, 3.637, 3.637, 3.637, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636),
+    (3.636, 3.636, 3.636, 3.636, 3.636, 3.636, 3.637, 3.637, 3.637, 3.637, 3.637, 3.637),
+    (1.97, 2.273, 2.576, 2.879, 3.182, 3.485, 3.636, 3.636, 3.636, 3.636, 3.636, 3.636),
+    (0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.152, 0.455, 0.758, 1.061, 1.364, 1.667),
+)
+
+MACRS_5 = (20.0, 32.0, 19.2, 11.52, 11.52, 5.76)
+MACRS_7 = (14.29, 24.49, 17.49, 12.49, 8.93, 8.92, 8.93, 4.46)
+MACRS_15 = (5.0, 9.5, 8.55, 7.7, 6.93, 6.23, 5.9, 5.9, 5.91, 5.9, 5.91, 5.9, 5.91, 5.9, 5.91, 2.95)
@@ -5,6 +5,7 @@ Sits between data resolution and the pure engine:
     → (DealAssumptions, AssumptionManifest)
 """
 
+from bisect import bisect_left
 from decimal import Decimal
 
 from src.models.assumptions import DealAssumptions, CostSegAllocation
@@ -29,6 +30,33 @@ from src.data.noaa_hazards import get_hurricane_zone, get_hail_frequency
 from src.data.fbi_crime import get_crime_rate
 from src.models.rent_estimate import RentEstimate
 
+_ZERO = Decimal("0")
+
+# Rent growth = 50% of CPI CAGR + 20% local trend + neighborhood grade premium,
+# clamped to 1%-6%
+_DEFAULT_CPI_CAGR = Decimal("0.03")
+_CPI_RENT_WEIGHT = Decimal("0.50")
+_LOCAL_TREND_WEIGHT = Decimal("0.20")
+_GRADE_RENT_PREMIUMS = {
+    "A": Decimal("0.005"), "B": Decimal("0.003"), "C": _ZERO,
+    "D": Decimal("-0.005"), "F": Decimal("-0.01"),
+}
+_MIN_RENT_GROWTH = Decimal("0.01")
+_MAX_RENT_GROWTH = Decimal("0.06")
+_RENT_GROWTH_PLACES = Decimal("0.001")
+
+# Vacancy by renter share: tiers are "renter % above threshold", so the
+# lookup uses bisect_left and a share equal to a threshold stays in the
+# lower tier
+_DEFAULT_VACANCY = Decimal("0.05")
+_VACANCY_RENTER_THRESHOLDS = (0.20, 0.40, 0.60)
+_VACANCY_TIERS: tuple[tuple[Decimal, str], ...] = (
+    (Decimal("0.08"), "Low"),
+    (Decimal("0.06"), "Lower"),
+    (Decimal("0.05"), "Moderate"),
+    (Decimal("0.04"), "High"),
+)
+
 
 def _detail(
     field: str,
@@ -98,7 +126,7 @@ def build_smart_assumptions(
         price_conf = Confidence.HIGH
         price_just = f"RentCast AVM: ${float(est_price):,.0f}"
     else:
-        est_price = Decimal("0")
+        est_price = _ZERO
         price_source = AssumptionSource.DEFAULT
         price_conf = Confidence.LOW
         price_just = "No data available — user must provide"
@@ -118,7 +146,7 @@ def build_smart_assumptions(
     loan_type = ov.loan_type or "conventional"
 
     # Need a rough DSCR estimate for DSCR loans
-    rough_rent = ov.monthly_rent or prop.estimated_rent or Decimal("0")
+    rough_rent = ov.monthly_rent or prop.estimated_rent or _ZERO
     rough_annual_rent = rough_rent * 12
     rough_expenses_pct = Decimal("0.40")  # rough estimate
     rough_noi = rough_annual_rent * (1 - rough_expenses_pct)
@@ -150,7 +178,7 @@ def build_smart_assumptions(
     details["loan_term_years"] = d_term
 
     details["loan_type"] = _detail(
-        "loan_type", Decimal("0"),  # placeholder
+        "loan_type", _ZERO,  # placeholder
         AssumptionSource.USER_OVERRIDE if ov.loan_type else AssumptionSource.DEFAULT,
         Confidence.HIGH,
         f"Loan type: {loan_type}",
@@ -159,7 +187,7 @@ def build_smart_assumptions(
     # ------------------------------------------------------------------
     # Monthly Rent
     # ------------------------------------------------------------------
-    est_rent = prop.estimated_rent or Decimal("0")
+    est_rent = prop.estimated_rent or _ZERO
     if rent_estimate and rent_estimate.estimated_rent > 0:
         est_rent = Decimal(str(rent_estimate.estimated_rent))
         rent_source = AssumptionSource.API_FETCHED
@@ -187,19 +215,18 @@ def build_smart_assumptions(
     # ------------------------------------------------------------------
     # Rent Growth
     # ------------------------------------------------------------------
-    cpi_cagr = macro.cpi_5yr_cagr or Decimal("0.03")
-    grade_premium = Decimal("0")
+    cpi_cagr = macro.cpi_5yr_cagr or _DEFAULT_CPI_CAGR
+    grade_premium = _ZERO
     if neighborhood and neighborhood.grade:
-        grade_premiums = {"A": "0.005", "B": "0.003", "C": "0", "D": "-0.005", "F": "-0.01"}
-        grade_premium = Decimal(grade_premiums.get(neighborhood.grade.value, "0"))
+        grade_premium = _GRADE_RENT_PREMIUMS.get(neighborhood.grade.value, _ZERO)
 
     est_rent_growth = (
-        cpi_cagr * Decimal("0.50")
+        cpi_cagr * _CPI_RENT_WEIGHT
         + grade_premium
-        + cpi_cagr * Decimal("0.20")
+        + cpi_cagr * _LOCAL_TREND_WEIGHT
     )
-    est_rent_growth = max(Decimal("0.01"), min(Decimal("0.06"), est_rent_growth))
-    est_rent_growth = est_rent_growth.quantize(Decimal("0.001"))
+    est_rent_growth = max(_MIN_RENT_GROWTH, min(_MAX_RENT_GROWTH, est_rent_growth))
+    est_rent_growth = est_rent_growth.quantize(_RENT_GROWTH_PLACES)
 
     annual_rent_growth, d = _override_or(
         "annual_rent_growth", ov.annual_rent_growth,
@@ -211,23 +238,16 @@ def build_smart_assumptions(
     # ------------------------------------------------------------------
     # Vacancy Rate
     # ------------------------------------------------------------------
-    est_vacancy = Decimal("0.05")
+    est_vacancy = _DEFAULT_VACANCY
     vacancy_just = "Default 5% vacancy"
     vacancy_conf = Confidence.LOW
     if neighborhood and neighborhood.demographics and neighborhood.demographics.renter_pct is not None:
         rp = float(neighborhood.demographics.renter_pct)
-        if rp > 0.60:
-            est_vacancy = Decimal("0.04")  # High demand
-            vacancy_just = f"High renter demand ({rp*100:.0f}% renters) → 4% vacancy"
-        elif rp > 0.40:
-            est_vacancy = Decimal("0.05")
-            vacancy_just = f"Moderate renter demand ({rp*100:.0f}% renters) → 5% vacancy"
-        elif rp > 0.20:
-            est_vacancy = Decimal("0.06")
-            vacancy_just = f"Lower renter demand ({rp*100:.0f}% renters) → 6% vacancy"
-        else:
-            est_vacancy = Decimal("0.08")
-            vacancy_just = f"Low renter demand ({rp*100:.0f}% renters) → 8% vacancy"
+        est_vacancy, demand = _VACANCY_TIERS[bisect_left(_VACANCY_RENTER_THRESHOLDS, rp)]
+        vacancy_just = (
+            f"{demand} renter demand ({rp*100:.0f}% renters) → "
+            f"{float(est_vacancy)*100:.0f}% vacancy"
+        )
         vacancy_conf = Confidence.MEDIUM
 
     vacancy_rate, d = _override_or(
@@ -239,7 +259,7 @@ def build_smart_assumptions(
     # ------------------------------------------------------------------
     # Property Tax
     # ------------------------------------------------------------------
-    est_tax = prop.annual_tax or Decimal("0")
+    est_tax = prop.annual_tax or _ZERO
     if est_tax > 0:
         tax_source = AssumptionSource.API_FETCHED
         tax_conf = Confidence.HIGH
@@ -345,7 +365,7 @@ def build_smart_assumptions(
     # ------------------------------------------------------------------
     # HOA
     # ------------------------------------------------------------------
-    est_hoa = Decimal("0")
+    est_hoa = _ZERO
     hoa_just = "No HOA"
     if prop.property_type.upper() in ("CONDO", "TOWNHOUSE"):
         est_hoa = Decimal("250")  # Rough default for condo/townhouse
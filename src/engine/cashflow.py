@@ -3,7 +3,11 @@
 Pure functions: Decimal in, Decimal out. No I/O.
 """
 
+from collections.abc import Callable, Sequence
 from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
+
+import numpy as np
 
 from src.models.assumptions import DealAssumptions
 
@@ -11,13 +15,20 @@ TWO_PLACES = Decimal("0.01")
 FOUR_PLACES = Decimal("0.0001")
 
 
+@lru_cache(maxsize=1024)
+def _growth_factor(rate: Decimal, periods: int) -> Decimal:
+    """(1 + rate) ** periods, memoized: each deal reuses the same few rates
+    over every year of the hold, and sweeps share them across scenarios."""
+    return (1 + rate) ** periods
+
+
 def gross_rent(assumptions: DealAssumptions, year: int) -> Decimal:
     """Gross scheduled rent for a given year (1-indexed).
 
     Year 1 is pro-rated if there is a rehab period (no rental income during rehab).
     """
     annual = assumptions.monthly_rent * 12
-    growth_factor = (1 + assumptions.annual_rent_growth) ** (year - 1)
+    growth_factor = _growth_factor(assumptions.annual_rent_growth, year - 1)
     full_year = (annual * growth_factor).quantize(TWO_PLACES, ROUND_HALF_UP)
     if year == 1 and assumptions.rehab_budget.rehab_months > 0:
         rehab_months = min(assumptions.rehab_budget.rehab_months, 12)
@@ -30,21 +41,31 @@ def gross_rent(assumptions: DealAssumptions, year: int) -> Decimal:
 
 def effective_gross_income(assumptions: DealAssumptions, year: int) -> Decimal:
     """EGI = gross rent - vacancy + other income."""
-    gr = gross_rent(assumptions, year)
+    return effective_gross_income_from_rent(assumptions, gross_rent(assumptions, year))
+
+
+def effective_gross_income_from_rent(assumptions: DealAssumptions, gr: Decimal) -> Decimal:
+    """EGI for a year whose gross rent is already known."""
     vacancy = (gr * assumptions.vacancy_rate).quantize(TWO_PLACES, ROUND_HALF_UP)
     return gr - vacancy + assumptions.other_income
 
 
 def operating_expenses(assumptions: DealAssumptions, year: int) -> dict[str, Decimal]:
     """Calculate itemized operating expenses for a given year."""
-    gr = gross_rent(assumptions, year)
-    expense_growth = (1 + assumptions.annual_expense_growth) ** (year - 1)
+    return operating_expenses_from_rent(assumptions, year, gross_rent(assumptions, year))
+
+
+def operating_expenses_from_rent(
+    assumptions: DealAssumptions, year: int, gr: Decimal
+) -> dict[str, Decimal]:
+    """Itemized operating expenses for a year whose gross rent is already known."""
+    expense_growth = _growth_factor(assumptions.annual_expense_growth, year - 1)
 
     # Property tax and insurance grow with expense growth rate
-    prop_tax = (assumptions.property_tax * Decimal(str(expense_growth))).quantize(
+    prop_tax = (assumptions.property_tax * expense_growth).quantize(
         TWO_PLACES, ROUND_HALF_UP
     )
-    insurance = (assumptions.insurance * Decimal(str(expense_growth))).quantize(
+    insurance = (assumptions.insurance * expense_growth).quantize(
         TWO_PLACES, ROUND_HALF_UP
     )
 
@@ -83,11 +104,14 @@ def cash_flow_before_tax(
 
 def cap_rate(assumptions: DealAssumptions, year: int = 1) -> Decimal:
     """Cap rate = Year 1 NOI / purchase price."""
-    if assumptions.purchase_price == 0:
+    return cap_rate_from_noi(noi(assumptions, year), assumptions.purchase_price)
+
+
+def cap_rate_from_noi(noi_amount: Decimal, purchase_price: Decimal) -> Decimal:
+    """Cap rate = NOI / purchase price, for an NOI already computed."""
+    if purchase_price == 0:
         return Decimal("0")
-    return (noi(assumptions, year) / assumptions.purchase_price).quantize(
-        FOUR_PLACES, ROUND_HALF_UP
-    )
+    return (noi_amount / purchase_price).quantize(FOUR_PLACES, ROUND_HALF_UP)
 
 
 def cash_on_cash(
@@ -108,7 +132,87 @@ def dscr(noi_amount: Decimal, annual_debt_service: Decimal) -> Decimal:
 
 def property_value(assumptions: DealAssumptions, year: int) -> Decimal:
     """Estimated property value at end of year based on appreciation."""
-    growth = (1 + assumptions.annual_appreciation) ** year
-    return (assumptions.purchase_price * Decimal(str(growth))).quantize(
+    growth = _growth_factor(assumptions.annual_appreciation, year)
+    return (assumptions.purchase_price * growth).quantize(
         TWO_PLACES, ROUND_HALF_UP
     )
+
+
+def _proforma_arrays(
+    param: Callable[[str], float | np.ndarray],
+    rehab_months: int | np.ndarray,
+    hold_years: int,
+) -> dict[str, np.ndarray]:
+    """Shared body of build_proforma_arrays / build_proforma_arrays_batch.
+
+    param(name) returns a DealAssumptions field as a float, or as an (N, 1)
+    column for a batch; outputs broadcast to (hold_years,) or (N, hold_years).
+    """
+    years = np.arange(1, hold_years + 1, dtype=np.float64)
+    rent_growth = (1 + param("annual_rent_growth")) ** (years - 1)
+    expense_growth = (1 + param("annual_expense_growth")) ** (years - 1)
+    appreciation = (1 + param("annual_appreciation")) ** years
+
+    gross = np.round(param("monthly_rent") * 12 * rent_growth, 2)
+    if hold_years > 0:
+        rent_months = 12 - np.minimum(rehab_months, 12)
+        prorated = np.round(gross[..., :1] * rent_months / 12, 2)
+        gross[..., :1] = np.where(rehab_months > 0, prorated, gross[..., :1])
+
+    vacancy = np.round(gross * param("vacancy_rate"), 2)
+    egi = gross - vacancy + param("other_income")
+
+    prop_tax = np.round(param("property_tax") * expense_growth, 2)
+    insurance = np.round(param("insurance") * expense_growth, 2)
+    maintenance = np.round(gross * param("maintenance_pct"), 2)
+    management = np.round(gross * param("management_pct"), 2)
+    capex = np.round(gross * param("capex_reserve_pct"), 2)
+    hoa = np.round(param("hoa") * 12, 2) + np.zeros_like(gross)
+    total_expenses = prop_tax + insurance + maintenance + management + capex + hoa
+
+    return {
+        "gross_rent": gross,
+        "vacancy": vacancy,
+        "effective_gross_income": egi,
+        "property_tax": prop_tax,
+        "insurance": insurance,
+        "maintenance": maintenance,
+        "management": management,
+        "capex_reserve": capex,
+        "hoa": hoa,
+        "total_expenses": total_expenses,
+        "noi": egi - total_expenses,
+        "property_value": np.round(param("purchase_price") * appreciation, 2),
+    }
+
+
+def build_proforma_arrays(
+    assumptions: DealAssumptions, hold_years: int
+) -> dict[str, np.ndarray]:
+    """Vectorized income/expense/NOI/value arrays for years 1..hold_years.
+
+    Computes every year in one float64 pass instead of calling the per-year
+    Decimal functions in a loop. Values are rounded to cents; index 0 is year 1.
+    Intended for scenario sweeps — run_proforma keeps the exact Decimal path.
+    """
+    return _proforma_arrays(
+        lambda name: float(getattr(assumptions, name)),
+        assumptions.rehab_budget.rehab_months,
+        hold_years,
+    )
+
+
+def build_proforma_arrays_batch(
+    scenarios: Sequence[DealAssumptions], hold_years: int
+) -> dict[str, np.ndarray]:
+    """build_proforma_arrays for N scenarios at once; arrays are (N, hold_years)."""
+    def param(name: str) -> np.ndarray:
+        return np.array([float(getattr(s, name)) for s in scenarios])[:, None]
+
+    rehab_months = np.array([s.rehab_budget.rehab_months for s in scenarios])[:, None]
+    return _proforma_arrays(param, rehab_months, hold_years)
+
+
+def proforma_array_value(arrays: dict[str, np.ndarray], key: str, year: int) -> Decimal:
+    """Decimal view of one year (1-indexed) from build_proforma_arrays output."""
+    return Decimal(str(round(float(arrays[key][year - 1]), 2))).quantize(TWO_PLACES)
@@ -3,13 +3,17 @@
 Pure functions: Decimal in, dataclass out. No I/O.
 """
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
+
+import numpy as np
 
 TWO_PLACES = Decimal("0.01")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AmortizationPayment:
     period: int
     payment: Decimal
@@ -18,13 +22,73 @@ class AmortizationPayment:
     balance: Decimal
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AmortizationSchedule:
-    payments: list[AmortizationPayment]
+    """Amortization results stored column-wise, one Decimal per period.
+
+    ``payments`` is a sequence view that builds AmortizationPayment rows on
+    access, so a 360-period schedule holds four tuples rather than 360
+    objects and per-year sums slice a column.
+    """
+
+    payment_amounts: tuple[Decimal, ...]
+    principal_paid: tuple[Decimal, ...]
+    interest_paid: tuple[Decimal, ...]
+    balances: tuple[Decimal, ...]
     monthly_payment: Decimal
     total_interest: Decimal
     total_principal: Decimal
 
+    @property
+    def payments(self) -> "_SchedulePayments":
+        return _SchedulePayments(self)
+
+    def as_arrays(self) -> dict[str, np.ndarray]:
+        """Float64 copy of each column, keyed like AmortizationPayment fields."""
+        return {
+            "payment": np.array(self.payment_amounts, dtype=np.float64),
+            "principal": np.array(self.principal_paid, dtype=np.float64),
+            "interest": np.array(self.interest_paid, dtype=np.float64),
+            "balance": np.array(self.balances, dtype=np.float64),
+        }
+
+
+class _SchedulePayments(Sequence[AmortizationPayment]):
+    """Read-only payment view over a schedule's columns."""
+
+    __slots__ = ("_schedule",)
+
+    def __init__(self, schedule: AmortizationSchedule):
+        self._schedule = schedule
+
+    def __len__(self) -> int:
+        return len(self._schedule.balances)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        i = range(len(self))[index]
+        schedule = self._schedule
+        return AmortizationPayment(
+            period=i + 1,
+            payment=schedule.payment_amounts[i],
+            principal=schedule.principal_paid[i],
+            interest=schedule.interest_paid[i],
+            balance=schedule.balances[i],
+        )
+
+
+@lru_cache(maxsize=1024)
+def _payment_factor(annual_rate: Decimal, term_years: int) -> Decimal:
+    """Payment per dollar of principal: r(1+r)^n / [(1+r)^n - 1].
+
+    Depends only on (rate, term), so scenario sweeps over principal reuse it.
+    """
+    r = annual_rate / 12
+    n = term_years * 12
+    factor = (1 + r) ** n
+    return (r * factor) / (factor - 1)
+
 
 def monthly_payment(principal: Decimal, annual_rate: Decimal, term_years: int) -> Decimal:
     """Calculate fixed monthly mortgage payment."""
@@ -33,38 +97,32 @@ def monthly_payment(principal: Decimal, annual_rate: Decimal, term_years: int) -
     if annual_rate <= 0:
         return (principal / (term_years * 12)).quantize(TWO_PLACES, ROUND_HALF_UP)
 
-    r = annual_rate / 12
-    n = term_years * 12
     # M = P * [r(1+r)^n] / [(1+r)^n - 1]
-    factor = (1 + r) ** n
-    payment = principal * (r * factor) / (factor - 1)
+    payment = principal * _payment_factor(annual_rate, term_years)
     return payment.quantize(TWO_PLACES, ROUND_HALF_UP)
 
 
-def amortization_schedule(
+def _amortization_rows(
     principal: Decimal,
     annual_rate: Decimal,
     term_years: int,
-    hold_years: int | None = None,
-) -> AmortizationSchedule:
-    """Generate full or partial amortization schedule.
+    hold_years: int | None,
+) -> tuple[Decimal, list[tuple[Decimal, Decimal, Decimal, Decimal]]]:
+    """Monthly payment and per-period (payment, principal, interest, balance).
 
-    Args:
-        principal: Loan amount
-        annual_rate: Annual interest rate (e.g. 0.07 for 7%)
-        term_years: Loan term in years
-        hold_years: If provided, only generate schedule for this many years
+    Plain tuples keep the loop free of per-payment object construction,
+    which costs more than the Decimal arithmetic itself.
     """
     pmt = monthly_payment(principal, annual_rate, term_years)
     r = annual_rate / 12
     n_periods = (hold_years or term_years) * 12
 
-    payments: list[AmortizationPayment] = []
+    rows: list[tuple[Decimal, Decimal, Decimal, Decimal]] = []
+    # The running balance keeps full precision (principal need not be whole
+    # cents, e.g. price * LTV); only the recorded balance is rounded.
     balance = principal
-    total_interest = Decimal("0")
-    total_principal = Decimal("0")
 
-    for period in range(1, n_periods + 1):
+    for _ in range(n_periods):
         interest = (balance * r).quantize(TWO_PLACES, ROUND_HALF_UP)
         principal_paid = pmt - interest
 
@@ -76,22 +134,44 @@ def amortization_schedule(
             actual_payment = pmt
 
         balance -= principal_paid
-        total_interest += interest
-        total_principal += principal_paid
+        rows.append(
+            (actual_payment, principal_paid, interest, balance.quantize(TWO_PLACES, ROUND_HALF_UP))
+        )
+
+    return pmt, rows
+
 
-        payments.append(AmortizationPayment(
-            period=period,
-            payment=actual_payment,
-            principal=principal_paid,
-            interest=interest,
-            balance=balance.quantize(TWO_PLACES, ROUND_HALF_UP),
-        ))
+@lru_cache(maxsize=1024)
+def amortization_schedule(
+    principal: Decimal,
+    annual_rate: Decimal,
+    term_years: int,
+    hold_years: int | None = None,
+) -> AmortizationSchedule:
+    """Generate full or partial amortization schedule.
+
+    Memoized on the loan terms (the schedule is immutable), so sweeps that
+    vary only rent or expense assumptions build each schedule once.
+
+    Args:
+        principal: Loan amount
+        annual_rate: Annual interest rate (e.g. 0.07 for 7%)
+        term_years: Loan term in years
+        hold_years: If provided, only generate schedule for this many years
+    """
+    pmt, rows = _amortization_rows(principal, annual_rate, term_years, hold_years)
+    payment_amounts, principal_paid, interest_paid, balances = (
+        tuple(zip(*rows)) if rows else ((), (), (), ())
+    )
 
     return AmortizationSchedule(
-        payments=payments,
+        payment_amounts=payment_amounts,
+        principal_paid=principal_paid,
+        interest_paid=interest_paid,
+        balances=balances,
         monthly_payment=pmt,
-        total_interest=total_interest,
-        total_principal=total_principal,
+        total_interest=sum(interest_paid, Decimal("0")),
+        total_principal=sum(principal_paid, Decimal("0")),
     )
 
 
@@ -100,27 +180,88 @@ def yearly_debt_summary(schedule: AmortizationSchedule) -> list[dict[str, Decima
 
     Returns list of dicts with keys: year, principal, interest, debt_service, ending_balance
     """
+    n_periods = len(schedule.balances)
     yearly: list[dict[str, Decimal]] = []
-    year_principal = Decimal("0")
-    year_interest = Decimal("0")
-    year_debt_service = Decimal("0")
-
-    for p in schedule.payments:
-        year_principal += p.principal
-        year_interest += p.interest
-        year_debt_service += p.payment
-
-        if p.period % 12 == 0 or p.period == len(schedule.payments):
-            year_num = (p.period - 1) // 12 + 1
-            yearly.append({
-                "year": Decimal(str(year_num)),
-                "principal": year_principal,
-                "interest": year_interest,
-                "debt_service": year_debt_service,
-                "ending_balance": p.balance,
-            })
-            year_principal = Decimal("0")
-            year_interest = Decimal("0")
-            year_debt_service = Decimal("0")
+    for start in range(0, n_periods, 12):
+        end = min(start + 12, n_periods)
+        yearly.append({
+            "year": Decimal(str(start // 12 + 1)),
+            "principal": sum(schedule.principal_paid[start:end], Decimal("0")),
+            "interest": sum(schedule.interest_paid[start:end], Decimal("0")),
+            "debt_service": sum(schedule.payment_amounts[start:end], Decimal("0")),
+            "ending_balance": schedule.balances[end - 1],
+        })
 
     return yearly
+
+
+@lru_cache(maxsize=1024)
+def yearly_debt_for_loan(
+    principal: Decimal,
+    annual_rate: Decimal,
+    term_years: int,
+    hold_years: int,
+) -> tuple[dict[str, Decimal], ...]:
+    """yearly_debt_summary(amortization_schedule(...)), memoized on the loan terms.
+
+    The returned dicts are shared between callers and must not be mutated.
+    """
+    schedule = amortization_schedule(principal, annual_rate, term_years, hold_years)
+    return tuple(yearly_debt_summary(schedule))
+
+
+def yearly_debt_arrays(
+    principal: float | np.ndarray,
+    annual_rate: float | np.ndarray,
+    term_years: int | np.ndarray,
+    hold_years: int,
+) -> dict[str, np.ndarray]:
+    """Float64 yearly debt summary for years 1..hold_years.
+
+    Closed-form monthly balances instead of the per-period Decimal loop, so
+    interest is not rounded to cents each month and the balance drifts from
+    amortization_schedule by the accumulated half-cent roundings. Against
+    yearly_debt_summary, yearly interest stays within about $0.15. Balances
+    differ by tens of cents over holds of up to 10 years. Over a full
+    30-year term on loans up to $2M the gap reaches about $1.20, and the
+    final year's principal and debt service absorb it.
+    Scalar inputs give (hold_years,) arrays; (N,) inputs give (N, hold_years).
+    Keys: principal, interest, debt_service, ending_balance.
+    """
+    principal = np.asarray(principal, dtype=np.float64)[..., None]
+    r = np.asarray(annual_rate, dtype=np.float64)[..., None] / 12
+    n = np.asarray(term_years, dtype=np.float64)[..., None] * 12
+    k = np.arange(hold_years * 12 + 1, dtype=np.float64)
+
+    # Payment rounded half-up to cents, as in monthly_payment (worked in cents
+    # so zero-rate payments that land on exactly half a cent round the same way)
+    has_rate = r > 0
+    safe_r = np.where(has_rate, r, 1.0)
+    factor = (1 + safe_r) ** n
+    cents = principal * 100
+    pmt_cents = np.where(has_rate, cents * safe_r * factor / (factor - 1), cents / n)
+    pmt = np.where(principal > 0, np.floor(pmt_cents + 0.5) / 100, 0.0)
+
+    growth = (1 + safe_r) ** k
+    balances = np.where(
+        has_rate,
+        principal * growth - pmt * (growth - 1) / safe_r,
+        principal - pmt * k,
+    )
+    balances = np.maximum(balances, 0.0)
+
+    opening = balances[..., :-1]
+    principal_paid = opening - balances[..., 1:]
+    interest = np.where(opening > 0, opening * r, 0.0)
+
+    def by_year(monthly: np.ndarray) -> np.ndarray:
+        return np.round(monthly.reshape(*monthly.shape[:-1], hold_years, 12).sum(axis=-1), 2)
+
+    principal_by_year = by_year(principal_paid)
+    interest_by_year = by_year(interest)
+    return {
+        "principal": principal_by_year,
+        "interest": interest_by_year,
+        "debt_service": principal_by_year + interest_by_year,
+        "ending_balance": np.round(balances[..., 12::12], 2),
+    }
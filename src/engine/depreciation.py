@@ -4,29 +4,47 @@ MACRS accelerated schedules, cost segregation, and bonus depreciation.
 Pure functions. Validates against IRS Pub 946.
 """
 
-import json
 from dataclasses import dataclass
 from decimal import Decimal, ROUND_HALF_UP
-from pathlib import Path
+from functools import cached_property, lru_cache
 
+import numpy as np
+
+from src.engine._macrs_data import RESIDENTIAL_27_5, MACRS_5, MACRS_7, MACRS_15
 from src.models.assumptions import DealAssumptions, CostSegAllocation
 from src.config import settings
 
 TWO_PLACES = Decimal("0.01")
 
-_MACRS_TABLES: dict | None = None
-
-
-def _load_macrs_tables() -> dict:
-    global _MACRS_TABLES
-    if _MACRS_TABLES is None:
-        path = Path(__file__).parent.parent.parent / "data" / "macrs_tables.json"
-        with open(path) as f:
-            _MACRS_TABLES = json.load(f)
-    return _MACRS_TABLES
-
-
-@dataclass(frozen=True)
+# MACRS tables parsed to Decimal fractions (percent / 100) at import, so a
+# depreciation call is a tuple index and one multiply. "residential_27_5"
+# is indexed [year - 1][month - 1]; "5", "7", "15" are indexed [year - 1].
+_MACRS_RATES: dict[str, tuple] = {
+    "residential_27_5": tuple(
+        tuple(Decimal(str(v)) / 100 for v in row) for row in RESIDENTIAL_27_5
+    ),
+    "5": tuple(Decimal(str(p)) / 100 for p in MACRS_5),
+    "7": tuple(Decimal(str(p)) / 100 for p in MACRS_7),
+    "15": tuple(Decimal(str(p)) / 100 for p in MACRS_15),
+}
+_RESIDENTIAL_RATES = _MACRS_RATES["residential_27_5"]
+
+# float64 copies for the vectorized schedule: "residential_27_5" has shape
+# (29, 12); "5", "7", "15" are 1-D by year.
+_MACRS_ARRAYS: dict[str, np.ndarray] = {
+    key: np.array(rates, dtype=np.float64) for key, rates in _MACRS_RATES.items()
+}
+
+
+def _rates_for_years(rates: np.ndarray, n_years: int) -> np.ndarray:
+    """First n_years entries of a rate column, zero-padded past the table end."""
+    out = np.zeros(n_years, dtype=np.float64)
+    n = min(n_years, len(rates))
+    out[:n] = rates[:n]
+    return out
+
+
+@dataclass(frozen=True, slots=True)
 class DepreciationComponent:
     """Depreciation for one MACRS class in one year."""
     macrs_class: str  # "27.5", "5", "7", "15"
@@ -36,7 +54,7 @@ class DepreciationComponent:
     is_bonus: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class YearlyDepreciation:
     year: int
     residential: Decimal  # 27.5-year component
@@ -45,10 +63,15 @@ class YearlyDepreciation:
     fifteen_year: Decimal
     bonus: Decimal
     total: Decimal
+    cost_seg_total: Decimal  # five_year + seven_year + fifteen_year + bonus
 
 
+@lru_cache(maxsize=64)
 def _bonus_rate(placed_in_service_year: int) -> Decimal:
-    """Get bonus depreciation rate for the year placed in service."""
+    """Get bonus depreciation rate for the year placed in service.
+
+    Settings are loaded once at startup, so the rate is resolved once per year.
+    """
     rates = settings.bonus_depreciation_rate
     rate = rates.get(placed_in_service_year, Decimal("0"))
     return Decimal(str(rate))
@@ -66,15 +89,10 @@ def residential_depreciation(
         placed_in_service_month: Month (1-12) property was placed in service
         year: Depreciation year (1-indexed)
     """
-    tables = _load_macrs_tables()
-    table = tables["residential_27_5"]["table"]
-
-    year_key = str(year)
-    if year_key not in table:
+    if year < 1 or year > len(_RESIDENTIAL_RATES):
         return Decimal("0")
 
-    month_index = placed_in_service_month - 1
-    pct = Decimal(str(table[year_key][month_index])) / 100
+    pct = _RESIDENTIAL_RATES[year - 1][placed_in_service_month - 1]
     return (depreciable_basis * pct).quantize(TWO_PLACES, ROUND_HALF_UP)
 
 
@@ -90,79 +108,120 @@ def macrs_depreciation(
         macrs_class: "5", "7", or "15"
         year: Depreciation year (1-indexed)
     """
-    tables = _load_macrs_tables()
-    key = f"macrs_{macrs_class}_year"
-    percentages = tables[key]["percentages"]
-
+    percentages = _MACRS_RATES[macrs_class]
     if year < 1 or year > len(percentages):
         return Decimal("0")
 
-    pct = Decimal(str(percentages[year - 1])) / 100
+    pct = percentages[year - 1]
     return (basis * pct).quantize(TWO_PLACES, ROUND_HALF_UP)
 
 
+@dataclass(frozen=True)
+class _AllocatedBases:
+    """Per-class bases for one deal; identical for every depreciation year."""
+    residential: Decimal
+    bonus: Decimal  # Year-1 bonus across 5/7/15-year classes
+    year1_remaining: tuple[Decimal, Decimal, Decimal]  # 5/7/15 basis net of rounded bonus
+    later_remaining: tuple[Decimal, Decimal, Decimal]  # 5/7/15 basis * (1 - bonus rate)
+
+    @cached_property
+    def float64(self) -> tuple[float, float, np.ndarray, np.ndarray]:
+        """(residential, bonus, year-1 remaining, later remaining) as FP64.
+
+        Used by the vectorized schedule so the bonus split and (1 - bonus
+        rate) reduction are converted once per deal rather than per call.
+        """
+        return (
+            float(self.residential),
+            float(self.bonus),
+            np.array([float(b) for b in self.year1_remaining]),
+            np.array([float(b) for b in self.later_remaining]),
+        )
+
+
+@lru_cache(maxsize=64)
+def _allocate_bases(
+    dep_basis: Decimal,
+    cost_seg_key: tuple[Decimal, Decimal, Decimal],
+    bonus_rate: Decimal,
+) -> _AllocatedBases:
+    """Allocate depreciable basis to MACRS classes and apply bonus depreciation."""
+    five_pct, seven_pct, fifteen_pct = cost_seg_key
+    class_bases = (dep_basis * five_pct, dep_basis * seven_pct, dep_basis * fifteen_pct)
+    residential = dep_basis * (1 - five_pct - seven_pct - fifteen_pct)
+
+    if bonus_rate > 0:
+        bonuses = tuple(
+            (b * bonus_rate).quantize(TWO_PLACES, ROUND_HALF_UP) for b in class_bases
+        )
+        return _AllocatedBases(
+            residential=residential,
+            bonus=sum(bonuses, Decimal("0")),
+            year1_remaining=tuple(b - bonus for b, bonus in zip(class_bases, bonuses)),
+            later_remaining=tuple(b * (1 - bonus_rate) for b in class_bases),
+        )
+    return _AllocatedBases(
+        residential=residential,
+        bonus=Decimal("0"),
+        year1_remaining=class_bases,
+        later_remaining=class_bases,
+    )
+
+
 def compute_yearly_depreciation(
     assumptions: DealAssumptions,
     year: int,
 ) -> YearlyDepreciation:
     """Compute total depreciation for a given year across all MACRS classes.
 
-    Handles cost segregation allocation and bonus depreciation.
+    Handles cost segregation allocation and bonus depreciation. Memoized on
+    the inputs that determine the result (basis, cost seg split, placed-in-
+    service date, year), so scenarios sharing a deal structure reuse it.
     """
-    dep_basis = assumptions.depreciable_basis
     cost_seg = assumptions.cost_seg
-    bonus_rate = _bonus_rate(assumptions.placed_in_service_year)
+    return _yearly_depreciation(
+        assumptions.depreciable_basis,
+        (cost_seg.five_year, cost_seg.seven_year, cost_seg.fifteen_year),
+        assumptions.placed_in_service_year,
+        assumptions.placed_in_service_month,
+        year,
+    )
+
+
+@lru_cache(maxsize=256)
+def _yearly_depreciation(
+    dep_basis: Decimal,
+    cost_seg_key: tuple[Decimal, Decimal, Decimal],
+    placed_in_service_year: int,
+    placed_in_service_month: int,
+    year: int,
+) -> YearlyDepreciation:
+    bases = _allocate_bases(dep_basis, cost_seg_key, _bonus_rate(placed_in_service_year))
 
     # State non-conformity: CA does not allow bonus depreciation
     # For now, compute federal only; state override handled in tax.py
-    state_allows_bonus = assumptions.placed_in_service_year > 0  # placeholder
-
-    # Allocate basis to MACRS classes
-    five_year_basis = dep_basis * cost_seg.five_year
-    seven_year_basis = dep_basis * cost_seg.seven_year
-    fifteen_year_basis = dep_basis * cost_seg.fifteen_year
-    residential_basis = dep_basis * cost_seg.residential_pct
-
-    bonus = Decimal("0")
-    five_yr_dep = Decimal("0")
-    seven_yr_dep = Decimal("0")
-    fifteen_yr_dep = Decimal("0")
-
-    if year == 1 and bonus_rate > 0:
-        # Bonus depreciation applies to 5, 7, and 15-year property in year 1
-        bonus_five = (five_year_basis * bonus_rate).quantize(TWO_PLACES, ROUND_HALF_UP)
-        bonus_seven = (seven_year_basis * bonus_rate).quantize(TWO_PLACES, ROUND_HALF_UP)
-        bonus_fifteen = (fifteen_year_basis * bonus_rate).quantize(TWO_PLACES, ROUND_HALF_UP)
-        bonus = bonus_five + bonus_seven + bonus_fifteen
-
-        # Remaining basis gets regular MACRS
-        remaining_five = five_year_basis - bonus_five
-        remaining_seven = seven_year_basis - bonus_seven
-        remaining_fifteen = fifteen_year_basis - bonus_fifteen
-
-        five_yr_dep = macrs_depreciation(remaining_five, "5", year)
-        seven_yr_dep = macrs_depreciation(remaining_seven, "7", year)
-        fifteen_yr_dep = macrs_depreciation(remaining_fifteen, "15", year)
+    state_allows_bonus = placed_in_service_year > 0  # placeholder
+
+    if year == 1:
+        # Bonus depreciation applies to 5, 7, and 15-year property in year 1;
+        # the remaining basis gets regular MACRS
+        bonus = bases.bonus
+        remaining_five, remaining_seven, remaining_fifteen = bases.year1_remaining
     else:
         # After year 1, no bonus; regular MACRS on post-bonus basis
-        if bonus_rate > 0:
-            remaining_five = five_year_basis * (1 - bonus_rate)
-            remaining_seven = seven_year_basis * (1 - bonus_rate)
-            remaining_fifteen = fifteen_year_basis * (1 - bonus_rate)
-        else:
-            remaining_five = five_year_basis
-            remaining_seven = seven_year_basis
-            remaining_fifteen = fifteen_year_basis
-
-        five_yr_dep = macrs_depreciation(remaining_five, "5", year)
-        seven_yr_dep = macrs_depreciation(remaining_seven, "7", year)
-        fifteen_yr_dep = macrs_depreciation(remaining_fifteen, "15", year)
+        bonus = Decimal("0")
+        remaining_five, remaining_seven, remaining_fifteen = bases.later_remaining
+
+    five_yr_dep = macrs_depreciation(remaining_five, "5", year)
+    seven_yr_dep = macrs_depreciation(remaining_seven, "7", year)
+    fifteen_yr_dep = macrs_depreciation(remaining_fifteen, "15", year)
 
     res_dep = residential_depreciation(
-        residential_basis, assumptions.placed_in_service_month, year
+        bases.residential, placed_in_service_month, year
     )
 
-    total = res_dep + five_yr_dep + seven_yr_dep + fifteen_yr_dep + bonus
+    cost_seg_total = five_yr_dep + seven_yr_dep + fifteen_yr_dep + bonus
+    total = res_dep + cost_seg_total
 
     return YearlyDepreciation(
         year=year,
@@ -172,15 +231,64 @@ def compute_yearly_depreciation(
         fifteen_year=fifteen_yr_dep,
         bonus=bonus,
         total=total,
+        cost_seg_total=cost_seg_total,
     )
 
 
+def compute_depreciation_schedule(
+    assumptions: DealAssumptions,
+    n_years: int,
+) -> np.ndarray:
+    """Vectorized depreciation schedule for years 1..n_years.
+
+    Returns a float64 array of shape (n_years, 5) with columns
+    (residential, five_year, seven_year, fifteen_year, bonus), each entry
+    rounded to cents. Mirrors compute_yearly_depreciation without the
+    per-year Python loop.
+    """
+    arrays = _MACRS_ARRAYS
+    cost_seg = assumptions.cost_seg
+    bases = _allocate_bases(
+        assumptions.depreciable_basis,
+        (cost_seg.five_year, cost_seg.seven_year, cost_seg.fifteen_year),
+        _bonus_rate(assumptions.placed_in_service_year),
+    )
+    residential_basis, bonus, year1_remaining, later_remaining = bases.float64
+
+    schedule = np.zeros((n_years, 5), dtype=np.float64)
+    if n_years == 0:
+        return schedule
+    month_rates = arrays["residential_27_5"][:, assumptions.placed_in_service_month - 1]
+    schedule[:, 0] = residential_basis * _rates_for_years(month_rates, n_years)
+    for col, macrs_class in enumerate(("5", "7", "15"), start=1):
+        rates = _rates_for_years(arrays[macrs_class], n_years)
+        schedule[0, col] = year1_remaining[col - 1] * rates[0]
+        schedule[1:, col] = later_remaining[col - 1] * rates[1:]
+    schedule[0, 4] = bonus
+    return np.round(schedule, 2)
+
+
 def total_depreciation_taken(
     assumptions: DealAssumptions,
     through_year: int,
 ) -> Decimal:
-    """Sum of all depreciation taken from year 1 through given year."""
-    total = Decimal("0")
-    for y in range(1, through_year + 1):
-        total += compute_yearly_depreciation(assumptions, y).total
-    return total
+    """Sum of all depreciation taken from year 1 through given year.
+
+    Sums the memoized per-year Decimal totals, so it equals the sum of
+    compute_yearly_depreciation(assumptions, y).total to the cent.
+    """
+    cost_seg = assumptions.cost_seg
+    cost_seg_key = (cost_seg.five_year, cost_seg.seven_year, cost_seg.fifteen_year)
+    return sum(
+        (
+            _yearly_depreciation(
+                assumptions.depreciable_basis,
+                cost_seg_key,
+                assumptions.placed_in_service_year,
+                assumptions.placed_in_service_month,
+                y,
+            ).total
+            for y in range(1, through_year + 1)
+        ),
+        Decimal("0"),
+    )
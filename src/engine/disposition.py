@@ -6,13 +6,20 @@ and IRC 469(g)(1)(A) suspended passive loss release.
 Pure functions. No I/O.
 """
 
-from decimal import Decimal, ROUND_HALF_UP
+from decimal import Context, Decimal, ROUND_HALF_UP
+
+import numpy as np
 
 from src.models.assumptions import DealAssumptions
 from src.models.investor import InvestorTaxProfile
 from src.models.results import DispositionResult
 
 TWO_PLACES = Decimal("0.01")
+_ZERO = Decimal(0)
+
+# Cent rounding goes through a preset context so each quantize skips the
+# explicit rounding-mode argument dispatch.
+_CTX = Context(prec=28, rounding=ROUND_HALF_UP)
 
 # Tax rates
 RECAPTURE_RATE = Decimal("0.25")  # IRC 1250 unrecaptured Sec 1250 gain
@@ -38,9 +45,7 @@ def compute_disposition(
         cumulative_suspended_losses: Total passive losses suspended per IRC 469
     """
     # Sale proceeds
-    selling_costs = (sale_price * assumptions.selling_costs_pct).quantize(
-        TWO_PLACES, ROUND_HALF_UP
-    )
+    selling_costs = _CTX.quantize(sale_price * assumptions.selling_costs_pct, TWO_PLACES)
     net_sale_proceeds = sale_price - selling_costs
     gross_equity_proceeds = net_sale_proceeds - loan_balance
 
@@ -50,9 +55,9 @@ def compute_disposition(
 
     if total_gain <= 0:
         # Loss on sale - no tax, but suspended losses still release
-        tax_benefit_from_release = (
-            cumulative_suspended_losses * investor.combined_rate
-        ).quantize(TWO_PLACES, ROUND_HALF_UP)
+        tax_benefit_from_release = _CTX.quantize(
+            cumulative_suspended_losses * investor.combined_rate, TWO_PLACES
+        )
 
         return DispositionResult(
             sale_price=sale_price,
@@ -72,20 +77,6 @@ def compute_disposition(
     depreciation_recapture = min(total_depreciation_taken, total_gain)
     capital_gain = total_gain - depreciation_recapture
 
-    # Tax computations
-    recapture_tax = (depreciation_recapture * RECAPTURE_RATE).quantize(
-        TWO_PLACES, ROUND_HALF_UP
-    )
-    capital_gains_tax = (capital_gain * LTCG_RATE).quantize(TWO_PLACES, ROUND_HALF_UP)
-
-    # NIIT on total gain
-    niit = (total_gain * investor.niit_rate).quantize(TWO_PLACES, ROUND_HALF_UP)
-
-    # State tax on total gain
-    state_tax = (total_gain * investor.marginal_state_rate).quantize(
-        TWO_PLACES, ROUND_HALF_UP
-    )
-
     # IRC 469(g)(1)(A): On full taxable disposition, all suspended passive
     # losses are released. Order of offset:
     # 1. Gain from this activity (reduces taxable gain)
@@ -100,18 +91,35 @@ def compute_disposition(
     gain_offset = min(suspended_losses_released, total_gain)
     remaining_suspended = suspended_losses_released - gain_offset
 
-    # Tax benefit: gain offset saves tax at gain rates,
-    # remaining suspended losses save at ordinary rates
-    benefit_from_gain_offset = (
-        min(gain_offset, depreciation_recapture) * RECAPTURE_RATE
-        + max(Decimal("0"), gain_offset - depreciation_recapture) * LTCG_RATE
-        + gain_offset * investor.niit_rate
-        + gain_offset * investor.marginal_state_rate
-    ).quantize(TWO_PLACES, ROUND_HALF_UP)
-
-    benefit_from_remaining = (
-        remaining_suspended * investor.combined_rate
-    ).quantize(TWO_PLACES, ROUND_HALF_UP)
+    # Investor rates are properties; read each once for the whole pass
+    niit_rate = investor.niit_rate
+    state_rate = investor.marginal_state_rate
+
+    # All tax components in one pass, then rounded to cents together.
+    # Recapture and LTCG on the gain; NIIT and state tax on the total gain;
+    # the gain offset saves tax at gain rates, remaining suspended losses
+    # save at ordinary rates.
+    (
+        recapture_tax,
+        capital_gains_tax,
+        niit,
+        state_tax,
+        benefit_from_gain_offset,
+        benefit_from_remaining,
+    ) = [
+        _CTX.quantize(amount, TWO_PLACES)
+        for amount in (
+            depreciation_recapture * RECAPTURE_RATE,
+            capital_gain * LTCG_RATE,
+            total_gain * niit_rate,
+            total_gain * state_rate,
+            min(gain_offset, depreciation_recapture) * RECAPTURE_RATE
+            + max(_ZERO, gain_offset - depreciation_recapture) * LTCG_RATE
+            + gain_offset * niit_rate
+            + gain_offset * state_rate,
+            remaining_suspended * investor.combined_rate,
+        )
+    ]
 
     tax_benefit_from_release = benefit_from_gain_offset + benefit_from_remaining
 
@@ -137,3 +145,67 @@ def compute_disposition(
         total_tax_on_sale=total_tax,
         after_tax_sale_proceeds=after_tax_proceeds,
     )
+
+
+def compute_disposition_batch(
+    sale_price: np.ndarray,
+    loan_balance: np.ndarray,
+    total_basis: np.ndarray,
+    selling_costs_pct: np.ndarray,
+    total_depreciation_taken: np.ndarray,
+    cumulative_suspended_losses: np.ndarray,
+    investor: InvestorTaxProfile,
+) -> dict[str, np.ndarray]:
+    """Float64 compute_disposition for N sales sharing one investor.
+
+    Arguments are parallel (N,) arrays; components are rounded to cents as
+    in the Decimal version. Keys: gross_equity_proceeds,
+    tax_benefit_from_release, total_tax_on_sale, after_tax_sale_proceeds.
+    """
+    niit_rate = float(investor.niit_rate)
+    state_rate = float(investor.marginal_state_rate)
+    combined_rate = float(investor.combined_rate)
+    recapture_rate = float(RECAPTURE_RATE)
+    ltcg_rate = float(LTCG_RATE)
+
+    selling_costs = np.round(sale_price * selling_costs_pct, 2)
+    net_sale_proceeds = sale_price - selling_costs
+    gross_equity_proceeds = net_sale_proceeds - loan_balance
+    total_gain = net_sale_proceeds - (total_basis - total_depreciation_taken)
+    has_gain = total_gain > 0
+
+    # Taxable sale; rows with a loss are masked out below
+    gain = np.maximum(total_gain, 0.0)
+    depreciation_recapture = np.minimum(total_depreciation_taken, gain)
+    capital_gain = gain - depreciation_recapture
+    gain_offset = np.minimum(cumulative_suspended_losses, gain)
+    remaining_suspended = cumulative_suspended_losses - gain_offset
+
+    tax_on_gain = (
+        np.round(depreciation_recapture * recapture_rate, 2)
+        + np.round(capital_gain * ltcg_rate, 2)
+        + np.round(gain * niit_rate, 2)
+        + np.round(gain * state_rate, 2)
+    )
+    benefit_from_gain_offset = np.round(
+        np.minimum(gain_offset, depreciation_recapture) * recapture_rate
+        + np.maximum(0.0, gain_offset - depreciation_recapture) * ltcg_rate
+        + gain_offset * niit_rate
+        + gain_offset * state_rate,
+        2,
+    )
+    benefit_from_remaining = np.round(remaining_suspended * combined_rate, 2)
+
+    # Loss on sale: no tax, all suspended losses release at ordinary rates
+    loss_benefit = np.round(cumulative_suspended_losses * combined_rate, 2)
+
+    tax_benefit_from_release = np.where(
+        has_gain, benefit_from_gain_offset + benefit_from_remaining, loss_benefit
+    )
+    total_tax = np.where(has_gain, tax_on_gain, 0.0) - tax_benefit_from_release
+    return {
+        "gross_equity_proceeds": gross_equity_proceeds,
+        "tax_benefit_from_release": tax_benefit_from_release,
+        "total_tax_on_sale": total_tax,
+        "after_tax_sale_proceeds": gross_equity_proceeds - total_tax,
+    }
@@ -7,7 +7,13 @@ Each risk factor is a multiplier on the base rate, and contributes to the
 AssumptionManifest tooltip explaining the estimate.
 """
 
+import math
+from bisect import bisect_right
+from collections.abc import Mapping, Sequence
 from decimal import Decimal
+from typing import Literal, TypeVar
+
+import numpy as np
 
 from src.models.smart_assumptions import AssumptionDetail, AssumptionSource, Confidence
 
@@ -22,6 +28,46 @@ _STATE_MULTIPLIERS: dict[str, Decimal] = {
     "AL": Decimal("1.25"), "CA": Decimal("1.30"), "CO": Decimal("1.15"),
     "OK": Decimal("1.25"), "KS": Decimal("1.20"),
 }
+# Same table keyed by common casings so most lookups skip state.upper()
+_STATE_MULTIPLIERS_ALL: dict[str, Decimal] = {
+    key: mult
+    for state, mult in _STATE_MULTIPLIERS.items()
+    for key in (state, state.lower(), state.title())
+}
+
+# Property factors shared by the simple and composite estimators
+# Age: (built before, multiplier, label)
+_AGE_FACTORS: tuple[tuple[int, Decimal, str], ...] = (
+    (1950, Decimal("1.20"), "Pre-1950 building (+20%)"),
+    (1970, Decimal("1.10"), "Pre-1970 building (+10%)"),
+)
+
+# Property type normalization: strip "-" and " " in one C-level pass, then upper()
+_TYPE_STRIP = str.maketrans("", "", "- ")
+_PROP_TYPE_FACTORS: dict[str, tuple[Decimal, str]] = {
+    "MULTIFAMILY": (Decimal("1.15"), "Multi-family (+15%)"),
+    "MULTI": (Decimal("1.15"), "Multi-family (+15%)"),
+    "CONDO": (Decimal("0.80"), "Condo (HOA covers structure, -20%)"),
+}
+
+
+# Age factor lookup: bisect_right over the cutoffs indexes the factor for the
+# first cutoff the build year falls below, or the trailing None
+_AGE_CUTOFFS = tuple(before for before, _, _ in _AGE_FACTORS)
+_AGE_LOOKUP: tuple[tuple[Decimal, str] | None, ...] = (
+    *((m, label) for _, m, label in _AGE_FACTORS),
+    None,
+)
+
+
+def _age_factor(year_built: int) -> tuple[Decimal, str] | None:
+    if not year_built:
+        return None
+    return _AGE_LOOKUP[bisect_right(_AGE_CUTOFFS, year_built)]
+
+
+def _type_factor(property_type: str) -> tuple[Decimal, str] | None:
+    return _PROP_TYPE_FACTORS.get(property_type.translate(_TYPE_STRIP).upper())
 
 
 # ------------------------------------------------------------------
@@ -42,19 +88,14 @@ def estimate_annual_insurance(
     """
     premium = property_value * BASE_RATE
 
-    state_mult = _STATE_MULTIPLIERS.get(state.upper(), Decimal("1.0"))
+    state_mult = _STATE_MULTIPLIERS_ALL.get(state)
+    if state_mult is None:
+        state_mult = _STATE_MULTIPLIERS.get(state.upper(), Decimal("1.0"))
     premium *= state_mult
 
-    if year_built and year_built < 1950:
-        premium *= Decimal("1.20")
-    elif year_built and year_built < 1970:
-        premium *= Decimal("1.10")
-
-    prop_upper = property_type.upper().replace("-", "").replace(" ", "")
-    if prop_upper in ("MULTIFAMILY", "MULTI"):
-        premium *= Decimal("1.15")
-    elif prop_upper == "CONDO":
-        premium *= Decimal("0.80")
+    for factor in (_age_factor(year_built), _type_factor(property_type)):
+        if factor is not None:
+            premium *= factor[0]
 
     if premium < MINIMUM_ANNUAL:
         premium = MINIMUM_ANNUAL
@@ -62,6 +103,29 @@ def estimate_annual_insurance(
     return premium.quantize(Decimal("1"))
 
 
+def estimate_annual_insurance_batch(
+    property_values: np.ndarray,
+    year_built: np.ndarray,
+    states: Sequence[str] | None = None,
+    property_types: Sequence[str] | None = None,
+) -> np.ndarray:
+    """Vectorized estimate_annual_insurance for many properties.
+
+    Arguments are parallel arrays, one entry per property; omitted states
+    default to no state surcharge and omitted types to SFR. Returns
+    whole-dollar float64 premiums, floored at MINIMUM_ANNUAL.
+    """
+    values = np.asarray(property_values, dtype=np.float64)
+    mult = _age_multipliers(np.asarray(year_built, dtype=np.int64))
+    if states is not None:
+        mult = mult * _lookup(_STATE_MULTIPLIERS_F, [s.upper() for s in states])
+    if property_types is not None:
+        mult = mult * _lookup(
+            _PROP_TYPE_MULTIPLIERS_F, [t.translate(_TYPE_STRIP).upper() for t in property_types]
+        )
+    return np.round(np.maximum(values * _BASE_RATE_F * mult, _MINIMUM_ANNUAL_F))
+
+
 # ------------------------------------------------------------------
 # Composite 6-layer hazard model
 # ------------------------------------------------------------------
@@ -75,15 +139,23 @@ FLOOD_MULTIPLIERS: dict[str, Decimal] = {
     "X": Decimal("1.0"), "C": Decimal("1.0"), "D": Decimal("1.0"),
 }
 
-# Earthquake multipliers by PGA threshold
-def _earthquake_multiplier(pga: Decimal | None) -> tuple[Decimal, str]:
+# Risk-level tags returned by the threshold helpers; the label text is only
+# looked up when a non-neutral factor is actually shown in the justification.
+_NO_DATA, _LOW, _MODERATE, _HIGH = range(4)
+_RISK_LABELS = ("no data", "low", "moderate", "high")
+
+# Earthquake multipliers by PGA threshold: (min PGA, multiplier, tag)
+_EQ_TABLE: tuple[tuple[Decimal, float, int], ...] = (
+    (Decimal("0.4"), 1.40, _HIGH),
+    (Decimal("0.2"), 1.20, _MODERATE),
+)
+
+
+def _earthquake_multiplier(pga: Decimal | None) -> tuple[float, int]:
     if pga is None:
-        return Decimal("1.0"), "no data"
-    if pga >= Decimal("0.4"):
-        return Decimal("1.40"), f"high risk (PGA {pga}g)"
-    if pga >= Decimal("0.2"):
-        return Decimal("1.20"), f"moderate risk (PGA {pga}g)"
-    return Decimal("1.0"), f"low risk (PGA {pga}g)"
+        return 1.0, _NO_DATA
+    return next(((m, tag) for t, m, tag in _EQ_TABLE if pga >= t), (1.0, _LOW))
+
 
 # Wildfire multipliers by risk class (1-5)
 WILDFIRE_MULTIPLIERS: dict[int, Decimal] = {
@@ -91,13 +163,17 @@ WILDFIRE_MULTIPLIERS: dict[int, Decimal] = {
     2: Decimal("1.0"), 1: Decimal("1.0"),
 }
 
-# Hurricane/wind multipliers
-def _hurricane_multiplier(zone: int) -> tuple[Decimal, str]:
-    if zone >= 3:
-        return Decimal("1.30"), f"Cat 3+ zone"
-    if zone >= 1:
-        return Decimal("1.15"), f"Cat 1-2 zone"
-    return Decimal("1.0"), "inland"
+# Hurricane/wind multipliers: (min zone, multiplier, tag)
+_HURRICANE_TABLE: tuple[tuple[int, float, int], ...] = (
+    (3, 1.30, _HIGH),
+    (1, 1.15, _MODERATE),
+)
+_HURRICANE_LABELS = ("inland", "inland", "Cat 1-2 zone", "Cat 3+ zone")
+
+
+def _hurricane_multiplier(zone: int) -> tuple[float, int]:
+    return next(((m, tag) for t, m, tag in _HURRICANE_TABLE if zone >= t), (1.0, _LOW))
+
 
 # Hail multipliers
 HAIL_MULTIPLIERS: dict[str, Decimal] = {
@@ -106,16 +182,126 @@ HAIL_MULTIPLIERS: dict[str, Decimal] = {
     "low": Decimal("1.0"),
 }
 
-# Crime/theft multiplier thresholds (property crime per 100K)
-def _crime_multiplier(crime_rate: Decimal | None) -> tuple[Decimal, str]:
+# Crime/theft multiplier thresholds (property crime per 100K, exclusive)
+_CRIME_TABLE: tuple[tuple[float, float, int], ...] = (
+    (3500, 1.15, _HIGH),
+    (2000, 1.05, _MODERATE),
+)
+
+
+def _crime_multiplier(crime_rate: Decimal | None) -> tuple[float, int]:
     if crime_rate is None:
-        return Decimal("1.0"), "no data"
+        return 1.0, _NO_DATA
     rate = float(crime_rate)
-    if rate > 3500:
-        return Decimal("1.15"), f"high property crime ({rate:.0f}/100K)"
-    if rate > 2000:
-        return Decimal("1.05"), f"moderate property crime ({rate:.0f}/100K)"
-    return Decimal("1.0"), f"low property crime ({rate:.0f}/100K)"
+    return next(((m, tag) for t, m, tag in _CRIME_TABLE if rate > t), (1.0, _LOW))
+
+
+# Justification templates per hazard layer, formatted only when shown
+_HAZARD_TEMPLATES = (
+    "Flood zone {fz}",
+    "Seismic {eq} risk (PGA {pga}g)",
+    "Wildfire risk {wf}",
+    "Hurricane {hurr}",
+    "Hail {hail} frequency",
+    "Crime {crime} property crime ({crime_rate:.0f}/100K)",
+)
+
+
+# float64 mirrors of the Decimal tables above — the composite multiplier chain
+# runs in float and only the final premium is converted back to Decimal.
+_BASE_RATE_F = float(BASE_RATE)
+_REPLACEMENT_COST_PCT_F = float(REPLACEMENT_COST_PCT)
+_FLOOD_MULTIPLIERS_F: dict[str, float] = {k: float(v) for k, v in FLOOD_MULTIPLIERS.items()}
+_WILDFIRE_MULTIPLIERS_F: dict[int, float] = {k: float(v) for k, v in WILDFIRE_MULTIPLIERS.items()}
+_HAIL_MULTIPLIERS_F: dict[str, float] = {k: float(v) for k, v in HAIL_MULTIPLIERS.items()}
+_MINIMUM_ANNUAL_F = float(MINIMUM_ANNUAL)
+_ONE_DOLLAR = Decimal("1")
+_STATE_MULTIPLIERS_F: dict[str, float] = {k: float(v) for k, v in _STATE_MULTIPLIERS.items()}
+_PROP_TYPE_MULTIPLIERS_F: dict[str, float] = {
+    k: float(m) for k, (m, _) in _PROP_TYPE_FACTORS.items()
+}
+# Indexed by bisect position in _AGE_CUTOFFS; the last entry is "no factor"
+_AGE_MULTIPLIERS_F = np.array([float(f[0]) if f else 1.0 for f in _AGE_LOOKUP])
+
+
+def _age_multipliers(year_built: np.ndarray) -> np.ndarray:
+    """Per-property age factor; unknown (0) build years get no factor."""
+    idx = np.searchsorted(_AGE_CUTOFFS, year_built, side="right")
+    return np.where(year_built > 0, _AGE_MULTIPLIERS_F[idx], 1.0)
+
+
+def _hazard_multipliers(
+    fz: str,
+    seismic_pga: Decimal | None,
+    wf_risk: int,
+    hurricane_zone: int,
+    hail_frequency: str,
+    crime_rate: Decimal | None,
+) -> tuple[tuple[float, ...], tuple[int, int, int]]:
+    """The 6 hazard multipliers, in _HAZARD_TEMPLATES order (flood,
+    earthquake, wildfire, hurricane/wind, hail, crime/theft), plus the
+    earthquake / hurricane / crime tags used to label them."""
+    eq_mult, eq_tag = _earthquake_multiplier(seismic_pga)
+    hurr_mult, hurr_tag = _hurricane_multiplier(hurricane_zone)
+    crime_mult, crime_tag = _crime_multiplier(crime_rate)
+    hazard_mults = (
+        _FLOOD_MULTIPLIERS_F.get(fz, 1.0),
+        eq_mult,
+        _WILDFIRE_MULTIPLIERS_F.get(wf_risk, 1.0),
+        hurr_mult,
+        _HAIL_MULTIPLIERS_F.get(hail_frequency, 1.0),
+        crime_mult,
+    )
+    return hazard_mults, (eq_tag, hurr_tag, crime_tag)
+
+
+def _property_factors(year_built: int, property_type: str) -> list[tuple[float, str]]:
+    return [
+        (float(m), label)
+        for m, label in filter(None, (_age_factor(year_built), _type_factor(property_type)))
+    ]
+
+
+def _composite_premium(property_value: Decimal, total_multiplier: float) -> Decimal:
+    """Whole-dollar premium: replacement cost x base rate x total multiplier.
+
+    Shared by both composite estimators so they evaluate the same float
+    expression. The product is rounded to 1e-6 first so float noise on an
+    exact half dollar (3139.4999999999995) does not decide the rounding,
+    then quantized to whole dollars half-even, like estimate_annual_insurance.
+    """
+    premium = float(property_value) * _REPLACEMENT_COST_PCT_F * _BASE_RATE_F * total_multiplier
+    return Decimal(repr(round(premium, 6))).quantize(_ONE_DOLLAR)
+
+
+def estimate_insurance_composite_premium_only(
+    property_value: Decimal,
+    year_built: int,
+    property_type: str = "SFR",
+    flood_zone: str | None = None,
+    seismic_pga: Decimal | None = None,
+    wildfire_risk: int | None = None,
+    hurricane_zone: int = 0,
+    hail_frequency: str = "low",
+    crime_rate: Decimal | None = None,
+) -> Decimal:
+    """Premium from estimate_insurance_composite without building the breakdown.
+
+    For callers that discard the AssumptionDetail (sensitivity sweeps,
+    Monte Carlo), this skips all label and justification formatting.
+    """
+    hazard_mults, _ = _hazard_multipliers(
+        (flood_zone or "X").upper(),
+        seismic_pga,
+        wildfire_risk if wildfire_risk is not None else 1,
+        hurricane_zone,
+        hail_frequency,
+        crime_rate,
+    )
+    total_multiplier = math.prod(
+        (*hazard_mults, *(m for m, _ in _property_factors(year_built, property_type)))
+    )
+    return _composite_premium(property_value, total_multiplier)
 
 
 def estimate_insurance_composite(
@@ -134,78 +320,33 @@ def estimate_insurance_composite(
     Returns (premium, AssumptionDetail with full breakdown).
     """
     # Base: 0.35% of replacement cost (80% of market value)
-    replacement_cost = property_value * REPLACEMENT_COST_PCT
-    premium = replacement_cost * BASE_RATE
-
-    components = []
-    total_multiplier = Decimal("1.0")
+    replacement_cost = float(property_value) * _REPLACEMENT_COST_PCT_F
 
-    # 1. Flood
     fz = (flood_zone or "X").upper()
-    flood_mult = FLOOD_MULTIPLIERS.get(fz, Decimal("1.0"))
-    total_multiplier *= flood_mult
-    if flood_mult != Decimal("1.0"):
-        pct = int((float(flood_mult) - 1) * 100)
-        components.append(f"Flood zone {fz} (+{pct}%)")
-
-    # 2. Earthquake
-    eq_mult, eq_desc = _earthquake_multiplier(seismic_pga)
-    total_multiplier *= eq_mult
-    if eq_mult != Decimal("1.0"):
-        pct = int((float(eq_mult) - 1) * 100)
-        components.append(f"Seismic {eq_desc} (+{pct}%)")
-
-    # 3. Wildfire
     wf_risk = wildfire_risk if wildfire_risk is not None else 1
-    wf_mult = WILDFIRE_MULTIPLIERS.get(wf_risk, Decimal("1.0"))
-    total_multiplier *= wf_mult
-    if wf_mult != Decimal("1.0"):
-        pct = int((float(wf_mult) - 1) * 100)
-        components.append(f"Wildfire risk {wf_risk} (+{pct}%)")
-
-    # 4. Hurricane/wind
-    hurr_mult, hurr_desc = _hurricane_multiplier(hurricane_zone)
-    total_multiplier *= hurr_mult
-    if hurr_mult != Decimal("1.0"):
-        pct = int((float(hurr_mult) - 1) * 100)
-        components.append(f"Hurricane {hurr_desc} (+{pct}%)")
-
-    # 5. Hail
-    hail_mult = HAIL_MULTIPLIERS.get(hail_frequency, Decimal("1.0"))
-    total_multiplier *= hail_mult
-    if hail_mult != Decimal("1.0"):
-        pct = int((float(hail_mult) - 1) * 100)
-        components.append(f"Hail {hail_frequency} frequency (+{pct}%)")
-
-    # 6. Crime/theft
-    crime_mult, crime_desc = _crime_multiplier(crime_rate)
-    total_multiplier *= crime_mult
-    if crime_mult != Decimal("1.0"):
-        pct = int((float(crime_mult) - 1) * 100)
-        components.append(f"Crime {crime_desc} (+{pct}%)")
+    hazard_mults, (eq_tag, hurr_tag, crime_tag) = _hazard_multipliers(
+        fz, seismic_pga, wf_risk, hurricane_zone, hail_frequency, crime_rate
+    )
+    property_factors = _property_factors(year_built, property_type)
 
-    # Property factors
-    age_mult = Decimal("1.0")
-    if year_built and year_built < 1950:
-        age_mult = Decimal("1.20")
-        components.append("Pre-1950 building (+20%)")
-    elif year_built and year_built < 1970:
-        age_mult = Decimal("1.10")
-        components.append("Pre-1970 building (+10%)")
-    total_multiplier *= age_mult
-
-    prop_upper = property_type.upper().replace("-", "").replace(" ", "")
-    type_mult = Decimal("1.0")
-    if prop_upper in ("MULTIFAMILY", "MULTI"):
-        type_mult = Decimal("1.15")
-        components.append("Multi-family (+15%)")
-    elif prop_upper == "CONDO":
-        type_mult = Decimal("0.80")
-        components.append("Condo (HOA covers structure, -20%)")
-    total_multiplier *= type_mult
-
-    premium *= total_multiplier
-    premium = premium.quantize(Decimal("1"))
+    total_multiplier = math.prod((*hazard_mults, *(m for m, _ in property_factors)))
+
+    components = []
+    if any(m != 1.0 for m in hazard_mults):
+        fields = {
+            "fz": fz, "eq": _RISK_LABELS[eq_tag], "pga": seismic_pga, "wf": wf_risk,
+            "hurr": _HURRICANE_LABELS[hurr_tag], "hail": hail_frequency,
+            "crime": _RISK_LABELS[crime_tag],
+            "crime_rate": float(crime_rate) if crime_rate is not None else 0.0,
+        }
+        components = [
+            f"{template.format_map(fields)} (+{int((m - 1) * 100)}%)"
+            for m, template in zip(hazard_mults, _HAZARD_TEMPLATES)
+            if m != 1.0
+        ]
+    components += [label for _, label in property_factors]
+
+    premium = _composite_premium(property_value, total_multiplier)
 
     # Determine confidence
     has_hazard_data = any([
@@ -221,10 +362,10 @@ def estimate_insurance_composite(
         source = AssumptionSource.DEFAULT
 
     # Flag very low estimates
-    if premium < Decimal("400"):
+    if premium < 400:
         confidence = Confidence.LOW
 
-    base_str = f"Base: {float(BASE_RATE)*100:.2f}% of replacement cost (${float(replacement_cost):,.0f})"
+    base_str = f"Base: {float(BASE_RATE)*100:.2f}% of replacement cost (${replacement_cost:,.0f})"
     if components:
         risk_str = "; ".join(components)
         justification = f"{base_str}. Risk factors: {risk_str}. Total: ${float(premium):,.0f}/yr"
@@ -244,8 +385,83 @@ def estimate_insurance_composite(
             "hurricane_zone": hurricane_zone,
             "hail_frequency": hail_frequency,
             "crime_rate": float(crime_rate) if crime_rate else None,
-            "total_multiplier": float(total_multiplier),
+            "total_multiplier": round(total_multiplier, 6),
         },
     )
 
     return premium, detail
+
+
+_K = TypeVar("_K")
+
+
+def _lookup(table: Mapping[_K, float], keys: Sequence[_K], default: float = 1.0) -> np.ndarray:
+    return np.fromiter((table.get(k, default) for k in keys), dtype=np.float64, count=len(keys))
+
+
+def _threshold_multipliers(
+    values: np.ndarray,
+    table: tuple[tuple[Decimal | float, float, int], ...],
+    side: Literal["left", "right"],
+) -> np.ndarray:
+    """Batch form of a (threshold, multiplier, tag) table, highest threshold first.
+
+    side="right" mirrors the ">=" tables and side="left" the ">" ones;
+    NaN (no data) and values below every threshold get 1.0.
+    """
+    thresholds = np.array([float(t) for t, _, _ in reversed(table)])
+    multipliers = np.array([1.0, *(m for _, m, _ in reversed(table))])
+    idx = np.searchsorted(thresholds, values, side=side)
+    return np.where(np.isnan(values), 1.0, multipliers[idx])
+
+
+def estimate_insurance_batch(
+    property_values: np.ndarray,
+    year_built: np.ndarray,
+    property_types: Sequence[str] | None = None,
+    flood_zones: Sequence[str | None] | None = None,
+    seismic_pga: np.ndarray | None = None,
+    wildfire_risk: np.ndarray | None = None,
+    hurricane_zone: np.ndarray | None = None,
+    hail_frequency: Sequence[str] | None = None,
+    crime_rate: np.ndarray | None = None,
+) -> np.ndarray:
+    """Vectorized estimate_insurance_composite premiums for many properties.
+
+    Arguments are parallel arrays, one entry per property; omitted hazard
+    arrays mean "no data" for every row. Missing seismic_pga / crime_rate
+    entries are NaN, missing wildfire_risk entries are 0. Returns whole-dollar
+    float64 premiums matching the per-property model.
+    """
+    values = np.asarray(property_values, dtype=np.float64)
+    n = values.shape[0]
+    built = np.asarray(year_built, dtype=np.int64)
+    mult = np.ones(n, dtype=np.float64)
+
+    if flood_zones is not None:
+        mult *= _lookup(_FLOOD_MULTIPLIERS_F, [(z or "X").upper() for z in flood_zones])
+    if seismic_pga is not None:
+        pga = np.asarray(seismic_pga, dtype=np.float64)
+        mult *= _threshold_multipliers(pga, _EQ_TABLE, side="right")
+    if wildfire_risk is not None:
+        wf = np.asarray(wildfire_risk, dtype=np.int64)
+        mult *= _lookup(_WILDFIRE_MULTIPLIERS_F, wf.tolist())
+    if hurricane_zone is not None:
+        hz = np.asarray(hurricane_zone, dtype=np.float64)
+        mult *= _threshold_multipliers(hz, _HURRICANE_TABLE, side="right")
+    if hail_frequency is not None:
+        mult *= _lookup(_HAIL_MULTIPLIERS_F, hail_frequency)
+    if crime_rate is not None:
+        crime = np.asarray(crime_rate, dtype=np.float64)
+        mult *= _threshold_multipliers(crime, _CRIME_TABLE, side="left")
+
+    # Property factors
+    mult *= _age_multipliers(built)
+    if property_types is not None:
+        mult *= _lookup(
+            _PROP_TYPE_MULTIPLIERS_F, [t.translate(_TYPE_STRIP).upper() for t in property_types]
+        )
+
+    # Same expression and half-even rounding as _composite_premium
+    premium = values * _REPLACEMENT_COST_PCT_F * _BASE_RATE_F * mult
+    return np.round(np.round(premium, 6))
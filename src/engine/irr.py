@@ -3,40 +3,163 @@
 Pure functions. No I/O.
 """
 
+import math
+from collections.abc import Sequence
 from decimal import Decimal, ROUND_HALF_UP
 
+import numpy as np
 from scipy.optimize import brentq
 
+from src.engine._jit import HAS_NUMBA, njit
+
 FOUR_PLACES = Decimal("0.0001")
 
 
-def compute_irr(cash_flows: list[Decimal]) -> Decimal:
+@njit(cache=True)
+def _npv(rate: float, cf) -> float:
+    """NPV of cf at rate, discounting incrementally instead of (1+rate)**t.
+
+    cf is a float64 array under numba, or a list of floats in plain Python
+    (iterating a list avoids boxing a numpy scalar per element).
+    """
+    inv = 1.0 / (1.0 + rate)
+    disc = 1.0
+    acc = 0.0
+    for c in cf:
+        acc += c * disc
+        disc *= inv
+    return acc
+
+
+@njit(cache=True)
+def _npv_and_deriv(rate: float, cf) -> tuple[float, float]:
+    """NPV and dNPV/drate in a single discounting sweep."""
+    inv = 1.0 / (1.0 + rate)
+    disc = 1.0
+    npv = 0.0
+    dnpv = 0.0
+    for i, c in enumerate(cf):
+        npv += c * disc
+        dnpv -= i * c * disc * inv
+        disc *= inv
+    return npv, dnpv
+
+
+@njit(cache=True)
+def _newton_irr(cf, x0: float, tol: float, maxiter: int) -> float:
+    """Newton-Raphson on NPV. Returns NaN if it fails to converge in range."""
+    rate = x0
+    for _ in range(maxiter):
+        npv, dnpv = _npv_and_deriv(rate, cf)
+        if dnpv == 0.0:
+            return np.nan
+        step = npv / dnpv
+        rate -= step
+        if rate <= -0.5 or rate >= 10.0:
+            return np.nan
+        if abs(step) < tol:
+            return rate
+    return np.nan
+
+
+def _unique_root_in_range(cf: Sequence[float] | np.ndarray) -> bool:
+    """True when NPV has exactly one root in (-50%, 1000%).
+
+    The endpoints must bracket a root (as brentq requires), and a single
+    sign change in the cash flows limits NPV to at most one root (Descartes'
+    rule), so Newton cannot land on a different root than brentq would.
+    """
+    signs = [c > 0 for c in cf if c != 0]
+    if sum(a != b for a, b in zip(signs, signs[1:])) != 1:
+        return False
+    return bool((_npv(-0.5, cf) > 0) != (_npv(10.0, cf) > 0))
+
+
+def compute_irr(cash_flows: Sequence[Decimal] | np.ndarray) -> Decimal:
     """Compute IRR from a vector of annual cash flows.
 
     cash_flows[0] should be negative (initial investment).
     cash_flows[-1] should include sale proceeds.
+    A float64 array is used as-is; a Decimal sequence is converted once.
 
-    Uses Brent's method on NPV function.
+    Uses Newton-Raphson on NPV with an analytic derivative, which converges
+    in a handful of steps for typical deals. Newton is only tried when the
+    flows have a single sign change and the search range brackets the root;
+    otherwise (and when Newton diverges) Brent's method decides, so flows
+    with several roots or none get the same answer as a plain brentq search.
     """
-    if not cash_flows or len(cash_flows) < 2:
+    if len(cash_flows) < 2:
         return Decimal("0")
 
-    # Convert to float for scipy
-    cf_float = [float(cf) for cf in cash_flows]
+    # Convert to floats once for the NPV kernel
+    if isinstance(cash_flows, np.ndarray):
+        cf = np.asarray(cash_flows, dtype=np.float64)
+        if not HAS_NUMBA:
+            cf = cf.tolist()
+    elif HAS_NUMBA:
+        cf = np.fromiter((float(x) for x in cash_flows), dtype=np.float64, count=len(cash_flows))
+    else:
+        cf = [float(x) for x in cash_flows]
 
-    def npv(rate: float) -> float:
-        return sum(cf / (1 + rate) ** t for t, cf in enumerate(cf_float))
+    if _unique_root_in_range(cf):
+        irr = _newton_irr(cf, 0.08, 1e-10, 50)
+        if not math.isnan(irr):
+            return Decimal(str(irr)).quantize(FOUR_PLACES, ROUND_HALF_UP)
 
-    # Find IRR using Brent's method
+    # Fall back to Brent's method
     # Search between -50% and 1000%
     try:
-        irr = brentq(npv, -0.5, 10.0, xtol=1e-8, maxiter=1000)
+        irr = brentq(_npv, -0.5, 10.0, args=(cf,), xtol=1e-8, maxiter=1000)
         return Decimal(str(irr)).quantize(FOUR_PLACES, ROUND_HALF_UP)
     except ValueError:
         # No IRR found in range (e.g., all-negative cash flows)
         return Decimal("0")
 
 
+def compute_irr_batch(cash_flows: np.ndarray) -> np.ndarray:
+    """IRR for each row of an (N, T) cash-flow matrix, rounded to 4 places.
+
+    Runs Newton-Raphson on all rows at once with a (N, T) discount matrix;
+    rows that fail to converge inside the search range, or whose NPV may
+    have several roots or none there, fall back to compute_irr one at a
+    time. Rows with no IRR in range return 0.
+    """
+    cf = np.asarray(cash_flows, dtype=np.float64)
+    t = np.arange(cf.shape[1], dtype=np.float64)
+    # Same checks as _unique_root_in_range: carry each sign forward over
+    # zero flows, count the changes, and compare NPV at -50% and 1000%
+    signs = np.sign(cf)
+    last_nonzero = np.maximum.accumulate(np.where(signs != 0, np.arange(cf.shape[1]), 0), axis=1)
+    signs = np.take_along_axis(signs, last_nonzero, axis=1)
+    sign_changes = ((signs[:, 1:] != signs[:, :-1]) & (signs[:, :-1] != 0)).sum(axis=1)
+    brackets = (cf @ 2.0**t > 0) != (cf @ 11.0**-t > 0)
+    rate = np.full(cf.shape[0], 0.08)
+    converged = np.zeros(cf.shape[0], dtype=bool)
+    active = np.arange(cf.shape[0])
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for _ in range(50):
+            r = rate[active]
+            rows = cf[active]
+            disc = np.power(1.0 + r[:, None], -t)
+            npv = (rows * disc).sum(axis=1)
+            dnpv = -(t * rows * disc).sum(axis=1) / (1.0 + r)
+            step = npv / dnpv
+            rate[active] = r - step
+            done = np.abs(step) < 1e-10
+            converged[active[done]] = True
+            # Drop converged rows and ones Newton has already thrown out of range
+            r = rate[active]
+            active = active[~done & np.isfinite(r) & (r > -0.5) & (r < 10.0)]
+            if active.size == 0:
+                break
+    in_range = np.isfinite(rate) & (rate > -0.5) & (rate < 10.0)
+    ok = (sign_changes == 1) & brackets & converged & in_range
+    result = np.round(rate, 4)
+    for i in np.flatnonzero(~ok):
+        result[i] = float(compute_irr(cf[i]))
+    return result
+
+
 def compute_equity_multiple(
     total_cash_returned: Decimal, total_cash_invested: Decimal
 ) -> Decimal:
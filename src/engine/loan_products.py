@@ -1,21 +1,41 @@
 """Loan product models: conventional vs DSCR with rate derivation from FRED data."""
 
 from decimal import Decimal
+from functools import lru_cache
 
-from src.models.smart_assumptions import LoanOption, MacroContext
+from src.models.smart_assumptions import CreditTier, LoanOption, MacroContext
 
 DEFAULT_MORTGAGE_RATE = Decimal("0.07")  # Fallback if FRED unavailable
 INVESTOR_PREMIUM = Decimal("0.0075")     # +75bps for investment property
 
+# Credit spread indexed by CreditTier value
+_CREDIT_SPREADS = (Decimal("0"), Decimal("0.0025"), Decimal("0.0075"))
+_CREDIT_TIERS_BY_NAME = {tier.name.lower(): tier for tier in CreditTier}
+
+# DSCR buckets, best first: coverage floors, then (spread, max LTV, points)
+_DSCR_MIN_COVERAGE = (Decimal("1.25"), Decimal("1.0"))
+_DSCR_PARAMS = (
+    (Decimal("0.01"), Decimal("0.80"), Decimal("1")),
+    (Decimal("0.0175"), Decimal("0.75"), Decimal("1.5")),
+    (Decimal("0.025"), Decimal("0.65"), Decimal("2")),
+)
+
 
 def _base_rate(macro: MacroContext) -> Decimal:
     """Get base 30yr rate from FRED, or use fallback."""
     return macro.mortgage_rate_30y if macro.mortgage_rate_30y is not None else DEFAULT_MORTGAGE_RATE
 
 
+def _credit_tier(credit_score_tier: CreditTier | str) -> CreditTier:
+    """Normalize a tier name to CreditTier; unknown names price as excellent."""
+    if isinstance(credit_score_tier, CreditTier):
+        return credit_score_tier
+    return _CREDIT_TIERS_BY_NAME.get(credit_score_tier, CreditTier.EXCELLENT)
+
+
 def conventional_loan(
     macro: MacroContext,
-    credit_score_tier: str = "excellent",
+    credit_score_tier: CreditTier | str = CreditTier.EXCELLENT,
 ) -> LoanOption:
     """Build a conventional investment loan option.
 
@@ -26,14 +46,20 @@ def conventional_loan(
         good (680-719):   +25bps
         fair (660-679):   +75bps
     """
-    base = _base_rate(macro)
+    # The label echoes the caller's tier name, so an unknown name priced as
+    # excellent is not reported as "excellent credit"
+    if isinstance(credit_score_tier, CreditTier):
+        tier_label = credit_score_tier.name.lower()
+    else:
+        tier_label = credit_score_tier
+    return _conventional_loan_cached(
+        _base_rate(macro), _credit_tier(credit_score_tier), tier_label
+    )
+
 
-    credit_spreads = {
-        "excellent": Decimal("0"),
-        "good": Decimal("0.0025"),
-        "fair": Decimal("0.0075"),
-    }
-    credit_adj = credit_spreads.get(credit_score_tier, Decimal("0"))
+@lru_cache(maxsize=256)
+def _conventional_loan_cached(base: Decimal, tier: CreditTier, tier_label: str) -> LoanOption:
+    credit_adj = _CREDIT_SPREADS[tier]
 
     rate = base + INVESTOR_PREMIUM + credit_adj
 
@@ -45,7 +71,7 @@ def conventional_loan(
 
     source = (
         f"FRED 30yr primary rate ({base_pct}) + {inv_pct} investment property premium"
-        f" + {credit_pct} {credit_score_tier} credit = {rate_pct}"
+        f" + {credit_pct} {tier_label} credit = {rate_pct}"
     )
 
     return LoanOption(
@@ -71,20 +97,14 @@ def dscr_loan(
         1.00-1.24: +175bps, 75% LTV
         < 1.00:  +250bps, 65% LTV
     """
-    base = _base_rate(macro)
-
-    if estimated_dscr >= Decimal("1.25"):
-        dscr_spread = Decimal("0.01")
-        ltv = Decimal("0.80")
-        points = Decimal("1")
-    elif estimated_dscr >= Decimal("1.0"):
-        dscr_spread = Decimal("0.0175")
-        ltv = Decimal("0.75")
-        points = Decimal("1.5")
-    else:
-        dscr_spread = Decimal("0.025")
-        ltv = Decimal("0.65")
-        points = Decimal("2")
+    return _dscr_loan_cached(_base_rate(macro), estimated_dscr)
+
+
+@lru_cache(maxsize=256)
+def _dscr_loan_cached(base: Decimal, estimated_dscr: Decimal) -> LoanOption:
+    high, mid = _DSCR_MIN_COVERAGE
+    bucket = 0 if estimated_dscr >= high else 1 if estimated_dscr >= mid else 2
+    dscr_spread, ltv, points = _DSCR_PARAMS[bucket]
 
     rate = base + INVESTOR_PREMIUM + dscr_spread
 
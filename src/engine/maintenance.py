@@ -4,29 +4,38 @@ Factors: property age, condition grade, climate zone, renter density.
 Returns maintenance as a percentage of gross rent.
 """
 
+import datetime
+from bisect import bisect_left
 from decimal import Decimal
+from functools import lru_cache
 
 from src.data.climate import ClimateZone
+from src.models.rehab import ConditionGrade
 from src.models.smart_assumptions import AssumptionDetail, AssumptionSource, Confidence
 
-
-# Base maintenance % by property age
-def _age_base_pct(year_built: int) -> tuple[Decimal, str]:
-    """Older properties need more maintenance."""
-    import datetime
-    age = datetime.date.today().year - year_built if year_built else 30
-
-    if age <= 5:
-        return Decimal("0.03"), f"New build ({age}yr)"
-    if age <= 15:
-        return Decimal("0.04"), f"Modern ({age}yr)"
-    if age <= 30:
-        return Decimal("0.05"), f"Established ({age}yr)"
-    if age <= 50:
-        return Decimal("0.07"), f"Aging ({age}yr)"
-    if age <= 75:
-        return Decimal("0.08"), f"Vintage ({age}yr)"
-    return Decimal("0.10"), f"Historic ({age}yr)"
+# Base maintenance % by property age. Upper bounds are inclusive, so the
+# lookup uses bisect_left: an age equal to a bin edge stays in that bin.
+_AGE_BINS = (5, 15, 30, 50, 75)
+_AGE_TABLE: tuple[tuple[Decimal, str], ...] = (
+    (Decimal("0.03"), "New build"),
+    (Decimal("0.04"), "Modern"),
+    (Decimal("0.05"), "Established"),
+    (Decimal("0.07"), "Aging"),
+    (Decimal("0.08"), "Vintage"),
+    (Decimal("0.10"), "Historic"),
+)
+
+
+@lru_cache(maxsize=256)
+def _age_base_pct(year_built: int, current_year: int) -> tuple[Decimal, str]:
+    """Older properties need more maintenance.
+
+    current_year is part of the cache key so a long-running process does
+    not keep last year's ages after January 1.
+    """
+    age = current_year - year_built if year_built else 30
+    pct, label = _AGE_TABLE[bisect_left(_AGE_BINS, age)]
+    return pct, f"{label} ({age}yr)"
 
 
 # Condition grade multiplier (how well maintained currently)
@@ -49,43 +58,95 @@ CLIMATE_MULTIPLIERS: dict[ClimateZone, tuple[Decimal, str]] = {
     ClimateZone.MARINE: (Decimal("1.0"), "marine climate"),
 }
 
+# Same table keyed by the zone's string value: Enum members hash through a
+# Python-level __hash__, while str keys hash in C
+_CLIMATE_BY_VALUE = {zone.value: entry for zone, entry in CLIMATE_MULTIPLIERS.items()}
+_DEFAULT_CONDITION = (Decimal("1.0"), "unknown condition")
+_DEFAULT_CLIMATE = (Decimal("1.0"), "unknown climate")
+
+# Renter density multiplier: tiers are "renter % above threshold", so the
+# lookup uses bisect_left and a share equal to a threshold stays below it
+_RENTER_THRESHOLDS = (Decimal("0.50"), Decimal("0.70"))
+_RENTER_TIERS: tuple[tuple[Decimal, str | None], ...] = (
+    (Decimal("1.0"), None),
+    (Decimal("1.05"), "moderate"),
+    (Decimal("1.10"), "high"),
+)
+
+
+@lru_cache(maxsize=64)
+def _parse_condition(condition_grade: str) -> str:
+    """Normalize a legacy condition string to its CONDITION_MULTIPLIERS key."""
+    return condition_grade.lower()
+
 
 def estimate_maintenance_pct(
     year_built: int,
-    condition_grade: str = "turnkey",
+    condition_grade: str | ConditionGrade = "turnkey",
     climate_zone: ClimateZone = ClimateZone.MIXED_HUMID,
     renter_pct: Decimal | None = None,
 ) -> tuple[Decimal, AssumptionDetail]:
     """Estimate maintenance as % of gross rent.
 
-    Returns (maintenance_pct, AssumptionDetail with breakdown).
+    condition_grade may be a ConditionGrade or its string value (any case).
+    Returns (maintenance_pct, AssumptionDetail with breakdown). The numbers
+    are memoized; the detail is built fresh on each call because callers
+    keep it in their assumptions manifest and its data_points dict is mutable.
     """
-    base_pct, age_desc = _age_base_pct(year_built)
+    if isinstance(condition_grade, ConditionGrade):
+        condition_grade = condition_grade.value
+        cond_key = condition_grade
+    else:
+        cond_key = _parse_condition(condition_grade)
+    result, confidence, justification = _maintenance_estimate(
+        year_built, datetime.date.today().year, cond_key, climate_zone, renter_pct
+    )
+
+    detail = AssumptionDetail(
+        field_name="maintenance_pct",
+        value=result,
+        source=AssumptionSource.ESTIMATED,
+        confidence=confidence,
+        justification=justification,
+        data_points={
+            "year_built": year_built,
+            "condition_grade": condition_grade,
+            "climate_zone": climate_zone.value,
+            "renter_pct": float(renter_pct) if renter_pct else None,
+        },
+    )
+
+    return result, detail
+
+
+@lru_cache(maxsize=4096)
+def _maintenance_estimate(
+    year_built: int,
+    current_year: int,
+    cond_key: str,
+    climate_zone: ClimateZone,
+    renter_pct: Decimal | None,
+) -> tuple[Decimal, Confidence, str]:
+    """(maintenance_pct, confidence, justification), memoized on the inputs."""
+    base_pct, age_desc = _age_base_pct(year_built, current_year)
     components = [f"Age base: {float(base_pct)*100:.0f}% ({age_desc})"]
 
     # Condition
-    cond_key = condition_grade.lower()
-    cond_mult, cond_desc = CONDITION_MULTIPLIERS.get(
-        cond_key, (Decimal("1.0"), "unknown condition")
-    )
+    cond_mult, cond_desc = CONDITION_MULTIPLIERS.get(cond_key, _DEFAULT_CONDITION)
     components.append(f"Condition: {float(cond_mult):.2f}x ({cond_desc})")
 
     # Climate
-    clim_mult, clim_desc = CLIMATE_MULTIPLIERS.get(
-        climate_zone, (Decimal("1.0"), "unknown climate")
-    )
+    clim_mult, clim_desc = _CLIMATE_BY_VALUE.get(climate_zone.value, _DEFAULT_CLIMATE)
     components.append(f"Climate: {float(clim_mult):.2f}x ({clim_desc})")
 
     # Renter density — high renter areas = more wear
-    renter_mult = Decimal("1.0")
-    renter_desc = "normal"
+    renter_mult, density = _RENTER_TIERS[0]
     if renter_pct is not None:
-        if renter_pct > Decimal("0.70"):
-            renter_mult = Decimal("1.10")
-            renter_desc = f"high renter density ({float(renter_pct)*100:.0f}%)"
-        elif renter_pct > Decimal("0.50"):
-            renter_mult = Decimal("1.05")
-            renter_desc = f"moderate renter density ({float(renter_pct)*100:.0f}%)"
+        renter_mult, density = _RENTER_TIERS[bisect_left(_RENTER_THRESHOLDS, renter_pct)]
+    if density is None:
+        renter_desc = "normal"
+    else:
+        renter_desc = f"{density} renter density ({float(renter_pct)*100:.0f}%)"
     components.append(f"Renter wear: {float(renter_mult):.2f}x ({renter_desc})")
 
     result = base_pct * cond_mult * clim_mult * renter_mult
@@ -96,19 +157,5 @@ def estimate_maintenance_pct(
 
     has_data = renter_pct is not None
     confidence = Confidence.MEDIUM if has_data else Confidence.LOW
-
-    detail = AssumptionDetail(
-        field_name="maintenance_pct",
-        value=result,
-        source=AssumptionSource.ESTIMATED,
-        confidence=confidence,
-        justification=f"Maintenance: {float(result)*100:.1f}% of gross rent. {'; '.join(components)}",
-        data_points={
-            "year_built": year_built,
-            "condition_grade": condition_grade,
-            "climate_zone": climate_zone.value,
-            "renter_pct": float(renter_pct) if renter_pct else None,
-        },
-    )
-
-    return result, detail
+    justification = f"Maintenance: {float(result)*100:.1f}% of gross rent. {'; '.join(components)}"
+    return result, confidence, justification
@@ -9,7 +9,11 @@ Scoring dimensions (0-100 total):
   Natural hazard:   0-10
 """
 
+from bisect import bisect_right
 from decimal import Decimal
+from functools import lru_cache
+
+import numpy as np
 
 from src.models.neighborhood import (
     NeighborhoodDemographics,
@@ -20,75 +24,135 @@ from src.models.neighborhood import (
 
 NATIONAL_MEDIAN_INCOME = 75_000
 
+# Tier tables: score = SCORES[bisect_right(THRESHOLDS, value)], so a value
+# equal to a threshold lands in the tier above it (">=" ladders), and
+# "<" ladders list their cut points in ascending order.
+_INCOME_THRESHOLDS = (35_000, 50_000, 75_000, 100_000)
+_INCOME_SCORES = tuple(Decimal(v) for v in (4, 8, 12, 16, 20))
+
+_POVERTY_THRESHOLDS = (0.05, 0.10, 0.15, 0.25)
+_POVERTY_SCORES = tuple(Decimal(v) for v in (8, 6, 5, 3, 1))
+
+_CRIME_THRESHOLDS = (1000, 1500, 2000, 2500, 3000, 3500)
+_CRIME_SCORES = tuple(Decimal(v) for v in (20, 17, 14, 11, 8, 5, 2))
+
+# Hazard penalties, same indexing
+_FLOOD_PENALTIES = {
+    "V": Decimal("3"), "VE": Decimal("3"),
+    "A": Decimal("2"), "AE": Decimal("2"), "AH": Decimal("2"), "AO": Decimal("2"),
+    "X500": Decimal("1"), "B": Decimal("1"),
+}
+_SEISMIC_THRESHOLDS = (Decimal("0.2"), Decimal("0.4"))
+_WILDFIRE_THRESHOLDS = (3, 4)
+_HURRICANE_THRESHOLDS = (1, 3)
+_TWO_TIER_PENALTIES = (Decimal("0"), Decimal("1"), Decimal("2"))
+
+# Composite score onto letter grade, ">=" cut points
+_GRADE_THRESHOLDS = (30, 45, 65, 80)
+_GRADES = (
+    NeighborhoodGrade.F,
+    NeighborhoodGrade.D,
+    NeighborhoodGrade.C,
+    NeighborhoodGrade.B,
+    NeighborhoodGrade.A,
+)
 
-def _income_score(demographics: NeighborhoodDemographics | None) -> Decimal:
-    """Score 0-20 based on median household income vs national median."""
-    if demographics is None or demographics.median_household_income is None:
-        return Decimal("10")  # neutral
-    income = demographics.median_household_income
-    if income >= 100_000:
-        return Decimal("20")
-    if income >= 75_000:
-        return Decimal("16")
-    if income >= 50_000:
-        return Decimal("12")
-    if income >= 35_000:
-        return Decimal("8")
-    return Decimal("4")
-
-
-def _school_score(schools: list[SchoolInfo]) -> Decimal:
+_ONE_PLACE = Decimal("0.1")
+_SCHOOL_POINTS_PER_RATING = Decimal("2")  # 1-10 rating onto 0-20 points
+_WALK_POINTS_PER_SCORE = Decimal("0.15")  # 0-100 walk score onto 0-15 points
+
+
+def _tier_scores_batch(
+    values: np.ndarray, thresholds: tuple, scores: tuple, neutral: float
+) -> np.ndarray:
+    """Vectorized tier lookup: counts thresholds <= value (the batch form of
+    bisect_right) with one broadcast compare. NaN marks missing data."""
+    values = np.asarray(values, dtype=np.float64)
+    idx = (values[:, None] >= np.asarray(thresholds, dtype=np.float64)).sum(axis=1)
+    return np.where(np.isnan(values), neutral, np.asarray(scores, dtype=np.float64)[idx])
+
+
+def income_scores_batch(median_incomes: np.ndarray) -> np.ndarray:
+    """Income scores (0-20) for many neighborhoods; NaN income scores neutral."""
+    return _tier_scores_batch(median_incomes, _INCOME_THRESHOLDS, _INCOME_SCORES, 10.0)
+
+
+def safety_scores_batch(crime_rates: np.ndarray) -> np.ndarray:
+    """Safety scores (0-20) for many neighborhoods; NaN crime rate scores neutral."""
+    return _tier_scores_batch(crime_rates, _CRIME_THRESHOLDS, _CRIME_SCORES, 10.0)
+
+
+def _school_score(ratings: tuple[int, ...]) -> Decimal:
     """Score 0-20 based on average school rating (1-10 scale)."""
-    if not schools:
+    if not ratings:
         return Decimal("10")  # neutral
-    avg = sum(s.rating for s in schools) / len(schools)
-    return (Decimal(str(avg)) / 10 * 20).quantize(Decimal("0.1"))
+    return (Decimal(sum(ratings)) * _SCHOOL_POINTS_PER_RATING / len(ratings)).quantize(_ONE_PLACE)
+
+
+def school_scores_batch(ratings: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """School scores (0-20) for M neighborhoods from a ragged ratings array.
+
+    ratings concatenates every neighborhood's school ratings; counts[i] is
+    how many belong to neighborhood i. Neighborhoods with no schools get
+    the neutral 10. Float counterpart of _school_score for bulk grading.
+    """
+    ratings = np.asarray(ratings, dtype=np.float64)
+    counts = np.asarray(counts, dtype=np.int64)
+    scores = np.full(counts.shape[0], 10.0)
+    has_schools = counts > 0
+    if has_schools.any():
+        offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))[has_schools]
+        totals = np.add.reduceat(ratings, offsets)
+        scores[has_schools] = np.round(totals * 2 / counts[has_schools], 1)
+    return scores
 
 
 def _walkability_score(walk_score: WalkScoreResult | None) -> Decimal:
     """Score 0-15 based on walk score (0-100)."""
     if walk_score is None or walk_score.walk_score is None:
         return Decimal("7")  # neutral
-    return (Decimal(str(walk_score.walk_score)) / 100 * 15).quantize(Decimal("0.1"))
+    return (walk_score.walk_score * _WALK_POINTS_PER_SCORE).quantize(_ONE_PLACE)
 
 
-def _housing_stability_score(demographics: NeighborhoodDemographics | None) -> Decimal:
-    """Score 0-15 based on poverty rate and renter percentage.
+def _demographics_scores(
+    demographics: NeighborhoodDemographics | None,
+) -> tuple[Decimal, Decimal]:
+    """(income score 0-20, housing stability score 0-15) in one pass.
 
-    Low poverty is good. Moderate renter % (30-60%) is ideal for landlords.
+    Income is median household income vs national median. Stability rewards
+    low poverty and a moderate renter % (30-60% is ideal for landlords).
     """
     if demographics is None:
-        return Decimal("7")  # neutral
+        return Decimal("10"), Decimal("7")  # neutral
+
+    income = demographics.median_household_income
+    poverty_rate = demographics.poverty_rate
+    renter_pct = demographics.renter_pct
+
+    if income is None:
+        income_score = Decimal("10")  # neutral
+    else:
+        income_score = _INCOME_SCORES[bisect_right(_INCOME_THRESHOLDS, income)]
 
-    score = Decimal("0")
+    stability = Decimal("0")
 
     # Poverty component (0-8): lower poverty = higher score
-    if demographics.poverty_rate is not None:
-        pov = float(demographics.poverty_rate)
-        if pov < 0.05:
-            score += Decimal("8")
-        elif pov < 0.10:
-            score += Decimal("6")
-        elif pov < 0.15:
-            score += Decimal("5")
-        elif pov < 0.25:
-            score += Decimal("3")
-        else:
-            score += Decimal("1")
+    if poverty_rate is not None:
+        stability += _POVERTY_SCORES[bisect_right(_POVERTY_THRESHOLDS, float(poverty_rate))]
 
     # Renter % component (0-7): moderate renter % best for landlords
-    if demographics.renter_pct is not None:
-        rp = float(demographics.renter_pct)
+    if renter_pct is not None:
+        rp = float(renter_pct)
         if 0.30 <= rp <= 0.60:
-            score += Decimal("7")  # sweet spot
+            stability += Decimal("7")  # sweet spot
         elif 0.20 <= rp < 0.30 or 0.60 < rp <= 0.70:
-            score += Decimal("5")
+            stability += Decimal("5")
         elif rp < 0.20:
-            score += Decimal("3")  # very owner-heavy
+            stability += Decimal("3")  # very owner-heavy
         else:
-            score += Decimal("2")  # very renter-heavy
+            stability += Decimal("2")  # very renter-heavy
 
-    return score
+    return income_score, stability
 
 
 def _safety_score(crime_rate: Decimal | None) -> Decimal:
@@ -100,20 +164,7 @@ def _safety_score(crime_rate: Decimal | None) -> Decimal:
     if crime_rate is None:
         return Decimal("10")  # neutral
 
-    rate = float(crime_rate)
-    if rate < 1000:
-        return Decimal("20")
-    if rate < 1500:
-        return Decimal("17")
-    if rate < 2000:
-        return Decimal("14")
-    if rate < 2500:
-        return Decimal("11")
-    if rate < 3000:
-        return Decimal("8")
-    if rate < 3500:
-        return Decimal("5")
-    return Decimal("2")
+    return _CRIME_SCORES[bisect_right(_CRIME_THRESHOLDS, float(crime_rate))]
 
 
 def _hazard_score(
@@ -128,37 +179,30 @@ def _hazard_score(
     Each hazard contributes a penalty. Start at 10, subtract.
     """
     score = Decimal("10")
+    if (
+        not flood_zone
+        and seismic_pga is None
+        and wildfire_risk is None
+        and hurricane_zone is None
+        and hail_frequency is None
+    ):
+        return score
 
     # Flood penalty
     if flood_zone:
-        fz = flood_zone.upper()
-        if fz in ("V", "VE"):
-            score -= Decimal("3")
-        elif fz in ("A", "AE", "AH", "AO"):
-            score -= Decimal("2")
-        elif fz in ("X500", "B"):
-            score -= Decimal("1")
+        score -= _FLOOD_PENALTIES.get(flood_zone.upper(), Decimal("0"))
 
     # Seismic penalty
     if seismic_pga is not None:
-        if seismic_pga >= Decimal("0.4"):
-            score -= Decimal("2")
-        elif seismic_pga >= Decimal("0.2"):
-            score -= Decimal("1")
+        score -= _TWO_TIER_PENALTIES[bisect_right(_SEISMIC_THRESHOLDS, seismic_pga)]
 
     # Wildfire penalty
     if wildfire_risk is not None:
-        if wildfire_risk >= 4:
-            score -= Decimal("2")
-        elif wildfire_risk >= 3:
-            score -= Decimal("1")
+        score -= _TWO_TIER_PENALTIES[bisect_right(_WILDFIRE_THRESHOLDS, wildfire_risk)]
 
     # Hurricane penalty
     if hurricane_zone is not None:
-        if hurricane_zone >= 3:
-            score -= Decimal("2")
-        elif hurricane_zone >= 1:
-            score -= Decimal("1")
+        score -= _TWO_TIER_PENALTIES[bisect_right(_HURRICANE_THRESHOLDS, hurricane_zone)]
 
     # Hail penalty
     if hail_frequency == "high":
@@ -177,31 +221,46 @@ def compute_neighborhood_grade(
     wildfire_risk: int | None = None,
     hurricane_zone: int | None = None,
     hail_frequency: str | None = None,
+    school_ratings: np.ndarray | None = None,
 ) -> tuple[NeighborhoodGrade, Decimal]:
     """Compute a composite neighborhood grade from available data.
 
-    Returns (grade, score) where score is 0-100.
+    school_ratings optionally supplies the schools' ratings as an array
+    (used instead of iterating schools). Returns (grade, score) where
+    score is 0-100. Results are memoized on the inputs; only the schools'
+    ratings take part in the key.
     """
+    if school_ratings is not None:
+        ratings = tuple(school_ratings.tolist())
+    else:
+        ratings = tuple(s.rating for s in schools)
+    return _grade_from_inputs(
+        demographics, walk_score, ratings, crime_rate, flood_zone,
+        seismic_pga, wildfire_risk, hurricane_zone, hail_frequency,
+    )
+
+
+@lru_cache(maxsize=4096)
+def _grade_from_inputs(
+    demographics: NeighborhoodDemographics | None,
+    walk_score: WalkScoreResult | None,
+    school_ratings: tuple[int, ...],
+    crime_rate: Decimal | None,
+    flood_zone: str | None,
+    seismic_pga: Decimal | None,
+    wildfire_risk: int | None,
+    hurricane_zone: int | None,
+    hail_frequency: str | None,
+) -> tuple[NeighborhoodGrade, Decimal]:
+    income_score, stability_score = _demographics_scores(demographics)
     total = (
-        _income_score(demographics)
-        + _school_score(schools)
+        income_score
+        + _school_score(school_ratings)
         + _walkability_score(walk_score)
-        + _housing_stability_score(demographics)
+        + stability_score
         + _safety_score(crime_rate)
         + _hazard_score(flood_zone, seismic_pga, wildfire_risk, hurricane_zone, hail_frequency)
     )
 
-    total = total.quantize(Decimal("0.1"))
-
-    if total >= 80:
-        grade = NeighborhoodGrade.A
-    elif total >= 65:
-        grade = NeighborhoodGrade.B
-    elif total >= 45:
-        grade = NeighborhoodGrade.C
-    elif total >= 30:
-        grade = NeighborhoodGrade.D
-    else:
-        grade = NeighborhoodGrade.F
-
-    return grade, total
+    total = total.quantize(_ONE_PLACE)
+    return _GRADES[bisect_right(_GRADE_THRESHOLDS, total)], total
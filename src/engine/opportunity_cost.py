@@ -7,6 +7,8 @@ from dataclasses import dataclass
 from decimal import Decimal, ROUND_HALF_UP
 import math
 
+import numpy as np
+
 from src.models.results import EquityComparison
 
 TWO_PLACES = Decimal("0.01")
@@ -20,6 +22,8 @@ DEFAULT_RISK_FREE_RATE = Decimal("0.04")  # 10-year treasury proxy
 LTCG_RATE = Decimal("0.20")
 NIIT_RATE = Decimal("0.038")
 
+_ZERO = Decimal(0)
+
 
 def sp500_equity_curve(
     initial_investment: Decimal,
@@ -30,14 +34,35 @@ def sp500_equity_curve(
 
     Returns list of length hold_years + 1 (year 0 = initial).
     """
+    # Compound the growth factor exactly and round each year's value once,
+    # rather than compounding already-rounded balances
     curve = [initial_investment]
-    value = initial_investment
+    step = 1 + annual_return
+    growth = Decimal("1")
     for _ in range(hold_years):
-        value = (value * (1 + annual_return)).quantize(TWO_PLACES, ROUND_HALF_UP)
-        curve.append(value)
+        growth *= step
+        curve.append((initial_investment * growth).quantize(TWO_PLACES, ROUND_HALF_UP))
     return curve
 
 
+def sp500_equity_curves(
+    initial_investment: np.ndarray,
+    hold_years: int,
+    annual_return: float | np.ndarray = float(DEFAULT_SP500_ANNUAL_RETURN),
+) -> np.ndarray:
+    """sp500_equity_curve for N starting amounts (and optionally N returns).
+
+    Returns a float64 (N, hold_years + 1) array rounded to cents; column 0
+    is the initial investment.
+    """
+    initial = np.asarray(initial_investment, dtype=np.float64)[:, None]
+    rate = np.asarray(annual_return, dtype=np.float64)
+    if rate.ndim:
+        rate = rate[:, None]
+    growth = np.power(1.0 + rate, np.arange(hold_years + 1, dtype=np.float64))
+    return np.round(initial * growth, 2)
+
+
 def sp500_after_tax_proceeds(
     initial_investment: Decimal,
     final_value: Decimal,
@@ -53,12 +78,54 @@ def sp500_after_tax_proceeds(
         return final_value
 
     federal_tax = (gain * LTCG_RATE).quantize(TWO_PLACES, ROUND_HALF_UP)
-    niit = (gain * NIIT_RATE).quantize(TWO_PLACES, ROUND_HALF_UP) if niit_applies else Decimal("0")
+    niit = (gain * NIIT_RATE).quantize(TWO_PLACES, ROUND_HALF_UP) if niit_applies else _ZERO
     state_tax = (gain * state_tax_rate).quantize(TWO_PLACES, ROUND_HALF_UP)
 
     return final_value - federal_tax - niit - state_tax
 
 
+def sp500_after_tax_proceeds_batch(
+    initial_investment: float | np.ndarray,
+    final_value: np.ndarray,
+    state_tax_rate: float | np.ndarray,
+    niit_applies: bool = True,
+) -> np.ndarray:
+    """sp500_after_tax_proceeds over an array of final values, as float64.
+
+    Broadcasts, so a whole equity curve (or an (N, T) block of curves with
+    (N, 1) initial amounts) converts in one pass. Each tax is rounded to
+    cents separately, as in the scalar version; values at or below the
+    initial investment pass through untaxed.
+    """
+    initial = np.asarray(initial_investment, dtype=np.float64)
+    final = np.asarray(final_value, dtype=np.float64)
+    gain = np.maximum(final - initial, 0.0)
+    tax = np.round(gain * float(LTCG_RATE), 2) + np.round(gain * np.asarray(state_tax_rate), 2)
+    if niit_applies:
+        tax += np.round(gain * float(NIIT_RATE), 2)
+    return final - tax
+
+
+def sp500_after_tax_irr_batch(
+    initial_equity: np.ndarray,
+    sp500_after_tax: np.ndarray,
+    hold_years: int,
+) -> np.ndarray:
+    """S&P 500 after-tax CAGR for N scenarios, rounded to 4 places.
+
+    Vectorized form of the IRR step in build_comparison: one np.power call
+    over all ratios. Scenarios with no initial equity (or no hold) get 0.
+    """
+    initial = np.asarray(initial_equity, dtype=np.float64)
+    proceeds = np.asarray(sp500_after_tax, dtype=np.float64)
+    if hold_years <= 0:
+        return np.zeros_like(initial)
+    funded = initial > 0
+    ratio = np.divide(proceeds, initial, out=np.ones_like(initial), where=funded)
+    irr = np.power(ratio, 1.0 / hold_years) - 1
+    return np.where(funded, np.round(irr, 4), 0.0)
+
+
 def sharpe_ratio(
     annual_return: Decimal,
     volatility: Decimal,
@@ -66,7 +133,7 @@ def sharpe_ratio(
 ) -> Decimal:
     """Sharpe ratio = (return - risk_free) / volatility."""
     if volatility == 0:
-        return Decimal("0")
+        return _ZERO
     return ((annual_return - risk_free_rate) / volatility).quantize(
         FOUR_PLACES, ROUND_HALF_UP
     )
@@ -99,13 +166,13 @@ def build_comparison(
             FOUR_PLACES, ROUND_HALF_UP
         )
     else:
-        sp500_irr = Decimal("0")
+        sp500_irr = _ZERO
 
     re_total_return = (
-        (re_total_cash_returned / initial_equity - 1) if initial_equity > 0 else Decimal("0")
+        (re_total_cash_returned / initial_equity - 1) if initial_equity > 0 else _ZERO
     )
     sp500_total_return = (
-        (sp500_after_tax / initial_equity - 1) if initial_equity > 0 else Decimal("0")
+        (sp500_after_tax / initial_equity - 1) if initial_equity > 0 else _ZERO
     )
 
     re_annualized = re_after_tax_irr
@@ -118,8 +185,8 @@ def build_comparison(
         sp500_yearly_equity=sp500_curve,
         re_after_tax_irr=re_after_tax_irr,
         sp500_after_tax_irr=sp500_irr,
-        re_total_return=Decimal(str(re_total_return)).quantize(FOUR_PLACES, ROUND_HALF_UP),
-        sp500_total_return=Decimal(str(sp500_total_return)).quantize(FOUR_PLACES, ROUND_HALF_UP),
+        re_total_return=re_total_return.quantize(FOUR_PLACES, ROUND_HALF_UP),
+        sp500_total_return=sp500_total_return.quantize(FOUR_PLACES, ROUND_HALF_UP),
         re_volatility=re_volatility,
         sp500_volatility=sp500_volatility,
         re_sharpe=sharpe_ratio(re_annualized, re_volatility, risk_free_rate),
@@ -3,31 +3,45 @@
 Pure computation. No I/O. Dataclasses in, AnalysisResult out.
 """
 
+import multiprocessing
+import os
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from decimal import Decimal, ROUND_HALF_UP
+from functools import partial
+
+import numpy as np
 
 from src.models.assumptions import DealAssumptions
 from src.models.investor import InvestorTaxProfile
 from src.models.results import AnalysisResult, YearlyProjection, DispositionResult
 
-from src.engine.debt import amortization_schedule, yearly_debt_summary
+from src.engine.debt import yearly_debt_for_loan, yearly_debt_arrays
 from src.engine.cashflow import (
     gross_rent,
-    effective_gross_income,
-    operating_expenses,
-    noi,
-    cap_rate,
+    effective_gross_income_from_rent,
+    operating_expenses_from_rent,
+    cap_rate_from_noi,
     cash_on_cash,
     dscr,
     property_value,
+    build_proforma_arrays,
+    build_proforma_arrays_batch,
+)
+from src.engine.depreciation import (
+    compute_yearly_depreciation,
+    compute_depreciation_schedule,
+    total_depreciation_taken,
 )
-from src.engine.depreciation import compute_yearly_depreciation, total_depreciation_taken
 from src.engine.tax import (
     taxable_rental_income,
     compute_passive_activity,
+    passive_tax_benefits,
+    passive_tax_benefits_batch,
     PassiveActivityLedger,
 )
-from src.engine.disposition import compute_disposition
-from src.engine.irr import compute_irr, compute_equity_multiple
+from src.engine.disposition import compute_disposition, compute_disposition_batch
+from src.engine.irr import compute_irr, compute_irr_batch, compute_equity_multiple
 
 TWO_PLACES = Decimal("0.01")
 FOUR_PLACES = Decimal("0.0001")
@@ -42,14 +56,21 @@ def run_proforma(
     Returns AnalysisResult with yearly projections, disposition analysis,
     and summary metrics.
     """
-    # Build amortization schedule
-    amort = amortization_schedule(
-        principal=assumptions.loan_amount,
-        annual_rate=assumptions.interest_rate,
-        term_years=assumptions.loan_term_years,
-        hold_years=assumptions.hold_years,
+    # Yearly debt service from the (memoized) amortization schedule
+    yearly_debt = yearly_debt_for_loan(
+        assumptions.loan_amount,
+        assumptions.interest_rate,
+        assumptions.loan_term_years,
+        assumptions.hold_years,
     )
-    yearly_debt = yearly_debt_summary(amort)
+
+    # Loop invariants, read once: total_initial_investment is a computed
+    # property, and the rest are attribute loads the year loop would repeat
+    initial_investment = assumptions.total_initial_investment
+    purchase_price = assumptions.purchase_price
+    other_income = assumptions.other_income
+    rehab_months = assumptions.rehab_budget.rehab_months
+    year1_rent_months = 12 - min(rehab_months, 12) if rehab_months > 0 else 12
 
     # Build yearly projections
     projections: list[YearlyProjection] = []
@@ -57,24 +78,27 @@ def run_proforma(
     prior_suspended = Decimal("0")
     total_dep = Decimal("0")
     total_tax_benefit = Decimal("0")
+    total_cfat = Decimal("0")
+    total_coc = Decimal("0")
 
-    before_tax_cfs: list[Decimal] = [-assumptions.total_initial_investment]
-    after_tax_cfs: list[Decimal] = [-assumptions.total_initial_investment]
+    before_tax_cfs: list[Decimal] = [-initial_investment]
+    after_tax_cfs: list[Decimal] = [-initial_investment]
 
     for year in range(1, assumptions.hold_years + 1):
         debt_year = yearly_debt[year - 1]
         annual_debt_service = debt_year["debt_service"]
 
-        # Income
+        # Income: gross rent is computed once and threaded through the
+        # EGI / expense / NOI helpers rather than re-derived by each
         gr = gross_rent(assumptions, year)
-        egi = effective_gross_income(assumptions, year)
-        vacancy_loss = gr - egi + assumptions.other_income
+        egi = effective_gross_income_from_rent(assumptions, gr)
+        vacancy_loss = gr - egi + other_income
 
         # Expenses
-        expenses = operating_expenses(assumptions, year)
+        expenses = operating_expenses_from_rent(assumptions, year, gr)
 
         # NOI & cash flow
-        year_noi = noi(assumptions, year)
+        year_noi = egi - expenses["total"]
         cfbt = year_noi - annual_debt_service
 
         # Depreciation
@@ -95,7 +119,7 @@ def run_proforma(
             prior_suspended=prior_suspended,
             year=year,
         )
-        passive_ledger.entries.append(pa_entry)
+        passive_ledger.append(pa_entry)
         prior_suspended = pa_entry.cumulative_suspended
         total_tax_benefit += pa_entry.tax_benefit
 
@@ -107,21 +131,18 @@ def run_proforma(
         equity = prop_value - debt_year["ending_balance"]
 
         # Metrics
-        year_cap_rate = cap_rate(assumptions, year)
-        year_coc = cash_on_cash(cfbt, assumptions.total_initial_investment)
+        year_cap_rate = cap_rate_from_noi(year_noi, purchase_price)
+        year_coc = cash_on_cash(cfbt, initial_investment)
         year_dscr = dscr(year_noi, annual_debt_service)
 
-        # Rehab: compute rent months for year 1
-        if year == 1 and assumptions.rehab_budget.rehab_months > 0:
-            rent_months = 12 - min(assumptions.rehab_budget.rehab_months, 12)
-        else:
-            rent_months = 12
+        # Rehab: only year 1 loses rent months
+        rent_months = year1_rent_months if year == 1 else 12
 
         proj = YearlyProjection(
             year=year,
             gross_rent=gr,
             vacancy_loss=vacancy_loss,
-            other_income=assumptions.other_income,
+            other_income=other_income,
             effective_gross_income=egi,
             property_tax=expenses["property_tax"],
             insurance=expenses["insurance"],
@@ -137,7 +158,7 @@ def run_proforma(
             interest_paid=debt_year["interest"],
             loan_balance=debt_year["ending_balance"],
             depreciation_27_5=dep.residential,
-            depreciation_cost_seg=dep.five_year + dep.seven_year + dep.fifteen_year + dep.bonus,
+            depreciation_cost_seg=dep.cost_seg_total,
             total_depreciation=dep.total,
             taxable_income=taxable,
             passive_loss=pa_entry.rental_income_or_loss,
@@ -154,10 +175,12 @@ def run_proforma(
         projections.append(proj)
         before_tax_cfs.append(cfbt)
         after_tax_cfs.append(cfat)
+        total_cfat += cfat
+        total_coc += year_coc
 
     # Disposition
     final_year = assumptions.hold_years
-    sale_price = property_value(assumptions, final_year)
+    sale_price = projections[-1].property_value
     loan_balance = yearly_debt[final_year - 1]["ending_balance"]
 
     disposition = compute_disposition(
@@ -178,15 +201,13 @@ def run_proforma(
     after_tax_irr = compute_irr(after_tax_cfs)
 
     # Total cash returned (for equity multiple)
-    total_cfbt = sum(p.cash_flow_before_tax for p in projections)
-    total_cfat = sum(p.cash_flow_after_tax for p in projections)
     total_cash_returned = total_cfat + disposition.after_tax_sale_proceeds
     equity_multiple = compute_equity_multiple(
-        total_cash_returned, assumptions.total_initial_investment
+        total_cash_returned, initial_investment
     )
 
     # Average cash on cash
-    avg_coc = sum(p.cash_on_cash for p in projections) / len(projections) if projections else Decimal("0")
+    avg_coc = total_coc / len(projections) if projections else Decimal("0")
 
     # Net tax impact
     net_tax_impact = (
@@ -199,16 +220,268 @@ def run_proforma(
     return AnalysisResult(
         yearly_projections=projections,
         disposition=disposition,
-        total_initial_investment=assumptions.total_initial_investment,
+        total_initial_investment=initial_investment,
         rehab_total_cost=assumptions.rehab_budget.total_cost,
-        rehab_months=assumptions.rehab_budget.rehab_months,
+        rehab_months=rehab_months,
         before_tax_irr=before_tax_irr,
         after_tax_irr=after_tax_irr,
         equity_multiple=equity_multiple,
         average_cash_on_cash=avg_coc.quantize(FOUR_PLACES, ROUND_HALF_UP),
-        total_profit=total_cash_returned - assumptions.total_initial_investment,
+        total_cash_returned=total_cash_returned,
+        total_profit=total_cash_returned - initial_investment,
         total_depreciation_taken=total_dep,
         total_tax_benefit_operations=total_tax_benefit,
         total_suspended_losses=prior_suspended,
         net_tax_impact=net_tax_impact,
     )
+
+
+def _to_decimals(values: np.ndarray, places: int = 2) -> list[Decimal]:
+    """Round a float column to `places` decimals and convert it to Decimal.
+
+    Scaling to integers first and shifting the exponent back is much cheaper
+    than a Decimal(str(...)).quantize round trip per value.
+    """
+    scaled = np.rint(np.asarray(values, dtype=np.float64) * 10**places).astype(np.int64)
+    return [Decimal(v).scaleb(-places) for v in scaled.tolist()]
+
+
+def _ratios(numerator: np.ndarray, denominator: np.ndarray | float) -> list[Decimal]:
+    """numerator / denominator to four places; zero where the denominator is 0."""
+    denominator = np.broadcast_to(np.asarray(denominator, dtype=np.float64), numerator.shape)
+    safe = np.where(denominator == 0, 1.0, denominator)
+    return _to_decimals(np.where(denominator == 0, 0.0, numerator / safe), 4)
+
+
+def run_proforma_fast(
+    assumptions: DealAssumptions,
+    investor: InvestorTaxProfile,
+) -> AnalysisResult:
+    """float64 variant of run_proforma for scenario sweeps and Monte Carlo.
+
+    The per-year income, debt, depreciation, and passive-activity math runs
+    on floats; values become Decimal only when building YearlyProjection.
+    Income and expense lines agree with run_proforma to within a few cents.
+    Loan balance, debt service and the cash flows built from them follow
+    yearly_debt_arrays: they drift by tens of cents on typical holds and by
+    up to about $1.20 on full 30-year terms. Use run_proforma for anything
+    user-facing.
+    """
+    hold_years = assumptions.hold_years
+    arrays = build_proforma_arrays(assumptions, hold_years)
+    debt = yearly_debt_arrays(
+        float(assumptions.loan_amount),
+        float(assumptions.interest_rate),
+        assumptions.loan_term_years,
+        hold_years,
+    )
+    dep = compute_depreciation_schedule(assumptions, hold_years)
+    dep_total = dep.sum(axis=1)
+
+    noi_arr = arrays["noi"]
+    cfbt = noi_arr - debt["debt_service"]
+    taxable = noi_arr - debt["interest"] - dep_total
+    tax_benefits, suspended = passive_tax_benefits(taxable.tolist(), investor)
+    tax_benefits_arr = np.array(tax_benefits)
+
+    initial_investment = assumptions.total_initial_investment
+    other_income = assumptions.other_income
+
+    columns = {
+        "gross_rent": _to_decimals(arrays["gross_rent"]),
+        "vacancy_loss": [
+            v + other_income
+            for v in _to_decimals(arrays["gross_rent"] - arrays["effective_gross_income"])
+        ],
+        "effective_gross_income": _to_decimals(arrays["effective_gross_income"]),
+        "property_tax": _to_decimals(arrays["property_tax"]),
+        "insurance": _to_decimals(arrays["insurance"]),
+        "maintenance": _to_decimals(arrays["maintenance"]),
+        "management": _to_decimals(arrays["management"]),
+        "capex_reserve": _to_decimals(arrays["capex_reserve"]),
+        "hoa": _to_decimals(arrays["hoa"]),
+        "total_expenses": _to_decimals(arrays["total_expenses"]),
+        "noi": _to_decimals(noi_arr),
+        "debt_service": _to_decimals(debt["debt_service"]),
+        "cash_flow_before_tax": _to_decimals(cfbt),
+        "principal_paid": _to_decimals(debt["principal"]),
+        "interest_paid": _to_decimals(debt["interest"]),
+        "loan_balance": _to_decimals(debt["ending_balance"]),
+        "depreciation_27_5": _to_decimals(dep[:, 0]),
+        "depreciation_cost_seg": _to_decimals(dep[:, 1:].sum(axis=1)),
+        "total_depreciation": _to_decimals(dep_total),
+        "taxable_income": _to_decimals(taxable),
+        "suspended_loss": _to_decimals(np.array(suspended)),
+        "tax_benefit": _to_decimals(tax_benefits_arr),
+        "cash_flow_after_tax": _to_decimals(cfbt + tax_benefits_arr),
+        "property_value": _to_decimals(arrays["property_value"]),
+        "equity": _to_decimals(arrays["property_value"] - debt["ending_balance"]),
+        "cap_rate": _ratios(noi_arr, float(assumptions.purchase_price)),
+        "cash_on_cash": _ratios(cfbt, float(initial_investment)),
+        "dscr": _ratios(noi_arr, debt["debt_service"]),
+    }
+    rehab_months = assumptions.rehab_budget.rehab_months
+    year1_rent_months = 12 - min(rehab_months, 12) if rehab_months > 0 else 12
+
+    projections = [
+        YearlyProjection(
+            year=i + 1,
+            other_income=other_income,
+            passive_loss=columns["taxable_income"][i],
+            rent_months=year1_rent_months if i == 0 else 12,
+            **{name: values[i] for name, values in columns.items()},
+        )
+        for i in range(hold_years)
+    ]
+
+    # Disposition runs once per deal, so it stays on the exact Decimal path
+    total_dep = _to_decimals(dep_total.sum(keepdims=True))[0]
+    final = projections[-1]
+    disposition = compute_disposition(
+        assumptions=assumptions,
+        investor=investor,
+        sale_price=final.property_value,
+        loan_balance=final.loan_balance,
+        total_depreciation_taken=total_dep,
+        cumulative_suspended_losses=final.suspended_loss,
+    )
+
+    before_tax_cfs = [-initial_investment, *columns["cash_flow_before_tax"]]
+    after_tax_cfs = [-initial_investment, *columns["cash_flow_after_tax"]]
+    before_tax_cfs[-1] += disposition.gross_equity_proceeds
+    after_tax_cfs[-1] += disposition.after_tax_sale_proceeds
+
+    total_tax_benefit = sum(columns["tax_benefit"], Decimal("0"))
+    total_cash_returned = (
+        sum(columns["cash_flow_after_tax"], Decimal("0")) + disposition.after_tax_sale_proceeds
+    )
+    avg_coc = sum(columns["cash_on_cash"], Decimal("0")) / hold_years
+    net_tax_impact = (
+        total_tax_benefit
+        + disposition.tax_benefit_from_release
+        - (disposition.recapture_tax + disposition.capital_gains_tax
+           + disposition.niit_on_gain + disposition.state_tax_on_gain)
+    )
+
+    return AnalysisResult(
+        yearly_projections=projections,
+        disposition=disposition,
+        total_initial_investment=initial_investment,
+        rehab_total_cost=assumptions.rehab_budget.total_cost,
+        rehab_months=rehab_months,
+        before_tax_irr=compute_irr(before_tax_cfs),
+        after_tax_irr=compute_irr(after_tax_cfs),
+        equity_multiple=compute_equity_multiple(total_cash_returned, initial_investment),
+        average_cash_on_cash=avg_coc.quantize(FOUR_PLACES, ROUND_HALF_UP),
+        total_cash_returned=total_cash_returned,
+        total_profit=total_cash_returned - initial_investment,
+        total_depreciation_taken=total_dep,
+        total_tax_benefit_operations=total_tax_benefit,
+        total_suspended_losses=final.suspended_loss,
+        net_tax_impact=net_tax_impact,
+    )
+
+
+def run_proforma_batch(
+    scenarios: Sequence[DealAssumptions],
+    investor: InvestorTaxProfile,
+) -> dict[str, np.ndarray]:
+    """Vectorized pro forma for N scenarios sharing one investor.
+
+    Every scenario must use the same hold period. Per-year outputs are
+    (N, hold_years) float64 arrays; per-deal outputs are (N,). Intended for
+    sensitivity analysis and Monte Carlo; figures track run_proforma to
+    within cents per line item.
+
+    Keys: noi, debt_service, cash_flow_before_tax, total_depreciation,
+    tax_benefit, cash_flow_after_tax, loan_balance, property_value,
+    suspended_loss, after_tax_sale_proceeds, before_tax_irr, after_tax_irr,
+    equity_multiple.
+    """
+    hold_years = scenarios[0].hold_years
+    if any(s.hold_years != hold_years for s in scenarios):
+        raise ValueError("run_proforma_batch requires a common hold_years")
+
+    def column(values: Iterable[Decimal]) -> np.ndarray:
+        return np.fromiter((float(v) for v in values), dtype=np.float64, count=len(scenarios))
+
+    arrays = build_proforma_arrays_batch(scenarios, hold_years)
+    debt = yearly_debt_arrays(
+        column(s.loan_amount for s in scenarios),
+        column(s.interest_rate for s in scenarios),
+        np.array([s.loan_term_years for s in scenarios]),
+        hold_years,
+    )
+    dep_total = np.stack(
+        [compute_depreciation_schedule(s, hold_years).sum(axis=1) for s in scenarios]
+    )
+
+    noi_arr = arrays["noi"]
+    cfbt = noi_arr - debt["debt_service"]
+    tax_benefit, suspended = passive_tax_benefits_batch(
+        noi_arr - debt["interest"] - dep_total, investor
+    )
+    cfat = cfbt + tax_benefit
+
+    disposition = compute_disposition_batch(
+        sale_price=arrays["property_value"][:, -1],
+        loan_balance=debt["ending_balance"][:, -1],
+        total_basis=column(s.total_basis for s in scenarios),
+        selling_costs_pct=column(s.selling_costs_pct for s in scenarios),
+        total_depreciation_taken=np.round(dep_total.sum(axis=1), 2),
+        cumulative_suspended_losses=suspended[:, -1],
+        investor=investor,
+    )
+
+    initial = column(s.total_initial_investment for s in scenarios)
+    before_tax_cfs = np.concatenate([-initial[:, None], cfbt], axis=1)
+    after_tax_cfs = np.concatenate([-initial[:, None], cfat], axis=1)
+    before_tax_cfs[:, -1] += disposition["gross_equity_proceeds"]
+    after_tax_cfs[:, -1] += disposition["after_tax_sale_proceeds"]
+
+    total_cash_returned = cfat.sum(axis=1) + disposition["after_tax_sale_proceeds"]
+    safe_initial = np.where(initial == 0, 1.0, initial)
+    equity_multiple = np.where(initial == 0, 0.0, np.round(total_cash_returned / safe_initial, 4))
+
+    return {
+        "noi": noi_arr,
+        "debt_service": debt["debt_service"],
+        "cash_flow_before_tax": cfbt,
+        "total_depreciation": dep_total,
+        "tax_benefit": tax_benefit,
+        "cash_flow_after_tax": cfat,
+        "loan_balance": debt["ending_balance"],
+        "property_value": arrays["property_value"],
+        "suspended_loss": suspended,
+        "after_tax_sale_proceeds": disposition["after_tax_sale_proceeds"],
+        "before_tax_irr": compute_irr_batch(before_tax_cfs),
+        "after_tax_irr": compute_irr_batch(after_tax_cfs),
+        "equity_multiple": equity_multiple,
+    }
+
+
+def run_proforma_parallel(
+    scenarios: Sequence[DealAssumptions],
+    investor: InvestorTaxProfile,
+    max_workers: int | None = None,
+    chunksize: int | None = None,
+) -> list[AnalysisResult]:
+    """run_proforma for many scenarios across worker processes.
+
+    run_proforma is pure, so scenarios are independent; results come back in
+    input order and are identical to calling run_proforma serially.
+    Scenarios are shipped in chunks (default: about four per worker) so
+    pickling cost is amortized over several proformas. Workers are spawned,
+    not forked: forking after numba's thread pool has started (any earlier
+    run_proforma_batch call) deadlocks the children.
+    """
+    if not scenarios:
+        return []
+    workers = max_workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, len(scenarios) // (workers * 4))
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        run_one = partial(run_proforma, investor=investor)
+        return list(pool.map(run_one, scenarios, chunksize=chunksize))
@@ -3,17 +3,20 @@
 Pure function: property attributes in, RehabBudget out. No I/O.
 """
 
-from decimal import Decimal, ROUND_HALF_UP
-from typing import Optional
+from bisect import bisect_right
+from decimal import Decimal
+from functools import lru_cache
+
+import numpy as np
 
 from src.models.rehab import (
     ConditionGrade,
-    RehabCategory,
-    RehabLineItem,
     RehabBudget,
+    RehabCategory,
 )
 
 TWO_PLACES = Decimal("0.01")
+_NO_COST = Decimal("0.00")  # shared estimate for zero-cost cells
 
 # Per-sqft cost by condition grade and category.
 # Values represent $/sqft for a post-2000 build (age multiplier applied separately).
@@ -73,6 +76,25 @@ COST_TABLE: dict[ConditionGrade, dict[RehabCategory, Decimal]] = {
     },
 }
 
+# Age multiplier by build-year bucket: before 1950, 1950-69, 1970-99, 2000+
+_AGE_CUTOFFS = (1950, 1970, 2000)
+_AGE_MULTIPLIERS = (Decimal("1.30"), Decimal("1.20"), Decimal("1.10"), Decimal("1.00"))
+
+# COST_TABLE times each age multiplier, as an int64 (grade, age bucket,
+# category) array in units of $0.0001 per sqft (cents x age percent), in enum
+# declaration order. Only 20 rows exist, so they are built once here and a
+# budget's estimates are a single exact integer multiply by sqft.
+_CATEGORIES = tuple(RehabCategory)
+_CATEGORY_VALUES = tuple(cat.value for cat in _CATEGORIES)
+_NO_OVERRIDES = (None,) * len(_CATEGORIES)
+_COST_ROWS = (
+    np.array(
+        [[int(COST_TABLE[grade][cat] * 100) for cat in _CATEGORIES] for grade in ConditionGrade],
+        dtype=np.int64,
+    )[:, None, :]
+    * np.array([int(m * 100) for m in _AGE_MULTIPLIERS], dtype=np.int64)[None, :, None]
+)
+
 DEFAULT_REHAB_MONTHS: dict[ConditionGrade, int] = {
     ConditionGrade.TURNKEY: 0,
     ConditionGrade.LIGHT: 1,
@@ -81,27 +103,33 @@ DEFAULT_REHAB_MONTHS: dict[ConditionGrade, int] = {
     ConditionGrade.FULL_GUT: 9,
 }
 
+# Per-grade (cost rows by age bucket, default rehab months): one enum-keyed
+# lookup per estimate. The enums stay str-valued for the API and dashboard.
+_GRADE_TABLES: dict[ConditionGrade, tuple[np.ndarray, int]] = {
+    grade: (_COST_ROWS[i], DEFAULT_REHAB_MONTHS[grade])
+    for i, grade in enumerate(ConditionGrade)
+}
+
 
-def _age_multiplier(year_built: int) -> Decimal:
-    if year_built >= 2000:
-        return Decimal("1.00")
-    if year_built >= 1970:
-        return Decimal("1.10")
-    if year_built >= 1950:
-        return Decimal("1.20")
-    return Decimal("1.30")
+def _age_bucket(year_built: int) -> int:
+    """Index into _AGE_MULTIPLIERS for the build year."""
+    return bisect_right(_AGE_CUTOFFS, year_built)
 
 
 def estimate_rehab_budget(
     sqft: int,
     year_built: int,
     condition_grade: ConditionGrade,
-    rehab_months: Optional[int] = None,
-    line_item_overrides: Optional[dict[str, Decimal]] = None,
-    total_override: Optional[Decimal] = None,
+    rehab_months: int | None = None,
+    line_item_overrides: dict[str, Decimal] | None = None,
+    total_override: Decimal | None = None,
 ) -> RehabBudget:
     """Estimate rehab budget from property attributes and condition grade.
 
+    Budgets are memoized: RehabBudget is immutable, and sweeps re-estimate
+    the same property and grade many times. Line-item overrides take part
+    in the key as a tuple aligned with the category order.
+
     Args:
         sqft: Property square footage.
         year_built: Year the property was built (for age multiplier).
@@ -113,32 +141,38 @@ def estimate_rehab_budget(
     Returns:
         RehabBudget with estimated (or overridden) line items.
     """
-    age_mult = _age_multiplier(year_built)
-    sqft_dec = Decimal(str(sqft))
-    cost_row = COST_TABLE[condition_grade]
-
-    overrides = line_item_overrides or {}
-
-    line_items: list[RehabLineItem] = []
-    for category in RehabCategory:
-        per_sqft = cost_row[category]
-        estimated = (per_sqft * sqft_dec * age_mult).quantize(TWO_PLACES, ROUND_HALF_UP)
-        override = None
-        if category.value in overrides:
-            override = overrides[category.value]
-        line_items.append(
-            RehabLineItem(
-                category=category,
-                estimated_cost=estimated,
-                override_cost=override,
-            )
-        )
-
-    months = rehab_months if rehab_months is not None else DEFAULT_REHAB_MONTHS[condition_grade]
+    if line_item_overrides:
+        override_costs = tuple(line_item_overrides.get(key) for key in _CATEGORY_VALUES)
+    else:
+        override_costs = _NO_OVERRIDES
+    return _estimate_rehab_budget(
+        sqft, year_built, condition_grade, rehab_months, override_costs, total_override
+    )
+
+
+@lru_cache(maxsize=1024)
+def _estimate_rehab_budget(
+    sqft: int,
+    year_built: int,
+    condition_grade: ConditionGrade,
+    rehab_months: int | None,
+    override_costs: tuple[Decimal | None, ...],
+    total_override: Decimal | None,
+) -> RehabBudget:
+    # Row is in $0.0001 per sqft; rounding half-up to whole cents matches
+    # Decimal quantize(TWO_PLACES, ROUND_HALF_UP)
+    cost_rows, default_months = _GRADE_TABLES[condition_grade]
+    raw = cost_rows[_age_bucket(year_built)] * sqft
+    estimates = ((raw + 50) // 100).tolist()
+
+    months = rehab_months if rehab_months is not None else default_months
 
     return RehabBudget(
         condition_grade=condition_grade,
-        line_items=tuple(line_items),
+        estimated_costs=tuple(
+            Decimal(cents).scaleb(-2) if cents else _NO_COST for cents in estimates
+        ),
+        override_costs=override_costs,
         rehab_months=months,
         total_override=total_override,
     )
@@ -6,15 +6,21 @@ RE professional status, and NIIT.
 Pure functions: dataclasses in, dataclasses out. No I/O.
 """
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from decimal import Decimal, ROUND_HALF_UP
+from typing import overload
 
+import numpy as np
+
+from src.engine._jit import HAS_NUMBA, njit
 from src.models.investor import InvestorTaxProfile
 
 TWO_PLACES = Decimal("0.01")
+_ZERO = Decimal("0")
 
 
-@dataclass
+@dataclass(slots=True)
 class PassiveActivityEntry:
     year: int
     rental_income_or_loss: Decimal  # Negative = loss
@@ -25,19 +31,94 @@ class PassiveActivityEntry:
     tax_benefit: Decimal  # Tax saved from deductible amount
 
 
+# PassiveActivityEntry's Decimal fields, one ledger column each
+_AMOUNT_COLUMNS = (
+    "rental_income_or_loss",
+    "other_passive_income",
+    "deductible_amount",
+    "suspended_amount",
+    "cumulative_suspended",
+    "tax_benefit",
+)
+
+
+class _LedgerEntries(Sequence[PassiveActivityEntry]):
+    """Read-only entry view over a ledger's columns; entries are built on access."""
+
+    def __init__(self, years: list[int], columns: dict[str, list[Decimal]]):
+        self._years = years
+        self._columns = columns
+
+    def __len__(self) -> int:
+        return len(self._years)
+
+    @overload
+    def __getitem__(self, index: int) -> PassiveActivityEntry: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[PassiveActivityEntry]: ...
+
+    def __getitem__(
+        self, index: int | slice
+    ) -> PassiveActivityEntry | Sequence[PassiveActivityEntry]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return PassiveActivityEntry(
+            year=self._years[index],
+            **{name: column[index] for name, column in self._columns.items()},
+        )
+
+
 @dataclass
 class PassiveActivityLedger:
-    entries: list[PassiveActivityEntry] = field(default_factory=list)
+    """Passive activity results by year, stored column-wise.
+
+    The years and each Decimal PassiveActivityEntry field are their own
+    lists, so ledger-wide totals read one column instead of walking every
+    entry; the tax benefit total is kept as a running sum. ``entries`` is a
+    read-only sequence view that builds fresh entries on access.
+
+    This replaced a ledger holding ``entries: list[PassiveActivityEntry]``.
+    Build one with ``PassiveActivityLedger()`` and ``append(entry)``:
+    ``PassiveActivityLedger(entries=[...])`` and ``ledger.entries.append``
+    no longer exist, and changes to an entry read from ``entries`` are not
+    written back to the ledger.
+    """
+
+    years: list[int] = field(default_factory=list)
+    columns: dict[str, list[Decimal]] = field(
+        default_factory=lambda: {name: [] for name in _AMOUNT_COLUMNS}
+    )
+    _tax_benefit_sum: Decimal = field(default=_ZERO, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._tax_benefit_sum = sum(self.columns["tax_benefit"], _ZERO)
+
+    def append(self, entry: PassiveActivityEntry) -> None:
+        self.years.append(entry.year)
+        for name, column in self.columns.items():
+            column.append(getattr(entry, name))
+        self._tax_benefit_sum += entry.tax_benefit
+
+    @property
+    def entries(self) -> _LedgerEntries:
+        return _LedgerEntries(self.years, self.columns)
 
     @property
     def total_suspended(self) -> Decimal:
-        if not self.entries:
-            return Decimal("0")
-        return self.entries[-1].cumulative_suspended
+        cumulative = self.columns["cumulative_suspended"]
+        return cumulative[-1] if cumulative else _ZERO
 
     @property
     def total_tax_benefit(self) -> Decimal:
-        return sum((e.tax_benefit for e in self.entries), Decimal("0"))
+        return self._tax_benefit_sum
+
+    def as_arrays(self) -> dict[str, np.ndarray]:
+        """Float64 copy of every column (years included), for analytics across ledgers."""
+        arrays = {"year": np.array(self.years, dtype=np.float64)}
+        for name, column in self.columns.items():
+            arrays[name] = np.array(column, dtype=np.float64)
+        return arrays
 
 
 def compute_passive_activity(
@@ -55,63 +136,34 @@ def compute_passive_activity(
         prior_suspended: Cumulative suspended losses from prior years
         year: Year number for tracking
     """
-    net_passive = rental_income_or_loss + investor.other_passive_income
+    other_passive = investor.other_passive_income
+    net_passive = rental_income_or_loss + other_passive
+    suspended = _ZERO
 
     if net_passive >= 0:
-        # Passive income: can offset with suspended losses
-        usable_suspended = min(prior_suspended, net_passive)
-        deductible = net_passive - usable_suspended  # Remaining is taxable income
-        # Actually, suspended losses offset passive income
-        deductible = -usable_suspended  # This reduces taxable income
-        new_suspended = prior_suspended - usable_suspended
-        # Tax benefit from releasing suspended losses
-        tax_benefit = (usable_suspended * investor.combined_rate).quantize(
-            TWO_PLACES, ROUND_HALF_UP
-        )
-        return PassiveActivityEntry(
-            year=year,
-            rental_income_or_loss=rental_income_or_loss,
-            other_passive_income=investor.other_passive_income,
-            deductible_amount=deductible,
-            suspended_amount=Decimal("0"),
-            cumulative_suspended=new_suspended,
-            tax_benefit=tax_benefit,
-        )
-
-    # Net passive loss
-    loss = abs(net_passive)
-
-    if investor.is_re_professional:
+        # Passive income: suspended losses offset it, reducing taxable income
+        deducted = min(prior_suspended, net_passive)
+        new_suspended = prior_suspended - deducted
+    elif investor.is_re_professional:
         # RE professional: all rental losses are non-passive (fully deductible)
-        tax_benefit = (loss * investor.combined_rate).quantize(TWO_PLACES, ROUND_HALF_UP)
-        return PassiveActivityEntry(
-            year=year,
-            rental_income_or_loss=rental_income_or_loss,
-            other_passive_income=investor.other_passive_income,
-            deductible_amount=-loss,
-            suspended_amount=Decimal("0"),
-            cumulative_suspended=prior_suspended,
-            tax_benefit=tax_benefit,
-        )
-
-    # Check $25K exception
-    allowance = investor.rental_loss_allowance
-    deductible_loss = min(loss, allowance)
-    suspended = loss - deductible_loss
-
-    tax_benefit = (deductible_loss * investor.combined_rate).quantize(
-        TWO_PLACES, ROUND_HALF_UP
-    )
-    new_suspended = prior_suspended + suspended
+        deducted = -net_passive
+        new_suspended = prior_suspended
+    else:
+        # Net passive loss: deductible up to the $25K exception allowance
+        loss = -net_passive
+        deducted = min(loss, investor.rental_loss_allowance)
+        suspended = loss - deducted
+        new_suspended = prior_suspended + suspended
 
+    # Every branch's tax benefit is the deducted amount at the combined rate
     return PassiveActivityEntry(
         year=year,
         rental_income_or_loss=rental_income_or_loss,
-        other_passive_income=investor.other_passive_income,
-        deductible_amount=-deductible_loss,
+        other_passive_income=other_passive,
+        deductible_amount=-deducted,
         suspended_amount=suspended,
         cumulative_suspended=new_suspended,
-        tax_benefit=tax_benefit,
+        tax_benefit=(deducted * investor.combined_rate).quantize(TWO_PLACES, ROUND_HALF_UP),
     )
 
 
@@ -121,7 +173,7 @@ def build_passive_activity_ledger(
 ) -> PassiveActivityLedger:
     """Build complete passive activity ledger across all hold years."""
     ledger = PassiveActivityLedger()
-    prior_suspended = Decimal("0")
+    prior_suspended = _ZERO
 
     for i, income_or_loss in enumerate(yearly_rental_income_or_loss):
         entry = compute_passive_activity(
@@ -130,12 +182,169 @@ def build_passive_activity_ledger(
             prior_suspended=prior_suspended,
             year=i + 1,
         )
-        ledger.entries.append(entry)
+        ledger.append(entry)
         prior_suspended = entry.cumulative_suspended
 
     return ledger
 
 
+@njit(cache=True)
+def _passive_activity_kernel(
+    income_or_loss, other_passive, re_professional, allowance, deductible_out, cumulative_out
+):
+    """IRC 469 recurrence over float years, writing deductible and
+    cumulative-suspended amounts into the preallocated outputs."""
+    suspended = 0.0
+    for i in range(len(income_or_loss)):
+        net_passive = income_or_loss[i] + other_passive
+        if net_passive >= 0:
+            # Passive income releases prior suspended losses
+            deductible = min(suspended, net_passive)
+            suspended -= deductible
+        elif re_professional:
+            deductible = -net_passive
+        else:
+            deductible = min(-net_passive, allowance)
+            suspended += -net_passive - deductible
+        deductible_out[i] = deductible
+        cumulative_out[i] = suspended
+
+
+def passive_tax_benefits(
+    yearly_rental_income_or_loss: list[float],
+    investor: InvestorTaxProfile,
+) -> tuple[list[float], list[float]]:
+    """Float counterpart of build_passive_activity_ledger.
+
+    Returns (tax_benefit, cumulative_suspended) per year with the same
+    IRC 469 rules as compute_passive_activity; tax benefits are rounded to
+    cents. Investor rates are read once for the whole hold period. The
+    recurrence runs in a numba kernel when numba is installed.
+    """
+    combined_rate = float(investor.combined_rate)
+    re_professional = investor.is_re_professional
+    allowance = 0.0 if re_professional else float(investor.rental_loss_allowance)
+
+    n_years = len(yearly_rental_income_or_loss)
+    if HAS_NUMBA:
+        income = np.asarray(yearly_rental_income_or_loss, dtype=np.float64)
+        deductible = np.empty(n_years)
+        cumulative = np.empty(n_years)
+    else:
+        income = yearly_rental_income_or_loss
+        deductible = [0.0] * n_years
+        cumulative = [0.0] * n_years
+    _passive_activity_kernel(
+        income, float(investor.other_passive_income), re_professional, allowance,
+        deductible, cumulative,
+    )
+    if HAS_NUMBA:
+        deductible = deductible.tolist()
+        cumulative = cumulative.tolist()
+    return [round(d * combined_rate, 2) for d in deductible], cumulative
+
+
+@njit(cache=True)
+def _passive_activity_batch_kernel(
+    net_passive, re_professional, allowance, deductible_out, suspended_out, cumulative_out
+):
+    """_passive_activity_kernel over the rows of an (N, years) array; each
+    row's years are carried in order. Rows are cheap, so this stays
+    single-threaded: numba's thread pool would make forking callers unsafe."""
+    for n in range(net_passive.shape[0]):
+        suspended = 0.0
+        for i in range(net_passive.shape[1]):
+            net = net_passive[n, i]
+            newly_suspended = 0.0
+            if net >= 0:
+                deductible = min(suspended, net)
+                suspended -= deductible
+            elif re_professional:
+                deductible = -net
+            else:
+                deductible = min(-net, allowance)
+                newly_suspended = -net - deductible
+                suspended += newly_suspended
+            deductible_out[n, i] = deductible
+            suspended_out[n, i] = newly_suspended
+            cumulative_out[n, i] = suspended
+
+
+def _passive_activity_batch(
+    rental_income_or_loss: np.ndarray,
+    investor: InvestorTaxProfile,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(deductible, newly suspended, cumulative suspended), each (N, years)."""
+    re_professional = investor.is_re_professional
+    allowance = 0.0 if re_professional else float(investor.rental_loss_allowance)
+
+    net_passive = (
+        np.asarray(rental_income_or_loss, dtype=np.float64)
+        + float(investor.other_passive_income)
+    )
+    deductible = np.zeros_like(net_passive)
+    newly_suspended = np.zeros_like(net_passive)
+    cumulative = np.zeros_like(net_passive)
+    if HAS_NUMBA:
+        _passive_activity_batch_kernel(
+            net_passive, re_professional, allowance, deductible, newly_suspended, cumulative
+        )
+        return deductible, newly_suspended, cumulative
+
+    # Without numba: carry the years sequentially, scenarios side by side
+    suspended = np.zeros(net_passive.shape[0])
+    for year in range(net_passive.shape[1]):
+        net = net_passive[:, year]
+        loss = np.maximum(-net, 0.0)
+        released = np.minimum(suspended, np.maximum(net, 0.0))
+        if re_professional:
+            deducted_loss = loss
+        else:
+            deducted_loss = np.minimum(loss, allowance)
+        newly_suspended[:, year] = loss - deducted_loss
+        suspended = suspended - released + newly_suspended[:, year]
+        deductible[:, year] = released + deducted_loss
+        cumulative[:, year] = suspended
+    return deductible, newly_suspended, cumulative
+
+
+def passive_tax_benefits_batch(
+    rental_income_or_loss: np.ndarray,
+    investor: InvestorTaxProfile,
+) -> tuple[np.ndarray, np.ndarray]:
+    """passive_tax_benefits for N scenarios sharing one investor.
+
+    rental_income_or_loss is (N, hold_years); returns (tax_benefit,
+    cumulative_suspended), both (N, hold_years).
+    """
+    deductible, _, cumulative = _passive_activity_batch(rental_income_or_loss, investor)
+    return np.round(deductible * float(investor.combined_rate), 2), cumulative
+
+
+def build_passive_activity_ledger_batch(
+    rental_income_or_loss: np.ndarray,
+    investor: InvestorTaxProfile,
+) -> dict[str, np.ndarray]:
+    """build_passive_activity_ledger for N scenarios as float64 columns.
+
+    rental_income_or_loss is (N, hold_years). Returns every ledger column
+    (the keys of PassiveActivityLedger.as_arrays) as an (N, hold_years)
+    array, with the same signs: deductible_amount is negative.
+    """
+    income = np.asarray(rental_income_or_loss, dtype=np.float64)
+    deductible, newly_suspended, cumulative = _passive_activity_batch(income, investor)
+    n_scenarios, n_years = income.shape
+    return {
+        "year": np.broadcast_to(np.arange(1, n_years + 1, dtype=np.float64), income.shape).copy(),
+        "rental_income_or_loss": income,
+        "other_passive_income": np.full(income.shape, float(investor.other_passive_income)),
+        "deductible_amount": -deductible,
+        "suspended_amount": newly_suspended,
+        "cumulative_suspended": cumulative,
+        "tax_benefit": np.round(deductible * float(investor.combined_rate), 2),
+    }
+
+
 def taxable_rental_income(
     noi: Decimal,
     interest_paid: Decimal,
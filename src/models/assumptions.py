@@ -3,13 +3,16 @@ from decimal import Decimal
 
 from src.models.rehab import RehabBudget, ConditionGrade
 
+_ZERO = Decimal("0")
+_ONE = Decimal("1")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class CostSegAllocation:
     """Percentage of depreciable basis allocated to each MACRS class."""
-    five_year: Decimal = Decimal("0")     # Personal property (appliances, carpet, etc.)
-    seven_year: Decimal = Decimal("0")    # Office furniture, etc.
-    fifteen_year: Decimal = Decimal("0")  # Land improvements (parking, landscaping)
+    five_year: Decimal = _ZERO     # Personal property (appliances, carpet, etc.)
+    seven_year: Decimal = _ZERO    # Office furniture, etc.
+    fifteen_year: Decimal = _ZERO  # Land improvements (parking, landscaping)
     # Remainder stays on 27.5-year residential
 
     @property
@@ -18,36 +21,36 @@ class CostSegAllocation:
 
     @property
     def residential_pct(self) -> Decimal:
-        return Decimal("1") - self.reclassified_total
+        return _ONE - self.reclassified_total
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DealAssumptions:
     # Purchase
     purchase_price: Decimal
-    closing_costs: Decimal = Decimal("0")  # Buyer closing costs (added to basis)
+    closing_costs: Decimal = _ZERO  # Buyer closing costs (added to basis)
     land_value_pct: Decimal = Decimal("0.20")  # Land is not depreciable
 
     # Financing
     ltv: Decimal = Decimal("0.80")
     interest_rate: Decimal = Decimal("0.07")  # Annual
     loan_term_years: int = 30
-    loan_points: Decimal = Decimal("0")  # Points paid at closing
+    loan_points: Decimal = _ZERO  # Points paid at closing
     loan_type: str = "conventional"  # "conventional" or "dscr"
 
     # Income
-    monthly_rent: Decimal = Decimal("0")
+    monthly_rent: Decimal = _ZERO
     annual_rent_growth: Decimal = Decimal("0.03")
     vacancy_rate: Decimal = Decimal("0.05")
-    other_income: Decimal = Decimal("0")  # Laundry, parking, etc.
+    other_income: Decimal = _ZERO  # Laundry, parking, etc.
 
     # Expenses
-    property_tax: Decimal = Decimal("0")  # Annual
-    insurance: Decimal = Decimal("0")  # Annual
+    property_tax: Decimal = _ZERO  # Annual
+    insurance: Decimal = _ZERO  # Annual
     maintenance_pct: Decimal = Decimal("0.05")  # % of gross rent
     management_pct: Decimal = Decimal("0.08")  # % of gross rent
     capex_reserve_pct: Decimal = Decimal("0.05")  # % of gross rent
-    hoa: Decimal = Decimal("0")  # Monthly
+    hoa: Decimal = _ZERO  # Monthly
 
     # Appreciation & Hold
     annual_appreciation: Decimal = Decimal("0.03")
@@ -67,22 +70,51 @@ class DealAssumptions:
         default_factory=lambda: RehabBudget(condition_grade=ConditionGrade.TURNKEY)
     )
 
+    # Derived amounts, filled in by __post_init__; slots leave no instance
+    # __dict__, so they are declared as non-init fields
+    _loan_amount: Decimal = field(init=False, repr=False, compare=False)
+    _down_payment: Decimal = field(init=False, repr=False, compare=False)
+    _total_initial_investment: Decimal = field(init=False, repr=False, compare=False)
+    _total_basis: Decimal = field(init=False, repr=False, compare=False)
+    _depreciable_basis: Decimal = field(init=False, repr=False, compare=False)
+    _land_value: Decimal = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Immutable, and these figures are read every proforma year and
+        # solver iteration, so compute them once
+        loan_amount = self.purchase_price * self.ltv
+        down_payment = self.purchase_price - loan_amount
+        total_basis = self.purchase_price + self.closing_costs
+        rehab_cost = self.rehab_budget.total_cost
+        object.__setattr__(self, "_loan_amount", loan_amount)
+        object.__setattr__(self, "_down_payment", down_payment)
+        object.__setattr__(
+            self,
+            "_total_initial_investment",
+            down_payment + self.closing_costs + self.loan_points + rehab_cost,
+        )
+        object.__setattr__(self, "_total_basis", total_basis)
+        object.__setattr__(
+            self, "_depreciable_basis", total_basis * (_ONE - self.land_value_pct) + rehab_cost
+        )
+        object.__setattr__(self, "_land_value", total_basis * self.land_value_pct)
+
     @property
     def loan_amount(self) -> Decimal:
-        return self.purchase_price * self.ltv
+        return self._loan_amount
 
     @property
     def down_payment(self) -> Decimal:
-        return self.purchase_price - self.loan_amount
+        return self._down_payment
 
     @property
     def total_initial_investment(self) -> Decimal:
-        return self.down_payment + self.closing_costs + self.loan_points + self.rehab_budget.total_cost
+        return self._total_initial_investment
 
     @property
     def total_basis(self) -> Decimal:
         """Cost basis for depreciation = purchase price + closing costs."""
-        return self.purchase_price + self.closing_costs
+        return self._total_basis
 
     @property
     def depreciable_basis(self) -> Decimal:
@@ -90,8 +122,8 @@ class DealAssumptions:
 
         Rehab is 100% depreciable (all building improvement, no land).
         """
-        return self.total_basis * (Decimal("1") - self.land_value_pct) + self.rehab_budget.total_cost
+        return self._depreciable_basis
 
     @property
     def land_value(self) -> Decimal:
-        return self.total_basis * self.land_value_pct
+        return self._land_value
@@ -1,7 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from decimal import Decimal
 from enum import Enum
 
+import numpy as np
+
 
 class FilingStatus(Enum):
     SINGLE = "single"
@@ -10,6 +12,15 @@ class FilingStatus(Enum):
     HOH = "head_of_household"
 
 
+# AGI above which the 3.8% Net Investment Income Tax applies
+NIIT_THRESHOLDS: dict[FilingStatus, Decimal] = {
+    FilingStatus.SINGLE: Decimal("200000"),
+    FilingStatus.MFJ: Decimal("250000"),
+    FilingStatus.MFS: Decimal("125000"),
+    FilingStatus.HOH: Decimal("200000"),
+}
+
+
 @dataclass(frozen=True)
 class InvestorTaxProfile:
     filing_status: FilingStatus
@@ -20,25 +31,35 @@ class InvestorTaxProfile:
     other_passive_income: Decimal = Decimal("0")
     is_re_professional: bool = False  # IRC 469(c)(7)
 
+    # Filled in by __post_init__
+    _combined_rate: Decimal = field(init=False, repr=False, compare=False)
+    _niit_applies: bool = field(init=False, repr=False, compare=False)
+    _rental_loss_allowance: Decimal = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # The profile is immutable, so the derived tax figures read every
+        # proforma year are computed once here rather than on each access.
+        object.__setattr__(
+            self, "_combined_rate", self.marginal_federal_rate + self.marginal_state_rate
+        )
+        object.__setattr__(
+            self, "_niit_applies", self.agi > NIIT_THRESHOLDS[self.filing_status]
+        )
+        object.__setattr__(self, "_rental_loss_allowance", self._compute_rental_loss_allowance())
+
     @property
     def combined_rate(self) -> Decimal:
         # Simplified: federal + state (ignoring SALT deduction interactions)
-        return self.marginal_federal_rate + self.marginal_state_rate
+        return self._combined_rate
 
     @property
     def niit_applies(self) -> bool:
         """Net Investment Income Tax (3.8%) applies above AGI thresholds."""
-        thresholds = {
-            FilingStatus.SINGLE: Decimal("200000"),
-            FilingStatus.MFJ: Decimal("250000"),
-            FilingStatus.MFS: Decimal("125000"),
-            FilingStatus.HOH: Decimal("200000"),
-        }
-        return self.agi > thresholds[self.filing_status]
+        return self._niit_applies
 
     @property
     def niit_rate(self) -> Decimal:
-        return Decimal("0.038") if self.niit_applies else Decimal("0")
+        return Decimal("0.038") if self._niit_applies else Decimal("0")
 
     @property
     def qualifies_for_25k_exception(self) -> bool:
@@ -50,6 +71,9 @@ class InvestorTaxProfile:
     @property
     def rental_loss_allowance(self) -> Decimal:
         """Maximum deductible rental loss under $25K exception."""
+        return self._rental_loss_allowance
+
+    def _compute_rental_loss_allowance(self) -> Decimal:
         if not self.qualifies_for_25k_exception:
             return Decimal("0")
         if self.agi <= Decimal("100000"):
@@ -57,3 +81,17 @@ class InvestorTaxProfile:
         # Phase out: $1 for every $2 of AGI over $100K
         reduction = (self.agi - Decimal("100000")) / 2
         return max(Decimal("0"), Decimal("25000") - reduction)
+
+    @classmethod
+    def bulk_rental_loss_allowance(
+        cls, agi: np.ndarray, is_re_professional: np.ndarray
+    ) -> np.ndarray:
+        """rental_loss_allowance for many AGIs at once, as float64.
+
+        Branch-free form of the $25K exception and its $100K-$150K phase-out,
+        for what-if sweeps over AGI; the scalar property stays exact Decimal.
+        """
+        agi = np.asarray(agi, dtype=np.float64)
+        phased = np.clip(25000.0 - np.maximum(agi - 100000.0, 0.0) / 2, 0.0, 25000.0)
+        eligible = ~np.asarray(is_re_professional, dtype=bool) & (agi < 150000.0)
+        return np.where(eligible, phased, 0.0)
@@ -5,7 +5,7 @@ from decimal import Decimal
 from enum import Enum
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NeighborhoodDemographics:
     median_household_income: int | None = None
     median_home_value: int | None = None
@@ -14,14 +14,14 @@ class NeighborhoodDemographics:
     renter_pct: Decimal | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WalkScoreResult:
     walk_score: int | None = None
     transit_score: int | None = None
     bike_score: int | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SchoolInfo:
     name: str
     rating: int  # 1-10
@@ -37,7 +37,7 @@ class NeighborhoodGrade(Enum):
     F = "F"  # Distressed
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NeighborhoodReport:
     grade: NeighborhoodGrade
     grade_score: Decimal  # 0-100 composite
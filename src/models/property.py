@@ -3,7 +3,7 @@ from decimal import Decimal
 from datetime import date
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Address:
     street: str
     city: str
@@ -21,7 +21,7 @@ class Address:
         return f"{self.street}, {self.city}, {self.state} {self.zip_code}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PropertyDetail:
     address: Address
     bedrooms: int
@@ -53,7 +53,7 @@ class PropertyDetail:
     image_url: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RentalComp:
     address: str
     rent: Decimal
@@ -63,7 +63,7 @@ class RentalComp:
     distance_miles: Decimal
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SaleComp:
     address: str
     sale_price: Decimal
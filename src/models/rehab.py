@@ -1,9 +1,10 @@
 """Rehab cost budgeting data types."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from decimal import Decimal
 from enum import Enum
-from typing import Optional
+
+_ZERO = Decimal("0")
 
 
 class ConditionGrade(Enum):
@@ -28,11 +29,15 @@ class RehabCategory(Enum):
     CONTINGENCY = "contingency"
 
 
-@dataclass(frozen=True)
+_CATEGORIES = tuple(RehabCategory)
+_CATEGORY_INDEX = {category: i for i, category in enumerate(_CATEGORIES)}
+
+
+@dataclass(frozen=True, slots=True)
 class RehabLineItem:
     category: RehabCategory
     estimated_cost: Decimal
-    override_cost: Optional[Decimal] = None
+    override_cost: Decimal | None = None
 
     @property
     def cost(self) -> Decimal:
@@ -41,15 +46,66 @@ class RehabLineItem:
         return self.estimated_cost
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RehabBudget:
+    """Rehab budget stored as parallel per-category cost columns.
+
+    estimated_costs and override_costs are indexed by RehabCategory in
+    declaration order (both empty for a no-rehab budget); line_items
+    rebuilds the RehabLineItem view on access.
+    """
+
     condition_grade: ConditionGrade
-    line_items: tuple[RehabLineItem, ...] = ()
+    estimated_costs: tuple[Decimal, ...] = ()
+    override_costs: tuple[Decimal | None, ...] = ()
     rehab_months: int = 0
-    total_override: Optional[Decimal] = None
+    total_override: Decimal | None = None
+
+    # Filled in by __post_init__; declared so the slotted class has room
+    _has_override: bool = field(init=False, repr=False, compare=False)
+    _total_cost: Decimal = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Immutable, and total_cost feeds every basis/investment property
+        # read, so sum the costs once. Overrides are rare: without any, the
+        # estimates are the costs and need no per-category None check.
+        has_override = self.override_costs.count(None) != len(self.override_costs)
+        object.__setattr__(self, "_has_override", has_override)
+        if self.total_override is not None:
+            total = self.total_override
+        else:
+            total = sum(self.costs if has_override else self.estimated_costs, _ZERO)
+        object.__setattr__(self, "_total_cost", total)
+
+    @property
+    def costs(self) -> tuple[Decimal, ...]:
+        """Effective cost per category: the override where one is set."""
+        if not self._has_override:
+            return self.estimated_costs
+        return tuple(
+            estimated if override is None else override
+            for estimated, override in zip(self.estimated_costs, self.override_costs)
+        )
+
+    @property
+    def line_items(self) -> tuple[RehabLineItem, ...]:
+        return tuple(
+            RehabLineItem(category, estimated, override)
+            for category, estimated, override in zip(
+                _CATEGORIES, self.estimated_costs, self.override_costs
+            )
+        )
+
+    def line_item(self, category: RehabCategory) -> RehabLineItem:
+        """The line item for one category, read straight from the columns.
+
+        Raises KeyError where line_items has no entry for it (a no-rehab budget).
+        """
+        i = _CATEGORY_INDEX[category]
+        if i >= min(len(self.estimated_costs), len(self.override_costs)):
+            raise KeyError(category)
+        return RehabLineItem(category, self.estimated_costs[i], self.override_costs[i])
 
     @property
     def total_cost(self) -> Decimal:
-        if self.total_override is not None:
-            return self.total_override
-        return sum((item.cost for item in self.line_items), Decimal("0"))
+        return self._total_cost
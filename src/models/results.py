@@ -1,129 +1,151 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from decimal import Decimal
 
+import numpy as np
 
-@dataclass
+_ZERO = Decimal("0")
+
+
+@dataclass(slots=True)
 class YearlyProjection:
     year: int
 
     # Income
-    gross_rent: Decimal = Decimal("0")
-    vacancy_loss: Decimal = Decimal("0")
-    other_income: Decimal = Decimal("0")
-    effective_gross_income: Decimal = Decimal("0")
+    gross_rent: Decimal = _ZERO
+    vacancy_loss: Decimal = _ZERO
+    other_income: Decimal = _ZERO
+    effective_gross_income: Decimal = _ZERO
 
     # Expenses
-    property_tax: Decimal = Decimal("0")
-    insurance: Decimal = Decimal("0")
-    maintenance: Decimal = Decimal("0")
-    management: Decimal = Decimal("0")
-    capex_reserve: Decimal = Decimal("0")
-    hoa: Decimal = Decimal("0")
-    total_expenses: Decimal = Decimal("0")
+    property_tax: Decimal = _ZERO
+    insurance: Decimal = _ZERO
+    maintenance: Decimal = _ZERO
+    management: Decimal = _ZERO
+    capex_reserve: Decimal = _ZERO
+    hoa: Decimal = _ZERO
+    total_expenses: Decimal = _ZERO
 
     # Operations
-    noi: Decimal = Decimal("0")
-    debt_service: Decimal = Decimal("0")
-    cash_flow_before_tax: Decimal = Decimal("0")
+    noi: Decimal = _ZERO
+    debt_service: Decimal = _ZERO
+    cash_flow_before_tax: Decimal = _ZERO
 
     # Debt breakdown
-    principal_paid: Decimal = Decimal("0")
-    interest_paid: Decimal = Decimal("0")
-    loan_balance: Decimal = Decimal("0")
+    principal_paid: Decimal = _ZERO
+    interest_paid: Decimal = _ZERO
+    loan_balance: Decimal = _ZERO
 
     # Depreciation
-    depreciation_27_5: Decimal = Decimal("0")
-    depreciation_cost_seg: Decimal = Decimal("0")
-    total_depreciation: Decimal = Decimal("0")
+    depreciation_27_5: Decimal = _ZERO
+    depreciation_cost_seg: Decimal = _ZERO
+    total_depreciation: Decimal = _ZERO
 
     # Tax
-    taxable_income: Decimal = Decimal("0")
-    passive_loss: Decimal = Decimal("0")  # Negative = loss
-    suspended_loss: Decimal = Decimal("0")  # Cumulative suspended
-    tax_benefit: Decimal = Decimal("0")  # Positive = tax saved
-    cash_flow_after_tax: Decimal = Decimal("0")
+    taxable_income: Decimal = _ZERO
+    passive_loss: Decimal = _ZERO  # Negative = loss
+    suspended_loss: Decimal = _ZERO  # Cumulative suspended
+    tax_benefit: Decimal = _ZERO  # Positive = tax saved
+    cash_flow_after_tax: Decimal = _ZERO
 
     # Equity
-    property_value: Decimal = Decimal("0")
-    equity: Decimal = Decimal("0")  # Value - loan balance
+    property_value: Decimal = _ZERO
+    equity: Decimal = _ZERO  # Value - loan balance
 
     # Metrics
-    cap_rate: Decimal = Decimal("0")
-    cash_on_cash: Decimal = Decimal("0")
-    dscr: Decimal = Decimal("0")
+    cap_rate: Decimal = _ZERO
+    cash_on_cash: Decimal = _ZERO
+    dscr: Decimal = _ZERO
 
     # Rehab
     rent_months: int = 12
 
 
-@dataclass
+_PROJECTION_FIELDS = tuple(f.name for f in fields(YearlyProjection))
+
+
+@dataclass(slots=True)
 class DispositionResult:
-    sale_price: Decimal = Decimal("0")
-    selling_costs: Decimal = Decimal("0")
-    net_sale_proceeds: Decimal = Decimal("0")
-    loan_payoff: Decimal = Decimal("0")
-    gross_equity_proceeds: Decimal = Decimal("0")
+    sale_price: Decimal = _ZERO
+    selling_costs: Decimal = _ZERO
+    net_sale_proceeds: Decimal = _ZERO
+    loan_payoff: Decimal = _ZERO
+    gross_equity_proceeds: Decimal = _ZERO
 
     # Gain calculation
-    adjusted_basis: Decimal = Decimal("0")
-    total_gain: Decimal = Decimal("0")
-    depreciation_recapture: Decimal = Decimal("0")  # IRC 1250, taxed at 25%
-    capital_gain: Decimal = Decimal("0")  # IRC 1231, LTCG rate
+    adjusted_basis: Decimal = _ZERO
+    total_gain: Decimal = _ZERO
+    depreciation_recapture: Decimal = _ZERO  # IRC 1250, taxed at 25%
+    capital_gain: Decimal = _ZERO  # IRC 1231, LTCG rate
 
     # Tax on sale
-    recapture_tax: Decimal = Decimal("0")
-    capital_gains_tax: Decimal = Decimal("0")
-    niit_on_gain: Decimal = Decimal("0")
-    state_tax_on_gain: Decimal = Decimal("0")
+    recapture_tax: Decimal = _ZERO
+    capital_gains_tax: Decimal = _ZERO
+    niit_on_gain: Decimal = _ZERO
+    state_tax_on_gain: Decimal = _ZERO
 
     # IRC 469(g)(1)(A) suspended loss release
-    suspended_losses_released: Decimal = Decimal("0")
-    tax_benefit_from_release: Decimal = Decimal("0")
+    suspended_losses_released: Decimal = _ZERO
+    tax_benefit_from_release: Decimal = _ZERO
 
-    total_tax_on_sale: Decimal = Decimal("0")
-    after_tax_sale_proceeds: Decimal = Decimal("0")
+    total_tax_on_sale: Decimal = _ZERO
+    after_tax_sale_proceeds: Decimal = _ZERO
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     yearly_projections: list[YearlyProjection] = field(default_factory=list)
     disposition: DispositionResult = field(default_factory=DispositionResult)
 
     # Summary metrics
-    total_initial_investment: Decimal = Decimal("0")
-    rehab_total_cost: Decimal = Decimal("0")
+    total_initial_investment: Decimal = _ZERO
+    rehab_total_cost: Decimal = _ZERO
     rehab_months: int = 0
-    before_tax_irr: Decimal = Decimal("0")
-    after_tax_irr: Decimal = Decimal("0")
-    equity_multiple: Decimal = Decimal("0")
-    average_cash_on_cash: Decimal = Decimal("0")
-    total_profit: Decimal = Decimal("0")
+    before_tax_irr: Decimal = _ZERO
+    after_tax_irr: Decimal = _ZERO
+    equity_multiple: Decimal = _ZERO
+    average_cash_on_cash: Decimal = _ZERO
+    total_cash_returned: Decimal = _ZERO  # After-tax cash flows + after-tax sale proceeds
+    total_profit: Decimal = _ZERO
 
     # Tax alpha
-    total_depreciation_taken: Decimal = Decimal("0")
-    total_tax_benefit_operations: Decimal = Decimal("0")
-    total_suspended_losses: Decimal = Decimal("0")
-    net_tax_impact: Decimal = Decimal("0")  # Operations benefit - sale tax + release benefit
-
-
-@dataclass
+    total_depreciation_taken: Decimal = _ZERO
+    total_tax_benefit_operations: Decimal = _ZERO
+    total_suspended_losses: Decimal = _ZERO
+    net_tax_impact: Decimal = _ZERO  # Operations benefit - sale tax + release benefit
+
+    def projection_arrays(self) -> dict[str, np.ndarray]:
+        """Float64 column per YearlyProjection field, shape (hold_years,).
+
+        Structure-of-arrays copy of yearly_projections for vectorized
+        analytics (means, deviations, cross-deal reductions); the
+        projections themselves stay exact Decimal.
+        """
+        rows = [
+            [getattr(p, name) for name in _PROJECTION_FIELDS]
+            for p in self.yearly_projections
+        ]
+        table = np.array(rows, dtype=np.float64).reshape(len(rows), len(_PROJECTION_FIELDS))
+        return {name: table[:, i] for i, name in enumerate(_PROJECTION_FIELDS)}
+
+
+@dataclass(slots=True)
 class EquityComparison:
     """Side-by-side comparison of RE investment vs S&P 500."""
 
-    re_initial_equity: Decimal = Decimal("0")
-    sp500_initial_equity: Decimal = Decimal("0")
+    re_initial_equity: Decimal = _ZERO
+    sp500_initial_equity: Decimal = _ZERO
 
     re_yearly_equity: list[Decimal] = field(default_factory=list)
     sp500_yearly_equity: list[Decimal] = field(default_factory=list)
 
-    re_after_tax_irr: Decimal = Decimal("0")
-    sp500_after_tax_irr: Decimal = Decimal("0")
+    re_after_tax_irr: Decimal = _ZERO
+    sp500_after_tax_irr: Decimal = _ZERO
 
-    re_total_return: Decimal = Decimal("0")
-    sp500_total_return: Decimal = Decimal("0")
+    re_total_return: Decimal = _ZERO
+    sp500_total_return: Decimal = _ZERO
 
-    re_volatility: Decimal = Decimal("0")
-    sp500_volatility: Decimal = Decimal("0")
+    re_volatility: Decimal = _ZERO
+    sp500_volatility: Decimal = _ZERO
 
-    re_sharpe: Decimal = Decimal("0")
-    sp500_sharpe: Decimal = Decimal("0")
+    re_sharpe: Decimal = _ZERO
+    sp500_sharpe: Decimal = _ZERO
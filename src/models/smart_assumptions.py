@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass, field
 from decimal import Decimal
-from enum import Enum
+from enum import Enum, IntEnum
 
 
 class AssumptionSource(Enum):
@@ -18,7 +18,14 @@ class Confidence(Enum):
     LOW = "low"
 
 
-@dataclass(frozen=True)
+class CreditTier(IntEnum):
+    """Borrower credit tier; the value indexes per-tier pricing tables."""
+    EXCELLENT = 0  # 720+
+    GOOD = 1       # 680-719
+    FAIR = 2       # 660-679
+
+
+@dataclass(frozen=True, slots=True)
 class AssumptionDetail:
     field_name: str
     value: Decimal
@@ -28,7 +35,7 @@ class AssumptionDetail:
     data_points: dict = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AssumptionManifest:
     details: dict[str, AssumptionDetail] = field(default_factory=dict)
 
@@ -36,7 +43,7 @@ class AssumptionManifest:
         return self.details.get(field_name)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LoanOption:
     loan_type: str  # "conventional" or "dscr"
     interest_rate: Decimal
@@ -48,7 +55,7 @@ class LoanOption:
     prepayment_penalty: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MacroContext:
     mortgage_rate_30y: Decimal | None = None
     treasury_10y: Decimal | None = None
@@ -58,7 +65,7 @@ class MacroContext:
     median_home_price_national: Decimal | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserOverrides:
     """Every field the user can override."""
     purchase_price: Decimal | None = None
@@ -7,11 +7,13 @@ Investor: MFJ, $400K AGI, 37% federal, 13.3% CA state.
 import pytest
 from decimal import Decimal
 
+from src.engine.proforma import run_proforma
 from src.models.assumptions import DealAssumptions, CostSegAllocation
 from src.models.investor import InvestorTaxProfile, FilingStatus
+from src.models.results import AnalysisResult
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def canonical_assumptions() -> DealAssumptions:
     """$500K property with standard assumptions."""
     return DealAssumptions(
@@ -37,7 +39,7 @@ def canonical_assumptions() -> DealAssumptions:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def canonical_assumptions_with_cost_seg() -> DealAssumptions:
     """$500K property with 20% reclassified to 5-year via cost seg."""
     return DealAssumptions(
@@ -68,7 +70,7 @@ def canonical_assumptions_with_cost_seg() -> DealAssumptions:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def canonical_investor() -> InvestorTaxProfile:
     """High-income W-2 earner in California."""
     return InvestorTaxProfile(
@@ -82,7 +84,7 @@ def canonical_investor() -> InvestorTaxProfile:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def low_income_investor() -> InvestorTaxProfile:
     """Investor qualifying for $25K rental loss exception."""
     return InvestorTaxProfile(
@@ -96,7 +98,7 @@ def low_income_investor() -> InvestorTaxProfile:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def re_professional_investor() -> InvestorTaxProfile:
     """Real estate professional (IRC 469(c)(7))."""
     return InvestorTaxProfile(
@@ -108,3 +110,12 @@ def re_professional_investor() -> InvestorTaxProfile:
         other_passive_income=Decimal("0"),
         is_re_professional=True,
     )
+
+
+@pytest.fixture(scope="session")
+def baseline_proforma(canonical_assumptions, canonical_investor) -> AnalysisResult:
+    """run_proforma on the canonical deal and investor, computed once per session.
+
+    Shared across tests, so tests must not mutate it.
+    """
+    return run_proforma(canonical_assumptions, canonical_investor)
@@ -22,6 +22,15 @@ def estimator(tmp_db):
     return RentEstimator(db_path=tmp_db)
 
 
+@pytest.fixture
+def mock_settings(monkeypatch):
+    from src.data import rent_estimator
+
+    settings = MagicMock()
+    monkeypatch.setattr(rent_estimator, "settings", settings)
+    return settings
+
+
 @pytest.fixture
 def cache(tmp_db):
     return RentCache(tmp_db)
@@ -125,14 +134,13 @@ class TestModels:
 # ── LLM tier tests ──────────────────────────────────────────────
 
 class TestLLMTier:
-    async def test_llm_no_api_key(self, estimator):
-        with patch("src.data.rent_estimator.settings") as mock_settings:
-            mock_settings.anthropic_api_key = ""
-            result = await estimator._estimate_llm("123 Main St", 3, 1.5, 1200, "SFR")
-            assert result.tier == "llm"
-            assert result.estimate is None
+    async def test_llm_no_api_key(self, estimator, mock_settings):
+        mock_settings.anthropic_api_key = ""
+        result = await estimator._estimate_llm("123 Main St", 3, 1.5, 1200, "SFR")
+        assert result.tier == "llm"
+        assert result.estimate is None
 
-    async def test_llm_success(self, estimator):
+    async def test_llm_success(self, estimator, mock_settings):
         llm_response = json.dumps({
             "rent_low": 1300,
             "rent_mid": 1500,
@@ -146,11 +154,8 @@ class TestLLMTier:
         mock_client = AsyncMock()
         mock_client.messages.create = AsyncMock(return_value=mock_message)
 
-        with (
-            patch("src.data.rent_estimator.settings") as mock_settings,
-            patch("anthropic.AsyncAnthropic", return_value=mock_client),
-        ):
-            mock_settings.anthropic_api_key = "test-key"
+        mock_settings.anthropic_api_key = "test-key"
+        with patch("anthropic.AsyncAnthropic", return_value=mock_client):
             result = await estimator._estimate_llm("123 Main St", 3, 1.5, 1200, "SFR")
 
         assert result.tier == "llm"
@@ -199,7 +204,8 @@ class TestHUDTier:
 # ── RentCast tier tests ──────────────────────────────────────────
 
 class TestRentCastTier:
-    async def test_rentcast_success(self, estimator, sample_address):
+    async def test_rentcast_success(self, estimator, sample_address, mock_settings):
+        mock_settings.rentcast_monthly_limit = 500
         with (
             patch("src.data.rent_estimator.geocode_address", new_callable=AsyncMock, return_value=sample_address),
             patch.object(
@@ -208,23 +214,19 @@ class TestRentCastTier:
                 new_callable=AsyncMock,
                 return_value=Decimal("1550"),
             ),
-            patch("src.data.rent_estimator.settings") as mock_settings,
         ):
-            mock_settings.rentcast_monthly_limit = 500
             result = await estimator._estimate_rentcast("123 Main St", 3, 1.5, 1200, "SFR")
 
         assert result.tier == "rentcast"
         assert result.estimate == 1550.0
 
-    async def test_rentcast_rate_limited(self, estimator, tmp_db):
+    async def test_rentcast_rate_limited(self, estimator, tmp_db, mock_settings):
         cache = RentCache(tmp_db)
         # Log enough calls to hit the limit
-        for i in range(500):
-            cache.log_usage("rentcast", f"addr{i}", 0.01, cache_hit=False)
+        cache.log_usage_many(("rentcast", f"addr{i}", 0.01, False) for i in range(500))
 
-        with patch("src.data.rent_estimator.settings") as mock_settings:
-            mock_settings.rentcast_monthly_limit = 500
-            result = await estimator._estimate_rentcast("123 Main St", 3, 1.5, 1200, "SFR")
+        mock_settings.rentcast_monthly_limit = 500
+        result = await estimator._estimate_rentcast("123 Main St", 3, 1.5, 1200, "SFR")
 
         assert result.estimate is None
         assert "limit reached" in result.reasoning
@@ -15,7 +15,7 @@ from src.models.smart_assumptions import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_property():
     return PropertyDetail(
         address=Address(
@@ -32,7 +32,7 @@ def sample_property():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_neighborhood():
     return NeighborhoodReport(
         grade=NeighborhoodGrade.B,
@@ -46,7 +46,7 @@ def sample_neighborhood():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_macro():
     return MacroContext(
         mortgage_rate_30y=Decimal("0.0685"),
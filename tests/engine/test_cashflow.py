@@ -9,6 +9,8 @@ from src.engine.cashflow import (
     cash_on_cash,
     dscr,
     property_value,
+    build_proforma_arrays,
+    proforma_array_value,
 )
 
 
@@ -86,3 +88,16 @@ class TestPropertyValue:
         pv = property_value(canonical_assumptions, 7)
         expected = Decimal("500000") * Decimal("1.03") ** 7
         assert abs(pv - expected) < Decimal("1")
+
+
+class TestProformaArrays:
+    def test_matches_scalar_functions(self, canonical_assumptions):
+        arrays = build_proforma_arrays(canonical_assumptions, 7)
+        assert len(arrays["noi"]) == 7
+        for year in range(1, 8):
+            assert abs(proforma_array_value(arrays, "gross_rent", year)
+                       - gross_rent(canonical_assumptions, year)) <= Decimal("0.01")
+            assert abs(proforma_array_value(arrays, "noi", year)
+                       - noi(canonical_assumptions, year)) <= Decimal("0.05")
+            assert abs(proforma_array_value(arrays, "property_value", year)
+                       - property_value(canonical_assumptions, year)) <= Decimal("0.01")
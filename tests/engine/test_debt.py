@@ -46,6 +46,25 @@ class TestAmortizationSchedule:
         schedule = amortization_schedule(Decimal("400000"), Decimal("0.07"), 30)
         assert schedule.payments[-1].balance <= Decimal("1.00")
 
+    def test_payment_view_matches_columns(self):
+        schedule = amortization_schedule(Decimal("400000"), Decimal("0.07"), 30)
+        last = schedule.payments[-1]
+        assert last.period == 360
+        assert last.balance == schedule.balances[-1]
+        assert [p.period for p in schedule.payments[12:15]] == [13, 14, 15]
+        arrays = schedule.as_arrays()
+        assert bool((arrays["balance"][1:] < arrays["balance"][:-1]).all())
+
+    def test_sub_cent_principal_carried_at_full_precision(self):
+        """A price * LTV principal is not rounded to cents before amortizing."""
+        schedule = amortization_schedule(
+            Decimal("308988.7350"), Decimal("0.07"), 30, hold_years=7
+        )
+        assert schedule.payments[0].balance == Decimal("308735.46")
+        assert schedule.payments[-1].balance == Decimal("281635.22")
+        assert schedule.total_interest == Decimal("145326.12")
+        assert schedule.total_principal == Decimal("27353.52")
+
 
 class TestYearlyDebtSummary:
     def test_seven_year_summary(self):
@@ -1,3 +1,5 @@
+import random
+from dataclasses import replace
 from decimal import Decimal
 
 from src.engine.depreciation import (
@@ -5,7 +7,9 @@ from src.engine.depreciation import (
     macrs_depreciation,
     compute_yearly_depreciation,
     total_depreciation_taken,
+    compute_depreciation_schedule,
 )
+from src.models.assumptions import CostSegAllocation
 
 
 class TestResidentialDepreciation:
@@ -80,3 +84,38 @@ class TestTotalDepreciation:
         # Should be meaningful but less than depreciable basis
         assert total > 0
         assert total < canonical_assumptions.depreciable_basis
+
+    def test_matches_yearly_sum(self, canonical_assumptions_with_cost_seg):
+        expected = sum(
+            compute_yearly_depreciation(canonical_assumptions_with_cost_seg, y).total
+            for y in range(1, 8)
+        )
+        assert total_depreciation_taken(canonical_assumptions_with_cost_seg, 7) == expected
+
+    def test_matches_yearly_sum_random_deals(self, canonical_assumptions):
+        """Cent-exact against the per-year Decimal totals, not just near them."""
+        rng = random.Random(20250101)
+        for _ in range(300):
+            assumptions = replace(
+                canonical_assumptions,
+                purchase_price=Decimal(rng.randrange(5_000_000, 300_000_000)) / 100,
+                cost_seg=CostSegAllocation(
+                    five_year=Decimal(rng.randrange(0, 20)) / 100,
+                    seven_year=Decimal(rng.randrange(0, 10)) / 100,
+                    fifteen_year=Decimal(rng.randrange(0, 10)) / 100,
+                ),
+                placed_in_service_year=rng.choice([2017, 2023, 2025]),
+                placed_in_service_month=rng.randint(1, 12),
+            )
+            through_year = rng.randint(1, 30)
+            expected = sum(
+                compute_yearly_depreciation(assumptions, y).total
+                for y in range(1, through_year + 1)
+            )
+            assert total_depreciation_taken(assumptions, through_year) == expected
+
+    def test_schedule_shape(self, canonical_assumptions_with_cost_seg):
+        schedule = compute_depreciation_schedule(canonical_assumptions_with_cost_seg, 7)
+        assert schedule.shape == (7, 5)
+        assert schedule[0, 4] > 0  # bonus in year 1 only
+        assert (schedule[1:, 4] == 0).all()
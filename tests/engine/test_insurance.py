@@ -4,7 +4,15 @@ from decimal import Decimal
 
 import pytest
 
-from src.engine.insurance import estimate_annual_insurance
+import numpy as np
+
+from src.engine.insurance import (
+    estimate_annual_insurance,
+    estimate_annual_insurance_batch,
+    estimate_insurance_batch,
+    estimate_insurance_composite,
+    estimate_insurance_composite_premium_only,
+)
 
 
 class TestInsuranceEstimator:
@@ -138,3 +146,119 @@ class TestInsuranceEstimator:
             property_type="SFR",
         )
         assert result == Decimal("1470")
+
+    def test_batch_matches_scalar(self):
+        cases = [
+            (Decimal("200000"), 2005, "OH", "SFR"),
+            (Decimal("300000"), 2000, "fl", "SFR"),
+            (Decimal("400000"), 1945, "FL", "Multi-Family"),
+            (Decimal("250000"), 1965, "CA", "Condo"),
+            (Decimal("50000"), 0, "TX", "SFR"),
+        ]
+        batch = estimate_annual_insurance_batch(
+            np.array([float(v) for v, _, _, _ in cases]),
+            np.array([y for _, y, _, _ in cases]),
+            [s for _, _, s, _ in cases],
+            [t for _, _, _, t in cases],
+        )
+        expected = [float(estimate_annual_insurance(v, 1500, y, s, t)) for v, y, s, t in cases]
+        assert batch.tolist() == expected
+
+
+class TestCompositeInsurance:
+    def test_no_hazards(self):
+        premium, detail = estimate_insurance_composite(
+            property_value=Decimal("400000"), year_built=2005,
+        )
+        # 400000 * 0.80 * 0.0035 = $1120
+        assert premium == Decimal("1120")
+        assert detail.value == premium
+
+    def test_stacked_hazards(self):
+        premium, detail = estimate_insurance_composite(
+            property_value=Decimal("400000"),
+            year_built=1965,
+            flood_zone="AE",
+            hurricane_zone=3,
+        )
+        # 1120 * 1.5 flood * 1.3 hurricane * 1.1 age = $2402.40
+        assert premium == Decimal("2402")
+        assert "Flood zone AE" in detail.justification
+        assert detail.data_points["total_multiplier"] == 2.145
+
+    def test_batch_matches_composite(self):
+        premiums = estimate_insurance_batch(
+            property_values=np.array([400000.0, 400000.0, 250000.0]),
+            year_built=np.array([2005, 1965, 1940]),
+            property_types=["SFR", "SFR", "Condo"],
+            flood_zones=[None, "AE", "X"],
+            hurricane_zone=np.array([0, 3, 1]),
+            crime_rate=np.array([np.nan, 1500.0, 4000.0]),
+        )
+        expected = [
+            estimate_insurance_composite(Decimal("400000"), 2005)[0],
+            estimate_insurance_composite(
+                Decimal("400000"), 1965, flood_zone="AE", hurricane_zone=3,
+                crime_rate=Decimal("1500"),
+            )[0],
+            estimate_insurance_composite(
+                Decimal("250000"), 1940, property_type="Condo", flood_zone="X",
+                hurricane_zone=1, crime_rate=Decimal("4000"),
+            )[0],
+        ]
+        assert [Decimal(int(p)) for p in premiums] == expected
+
+    def test_batch_threshold_edges_match_composite(self):
+        """Values on each table's cut points land in the same tier as the scalar model."""
+        pga = [None, Decimal("0.2"), Decimal("0.4"), Decimal("0.19")]
+        crime = [Decimal("2000"), Decimal("3500"), None, Decimal("3500.01")]
+        wildfire = [3, 4, 5, None]
+        hurricane = [1, 3, 0, 2]
+        premiums = estimate_insurance_batch(
+            property_values=np.full(4, 650000.0),
+            year_built=np.full(4, 1988),
+            seismic_pga=np.array([np.nan if p is None else float(p) for p in pga]),
+            wildfire_risk=np.array([w or 0 for w in wildfire]),
+            hurricane_zone=np.array(hurricane),
+            crime_rate=np.array([np.nan if c is None else float(c) for c in crime]),
+        )
+        expected = [
+            estimate_insurance_composite(
+                Decimal("650000"), 1988, seismic_pga=p, wildfire_risk=w,
+                hurricane_zone=h, crime_rate=c,
+            )[0]
+            for p, w, h, c in zip(pga, wildfire, hurricane, crime)
+        ]
+        assert [Decimal(int(p)) for p in premiums] == expected
+
+    def test_premium_only_matches_composite(self):
+        kwargs = dict(
+            property_value=Decimal("400000"), year_built=1940, property_type="multi-family",
+            flood_zone="ae", seismic_pga=Decimal("0.3"), wildfire_risk=4,
+            hurricane_zone=2, hail_frequency="high", crime_rate=Decimal("4000"),
+        )
+        premium, _ = estimate_insurance_composite(**kwargs)
+        assert estimate_insurance_composite_premium_only(**kwargs) == premium
+
+    def test_half_dollar_float_noise_in_both_paths(self):
+        """1820 * 1.5 flood * 1.15 hurricane = $3139.50 exactly, though float gives 3139.4999..."""
+        kwargs = dict(
+            property_value=Decimal("650000"), year_built=1988, property_type="Townhouse",
+            flood_zone="AE", seismic_pga=Decimal("0"), wildfire_risk=2, hurricane_zone=2,
+            hail_frequency="extreme", crime_rate=Decimal("2000"),
+        )
+        premium, _ = estimate_insurance_composite(**kwargs)
+        assert premium == Decimal("3140")
+        assert estimate_insurance_composite_premium_only(**kwargs) == premium
+
+    def test_half_dollar_rounds_like_legacy(self):
+        """603750 * 0.80 * 0.35% = $1690.50, which the legacy estimator rounds half-even."""
+        legacy = estimate_annual_insurance(Decimal("483000"), 1500, 2005)
+        premium, _ = estimate_insurance_composite(Decimal("603750"), 2005)
+        batch = estimate_insurance_batch(
+            property_values=np.array([603750.0]), year_built=np.array([2005])
+        )
+        assert legacy == Decimal("1690")
+        assert premium == legacy
+        assert estimate_insurance_composite_premium_only(Decimal("603750"), 2005) == legacy
+        assert batch.tolist() == [1690.0]
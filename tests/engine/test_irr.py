@@ -1,6 +1,8 @@
 from decimal import Decimal
 
-from src.engine.irr import compute_irr, compute_equity_multiple
+import numpy as np
+
+from src.engine.irr import compute_irr, compute_irr_batch, compute_equity_multiple
 
 
 class TestIRR:
@@ -21,9 +23,41 @@ class TestIRR:
         irr = compute_irr([Decimal("-100"), Decimal("-10"), Decimal("-10")])
         assert irr == Decimal("0")
 
+    def test_negative_irr(self):
+        """Partial loss of capital gives a negative IRR."""
+        irr = compute_irr([Decimal("-100"), Decimal("1"), Decimal("2"), Decimal("50")])
+        assert irr == Decimal("-0.1945")
+
+    def test_no_root_in_range(self):
+        """Two sign changes but both roots outside the bracket: no IRR, not a Newton root."""
+        irr = compute_irr([Decimal("-100"), Decimal("230"), Decimal("-132")])
+        assert irr == Decimal("0")
+
+    def test_multiple_roots_matches_brent(self):
+        """Roots at 5%, 30% and 100%; the result is the one Brent's method picks."""
+        cfs = [Decimal("-1000"), Decimal("4350"), Decimal("-6065"), Decimal("2730")]
+        assert compute_irr(cfs) == Decimal("1.0000")
+
     def test_empty_cash_flows(self):
         assert compute_irr([]) == Decimal("0")
 
+    def test_array_matches_decimal(self):
+        cfs = [-100000, 10000, 10000, 10000, 10000, 130000]
+        expected = compute_irr([Decimal(x) for x in cfs])
+        assert compute_irr(np.array(cfs, dtype=np.float64)) == expected
+
+    def test_batch_matches_scalar(self):
+        rows = [
+            [-100000, 10000, 10000, 10000, 10000, 130000],
+            [-100, 1, 2, 50, 0, 0],
+            [-100, -5, -5, -5, -5, -5],  # no IRR in range
+            [-100, 230, -132, 0, 0, 0],  # roots only outside the bracket
+            [-1000, 4350, -6065, 2730, 0, 0],  # several roots
+        ]
+        irrs = compute_irr_batch(np.array(rows, dtype=np.float64))
+        expected = [float(compute_irr([Decimal(x) for x in row])) for row in rows]
+        assert irrs.tolist() == expected
+
 
 class TestEquityMultiple:
     def test_basic(self):
@@ -5,7 +5,7 @@ from decimal import Decimal
 import pytest
 
 from src.engine.loan_products import conventional_loan, dscr_loan
-from src.models.smart_assumptions import MacroContext
+from src.models.smart_assumptions import CreditTier, MacroContext
 
 
 @pytest.fixture
@@ -49,6 +49,22 @@ class TestConventionalLoan:
         assert "6.85%" in loan.rate_source
         assert "investment property premium" in loan.rate_source
 
+    def test_cached_per_rate_and_tier(self, macro_with_rate):
+        same_rate = MacroContext(mortgage_rate_30y=Decimal("0.0685"), treasury_10y=Decimal("0.04"))
+        assert conventional_loan(macro_with_rate) is conventional_loan(same_rate)
+        assert conventional_loan(macro_with_rate, "good") is not conventional_loan(macro_with_rate)
+
+    def test_enum_tier_matches_name(self, macro_with_rate):
+        loan = conventional_loan(macro_with_rate, CreditTier.FAIR)
+        assert loan is conventional_loan(macro_with_rate, "fair")
+        assert "fair credit" in loan.rate_source
+
+    def test_unknown_tier_keeps_caller_label(self, macro_with_rate):
+        loan = conventional_loan(macro_with_rate, credit_score_tier="poor")
+        assert loan.interest_rate == conventional_loan(macro_with_rate).interest_rate
+        assert "0bps poor credit" in loan.rate_source
+        assert "excellent" not in loan.rate_source
+
 
 class TestDSCRLoan:
     def test_strong_dscr(self, macro_with_rate):
@@ -1,11 +1,15 @@
 """Tests for the data-driven maintenance cost estimator."""
 
+import datetime
 from decimal import Decimal
+from types import SimpleNamespace
 
 import pytest
 
+from src.engine import maintenance
 from src.engine.maintenance import estimate_maintenance_pct
 from src.data.climate import ClimateZone
+from src.models.rehab import ConditionGrade
 
 
 class TestMaintenance:
@@ -90,3 +94,33 @@ class TestMaintenance:
         pct_turnkey, _ = estimate_maintenance_pct(year_built=2000, condition_grade="turnkey")
         pct_gut, _ = estimate_maintenance_pct(year_built=2000, condition_grade="full_gut")
         assert pct_gut > pct_turnkey
+
+    def test_condition_enum_matches_string(self):
+        by_enum = estimate_maintenance_pct(year_built=1990, condition_grade=ConditionGrade.HEAVY)
+        by_str = estimate_maintenance_pct(year_built=1990, condition_grade="Heavy")
+        assert by_enum[0] == by_str[0]
+        assert by_enum[1].justification == by_str[1].justification
+        assert by_enum[1].data_points["condition_grade"] == "heavy"
+
+    def test_detail_not_shared_between_calls(self):
+        _, first = estimate_maintenance_pct(year_built=1990, renter_pct=Decimal("0.55"))
+        first.data_points["renter_pct"] = None
+        _, second = estimate_maintenance_pct(year_built=1990, renter_pct=Decimal("0.55"))
+        assert second is not first
+        assert second.data_points["renter_pct"] == 0.55
+
+    def test_age_follows_current_year(self, monkeypatch):
+        """Ages are not frozen at import: a new year moves a property up a bin."""
+        this_year = datetime.date.today().year
+
+        class _NextYear(datetime.date):
+            @classmethod
+            def today(cls):
+                return cls(this_year + 1, 1, 2)
+
+        build_year = this_year - 5
+        _, before = estimate_maintenance_pct(year_built=build_year)
+        monkeypatch.setattr(maintenance, "datetime", SimpleNamespace(date=_NextYear))
+        _, after = estimate_maintenance_pct(year_built=build_year)
+        assert "New build (5yr)" in before.justification
+        assert "Modern (6yr)" in after.justification
@@ -2,9 +2,15 @@
 
 from decimal import Decimal
 
+import numpy as np
 import pytest
 
-from src.engine.neighborhood import compute_neighborhood_grade
+from src.engine.neighborhood import (
+    compute_neighborhood_grade,
+    income_scores_batch,
+    safety_scores_batch,
+    school_scores_batch,
+)
 from src.models.neighborhood import (
     NeighborhoodDemographics,
     NeighborhoodGrade,
@@ -114,6 +120,30 @@ class TestNeighborhoodGrading:
         grade, score = compute_neighborhood_grade(demographics_high, walk_high, schools_high)
         assert grade == NeighborhoodGrade.A
 
+    @pytest.mark.parametrize(
+        "walk, flood_zone, rating, expected_score, expected_grade",
+        [
+            (0, "A", None, Decimal("45.0"), NeighborhoodGrade.C),
+            (0, "V", None, Decimal("44.0"), NeighborhoodGrade.D),
+            (80, None, 8, Decimal("65.0"), NeighborhoodGrade.B),
+            (79, None, 8, Decimal("64.8"), NeighborhoodGrade.C),
+        ],
+    )
+    def test_score_on_grade_cut_point(
+        self, walk, flood_zone, rating, expected_score, expected_grade
+    ):
+        """A score equal to a cut point takes the higher grade."""
+        schools = []
+        if rating is not None:
+            schools = [
+                SchoolInfo(name="S1", rating=rating, level="high", distance_miles=Decimal("1"))
+            ]
+        grade, score = compute_neighborhood_grade(
+            None, WalkScoreResult(walk_score=walk), schools, flood_zone=flood_zone
+        )
+        assert score == expected_score
+        assert grade == expected_grade
+
     def test_school_averaging(self):
         """Multiple schools with varying ratings get averaged."""
         demographics = NeighborhoodDemographics(
@@ -132,6 +162,27 @@ class TestNeighborhoodGrading:
         assert isinstance(grade, NeighborhoodGrade)
         assert Decimal("0") <= score <= Decimal("100")
 
+    def test_school_ratings_array_matches_objects(self):
+        schools = [
+            SchoolInfo(name="S1", rating=8, level="elementary", distance_miles=Decimal("0.5")),
+            SchoolInfo(name="S2", rating=5, level="middle", distance_miles=Decimal("1.0")),
+            SchoolInfo(name="S3", rating=6, level="high", distance_miles=Decimal("1.5")),
+        ]
+        expected = compute_neighborhood_grade(None, None, schools)
+        ratings = np.array([s.rating for s in schools])
+        assert compute_neighborhood_grade(None, None, [], school_ratings=ratings) == expected
+
+    def test_school_scores_batch(self):
+        # Neighborhoods with ratings [8, 4, 6], none, and [7, 8]
+        scores = school_scores_batch(np.array([8, 4, 6, 7, 8]), np.array([3, 0, 2]))
+        assert scores.tolist() == [12.0, 10.0, 15.0]
+
+    def test_tier_scores_batch_boundaries(self):
+        incomes = np.array([34_999, 35_000, 100_000, np.nan])
+        assert income_scores_batch(incomes).tolist() == [4.0, 8.0, 20.0, 10.0]
+        rates = np.array([999, 1000, 3500, np.nan])
+        assert safety_scores_batch(rates).tolist() == [20.0, 17.0, 2.0, 10.0]
+
     def test_crime_affects_grade(self):
         """High crime rate reduces the score."""
         demographics = NeighborhoodDemographics(
@@ -1,8 +1,14 @@
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
+
+import numpy as np
+import pytest
 
 from src.engine.opportunity_cost import (
     sp500_equity_curve,
+    sp500_equity_curves,
     sp500_after_tax_proceeds,
+    sp500_after_tax_proceeds_batch,
+    sp500_after_tax_irr_batch,
     sharpe_ratio,
     build_comparison,
 )
@@ -22,6 +28,36 @@ class TestSP500EquityCurve:
         curve = sp500_equity_curve(Decimal("100000"), 7)
         assert curve[0] == Decimal("100000")
 
+    def test_batch_matches_scalar(self):
+        curves = sp500_equity_curves(np.array([100000.0, 25000.0]), 7)
+        assert curves.shape == (2, 8)
+        assert curves[0].tolist() == [float(v) for v in sp500_equity_curve(Decimal("100000"), 7)]
+
+
+    @pytest.mark.parametrize(
+        "initial, hold_years, annual_return",
+        [
+            (Decimal("100000"), 7, Decimal("0.10")),
+            (Decimal("437219.37"), 30, Decimal("0.10")),
+            (Decimal("149319.71"), 38, Decimal("0.299")),
+            (Decimal("12.34"), 20, Decimal("-0.05")),
+        ],
+    )
+    def test_drift_from_compounded_rounding(self, initial, hold_years, annual_return):
+        """Against the old curve, which rounded the running balance every year.
+
+        That curve carries up to half a cent of rounding per year, compounded
+        forward, so year k may differ by 0.005 * (1 + sum of (1+r)^j, j < k):
+        cents over a 7-year hold, tens of dollars at 30% over 38 years.
+        """
+        old = [initial]
+        for _ in range(hold_years):
+            old.append((old[-1] * (1 + annual_return)).quantize(Decimal("0.01"), ROUND_HALF_UP))
+        curve = sp500_equity_curve(initial, hold_years, annual_return)
+        for k, (new_value, old_value) in enumerate(zip(curve, old)):
+            bound = Decimal("0.005") * (1 + sum((1 + annual_return) ** j for j in range(k)))
+            assert abs(new_value - old_value) <= bound
+
 
 class TestSP500AfterTax:
     def test_gain_taxed(self):
@@ -40,6 +76,14 @@ class TestSP500AfterTax:
         )
         assert proceeds == Decimal("100000")
 
+    def test_batch_matches_scalar(self):
+        initial = Decimal("100000")
+        curve = sp500_equity_curve(initial, 7, annual_return=Decimal("-0.05"))
+        curve += sp500_equity_curve(initial, 7)
+        batch = sp500_after_tax_proceeds_batch(100000.0, np.array(curve, dtype=np.float64), 0.133)
+        expected = [float(sp500_after_tax_proceeds(initial, v, Decimal("0.133"))) for v in curve]
+        assert batch.tolist() == pytest.approx(expected, abs=0.015)
+
 
 class TestSharpeRatio:
     def test_basic(self):
@@ -52,20 +96,17 @@ class TestSharpeRatio:
 
 
 class TestBuildComparison:
-    def test_comparison_structure(self, canonical_assumptions, canonical_investor):
-        from src.engine.proforma import run_proforma
-
-        result = run_proforma(canonical_assumptions, canonical_investor)
+    def test_comparison_structure(
+        self, canonical_assumptions, canonical_investor, baseline_proforma
+    ):
+        result = baseline_proforma
         re_equity = [p.equity for p in result.yearly_projections]
 
-        total_cash = sum(p.cash_flow_after_tax for p in result.yearly_projections)
-        total_cash += result.disposition.after_tax_sale_proceeds
-
         comparison = build_comparison(
             initial_equity=canonical_assumptions.total_initial_investment,
             re_yearly_equity=re_equity,
             re_after_tax_irr=result.after_tax_irr,
-            re_total_cash_returned=total_cash,
+            re_total_cash_returned=result.total_cash_returned,
             hold_years=canonical_assumptions.hold_years,
             state_tax_rate=canonical_investor.marginal_state_rate,
             niit_applies=canonical_investor.niit_applies,
@@ -73,3 +114,36 @@ class TestBuildComparison:
 
         assert len(comparison.sp500_yearly_equity) == 8
         assert comparison.sp500_after_tax_irr > 0
+
+    def test_irr_rounds_the_printed_cagr(self):
+        """$101,715 after tax on $100K is a 1.715% CAGR, which rounds up even
+        though the float 0.01715 sits just below the tie."""
+        comparison = build_comparison(
+            initial_equity=Decimal("100000"),
+            re_yearly_equity=[],
+            re_after_tax_irr=Decimal("0"),
+            re_total_cash_returned=Decimal("100000"),
+            hold_years=1,
+            state_tax_rate=Decimal("0"),
+            niit_applies=False,
+            sp500_annual_return=Decimal("0.0214375"),
+        )
+        assert comparison.sp500_after_tax_irr == Decimal("0.0172")
+        assert comparison.sp500_after_tax_irr == comparison.sp500_total_return
+
+    def test_irr_batch_matches_comparison(self, canonical_assumptions, canonical_investor):
+        initial = canonical_assumptions.total_initial_investment
+        comparison = build_comparison(
+            initial_equity=initial,
+            re_yearly_equity=[],
+            re_after_tax_irr=Decimal("0"),
+            re_total_cash_returned=initial,
+            hold_years=7,
+            state_tax_rate=canonical_investor.marginal_state_rate,
+        )
+        after_tax = initial * (1 + comparison.sp500_total_return)
+        irrs = sp500_after_tax_irr_batch(
+            np.array([float(initial), 0.0]), np.array([float(after_tax), 1000.0]), 7
+        )
+        assert abs(irrs[0] - float(comparison.sp500_after_tax_irr)) <= 0.0001
+        assert irrs[1] == 0.0
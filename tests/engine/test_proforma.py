@@ -1,164 +1,240 @@
 from dataclasses import replace
 from decimal import Decimal
 
-from src.engine.proforma import run_proforma
+import pytest
+
+from src.engine.proforma import (
+    run_proforma,
+    run_proforma_batch,
+    run_proforma_fast,
+    run_proforma_parallel,
+)
 from src.engine.rehab import estimate_rehab_budget
 from src.models.rehab import ConditionGrade
 
 
+def _rehab_proforma(assumptions, investor, grade):
+    rehab = estimate_rehab_budget(sqft=1500, year_built=2005, condition_grade=grade)
+    return rehab, run_proforma(replace(assumptions, rehab_budget=rehab), investor)
+
+
+@pytest.fixture(scope="module")
+def medium_rehab_proforma(canonical_assumptions, canonical_investor):
+    """(rehab budget, result) for the canonical deal with a medium rehab."""
+    return _rehab_proforma(canonical_assumptions, canonical_investor, ConditionGrade.MEDIUM)
+
+
+@pytest.fixture(scope="module")
+def heavy_rehab_proforma(canonical_assumptions, canonical_investor):
+    """(rehab budget, result) for the canonical deal with a heavy rehab."""
+    return _rehab_proforma(canonical_assumptions, canonical_investor, ConditionGrade.HEAVY)
+
+
 class TestProforma:
-    def test_runs_without_error(self, canonical_assumptions, canonical_investor):
-        result = run_proforma(canonical_assumptions, canonical_investor)
-        assert result is not None
-        assert len(result.yearly_projections) == 7
-
-    def test_yearly_projections_sequential(self, canonical_assumptions, canonical_investor):
-        result = run_proforma(canonical_assumptions, canonical_investor)
-        for i, proj in enumerate(result.yearly_projections):
+    def test_runs_without_error(self, baseline_proforma):
+        assert baseline_proforma is not None
+        assert len(baseline_proforma.yearly_projections) == 7
+
+    def test_yearly_projections_sequential(self, baseline_proforma):
+        for i, proj in enumerate(baseline_proforma.yearly_projections):
             assert proj.year == i + 1
 
-    def test_noi_positive(self, canonical_assumptions, canonical_investor):
-        result = run_proforma(canonical_assumptions, canonical_investor)
-        for proj in result.yearly_projections:
+    def test_noi_positive(self, baseline_proforma):
+        for proj in baseline_proforma.yearly_projections:
             assert proj.noi > 0
 
-    def test_rent_grows(self, canonical_assumptions, canonical_investor):
-        result = run_proforma(canonical_assumptions, canonical_investor)
-        for i in range(1, len(result.yearly_projections)):
-            assert result.yearly_projections[i].gross_rent > result.yearly_projections[i - 1].gross_rent
+    def test_rent_grows(self, baseline_proforma):
+        projections = baseline_proforma.yearly_projections
+        for i in range(1, len(projections)):
+            assert projections[i].gross_rent > projections[i - 1].gross_rent
 
-    def test_property_value_appreciates(self, canonical_assumptions, canonical_investor):
-        result = run_proforma(canonical_assumptions, canonical_investor)
-        for i in range(1, len(result.yearly_projections)):
+    def test_property_value_appreciates(self, baseline_proforma):
+        for i in range(1, len(baseline_proforma.yearly_projections)):
             assert (
-                result.yearly_projections[i].property_value
-                > result.yearly_projections[i - 1].property_value
+                baseline_proforma.yearly_projections[i].property_value
+                > baseline_proforma.yearly_projections[i - 1].property_value
             )
 
-    def test_loan_balance_decreases(self, canonical_assumptions, canonical_investor):
-        result = run_proforma(canonical_assumptions, canonical_investor)
-        for i in range(1, len(result.yearly_projections)):
+    def test_loan_balance_decreases(self, baseline_proforma):
+        for i in range(1, len(baseline_proforma.yearly_projections)):
             assert (
-                result.yearly_projections[i].loan_balance
-                < result.yearly_projections[i - 1].loan_balance
+                baseline_proforma.yearly_projections[i].loan_balance
+                < baseline_proforma.yearly_projections[i - 1].loan_balance
             )
 
-    def test_irr_computed(self, canonical_assumptions, canonical_investor):
-        result = run_proforma(canonical_assumptions, canonical_investor)
+    def test_irr_computed(self, baseline_proforma):
         # With appreciation, IRR should be positive
-        assert result.before_tax_irr > 0
-        assert result.after_tax_irr > 0
+        assert baseline_proforma.before_tax_irr > 0
+        assert baseline_proforma.after_tax_irr > 0
 
-    def test_equity_multiple_above_one(self, canonical_assumptions, canonical_investor):
-        result = run_proforma(canonical_assumptions, canonical_investor)
-        assert result.equity_multiple > Decimal("1")
+    def test_equity_multiple_above_one(self, baseline_proforma):
+        assert baseline_proforma.equity_multiple > Decimal("1")
 
-    def test_disposition_computed(self, canonical_assumptions, canonical_investor):
-        result = run_proforma(canonical_assumptions, canonical_investor)
-        assert result.disposition.sale_price > 0
-        assert result.disposition.after_tax_sale_proceeds > 0
+    def test_disposition_computed(self, baseline_proforma):
+        assert baseline_proforma.disposition.sale_price > 0
+        assert baseline_proforma.disposition.after_tax_sale_proceeds > 0
 
-    def test_suspended_losses_high_income(self, canonical_assumptions, canonical_investor):
+    def test_suspended_losses_high_income(self, baseline_proforma):
         """High-income investor should have suspended losses."""
-        result = run_proforma(canonical_assumptions, canonical_investor)
         # With depreciation creating paper losses, should have some suspended
         # (depends on whether NOI - interest - depreciation is negative)
-        assert result.total_depreciation_taken > 0
+        assert baseline_proforma.total_depreciation_taken > 0
 
     def test_cost_seg_higher_year1_depreciation(
         self,
-        canonical_assumptions,
         canonical_assumptions_with_cost_seg,
         canonical_investor,
+        baseline_proforma,
     ):
         """Cost seg should produce higher year 1 depreciation."""
-        no_cs = run_proforma(canonical_assumptions, canonical_investor)
         with_cs = run_proforma(canonical_assumptions_with_cost_seg, canonical_investor)
         assert (
             with_cs.yearly_projections[0].total_depreciation
-            > no_cs.yearly_projections[0].total_depreciation
+            > baseline_proforma.yearly_projections[0].total_depreciation
         )
 
-    def test_total_initial_investment(self, canonical_assumptions, canonical_investor):
-        result = run_proforma(canonical_assumptions, canonical_investor)
+    def test_total_cash_returned(self, baseline_proforma):
+        expected = sum(p.cash_flow_after_tax for p in baseline_proforma.yearly_projections)
+        expected += baseline_proforma.disposition.after_tax_sale_proceeds
+        assert baseline_proforma.total_cash_returned == expected
+        profit = expected - baseline_proforma.total_initial_investment
+        assert baseline_proforma.total_profit == profit
+
+    def test_total_initial_investment(self, canonical_assumptions, baseline_proforma):
         expected = canonical_assumptions.total_initial_investment
-        assert result.total_initial_investment == expected
+        assert baseline_proforma.total_initial_investment == expected
 
 
 class TestProformaRehab:
-    def test_zero_rehab_identical_to_baseline(self, canonical_assumptions, canonical_investor):
+    def test_zero_rehab_identical_to_baseline(self, baseline_proforma):
         """Turnkey (default) should produce same results as before rehab feature."""
-        result = run_proforma(canonical_assumptions, canonical_investor)
-        assert result.rehab_total_cost == Decimal("0")
-        assert result.rehab_months == 0
-        assert result.yearly_projections[0].rent_months == 12
-
-    def test_rehab_increases_initial_investment(self, canonical_assumptions, canonical_investor):
-        baseline = run_proforma(canonical_assumptions, canonical_investor)
+        assert baseline_proforma.rehab_total_cost == Decimal("0")
+        assert baseline_proforma.rehab_months == 0
+        assert baseline_proforma.yearly_projections[0].rent_months == 12
 
+    def test_rehab_increases_initial_investment(
+        self, canonical_assumptions, canonical_investor, baseline_proforma
+    ):
         rehab = estimate_rehab_budget(
             sqft=1500, year_built=1985, condition_grade=ConditionGrade.MEDIUM
         )
         assumptions_with_rehab = replace(canonical_assumptions, rehab_budget=rehab)
         result = run_proforma(assumptions_with_rehab, canonical_investor)
 
-        assert result.total_initial_investment > baseline.total_initial_investment
+        assert result.total_initial_investment > baseline_proforma.total_initial_investment
         assert result.rehab_total_cost > Decimal("0")
         assert (
             result.total_initial_investment
-            == baseline.total_initial_investment + rehab.total_cost
+            == baseline_proforma.total_initial_investment + rehab.total_cost
         )
 
-    def test_year1_rent_prorated(self, canonical_assumptions, canonical_investor):
-        rehab = estimate_rehab_budget(
-            sqft=1500, year_built=2005, condition_grade=ConditionGrade.MEDIUM
-        )
+    def test_year1_rent_prorated(self, medium_rehab_proforma, baseline_proforma):
+        rehab, result = medium_rehab_proforma
         # Medium = 3 months rehab
         assert rehab.rehab_months == 3
 
-        assumptions_with_rehab = replace(canonical_assumptions, rehab_budget=rehab)
-        result = run_proforma(assumptions_with_rehab, canonical_investor)
-        baseline = run_proforma(canonical_assumptions, canonical_investor)
-
         # Year 1 rent should be 9/12 of full year
-        expected_y1_rent = (baseline.yearly_projections[0].gross_rent * Decimal("9") / Decimal("12")).quantize(Decimal("0.01"))
+        baseline_rent = baseline_proforma.yearly_projections[0].gross_rent
+        expected_y1_rent = (baseline_rent * Decimal("9") / Decimal("12")).quantize(Decimal("0.01"))
         assert result.yearly_projections[0].gross_rent == expected_y1_rent
         assert result.yearly_projections[0].rent_months == 9
 
-    def test_year2_rent_not_prorated(self, canonical_assumptions, canonical_investor):
-        rehab = estimate_rehab_budget(
-            sqft=1500, year_built=2005, condition_grade=ConditionGrade.MEDIUM
-        )
-        assumptions_with_rehab = replace(canonical_assumptions, rehab_budget=rehab)
-        result = run_proforma(assumptions_with_rehab, canonical_investor)
-        baseline = run_proforma(canonical_assumptions, canonical_investor)
-
+    def test_year2_rent_not_prorated(self, medium_rehab_proforma, baseline_proforma):
+        _, result = medium_rehab_proforma
         # Year 2 should be identical
-        assert result.yearly_projections[1].gross_rent == baseline.yearly_projections[1].gross_rent
+        assert (
+            result.yearly_projections[1].gross_rent
+            == baseline_proforma.yearly_projections[1].gross_rent
+        )
         assert result.yearly_projections[1].rent_months == 12
 
-    def test_fixed_costs_full_year_during_rehab(self, canonical_assumptions, canonical_investor):
+    def test_fixed_costs_full_year_during_rehab(self, heavy_rehab_proforma, baseline_proforma):
         """Property tax, insurance, and debt service are full year even during rehab."""
-        rehab = estimate_rehab_budget(
-            sqft=1500, year_built=2005, condition_grade=ConditionGrade.HEAVY
-        )
-        assumptions_with_rehab = replace(canonical_assumptions, rehab_budget=rehab)
-        result = run_proforma(assumptions_with_rehab, canonical_investor)
-        baseline = run_proforma(canonical_assumptions, canonical_investor)
+        _, result = heavy_rehab_proforma
 
         y1 = result.yearly_projections[0]
-        y1_base = baseline.yearly_projections[0]
+        y1_base = baseline_proforma.yearly_projections[0]
 
         assert y1.property_tax == y1_base.property_tax
         assert y1.insurance == y1_base.insurance
         assert y1.debt_service == y1_base.debt_service
 
-    def test_rehab_fields_on_result(self, canonical_assumptions, canonical_investor):
+    def test_rehab_fields_on_result(self, heavy_rehab_proforma):
+        rehab, result = heavy_rehab_proforma
+        assert result.rehab_total_cost == rehab.total_cost
+        assert result.rehab_months == rehab.rehab_months
+
+
+class TestProformaFast:
+    def test_matches_decimal_proforma(
+        self, canonical_assumptions_with_cost_seg, canonical_investor
+    ):
+        exact = run_proforma(canonical_assumptions_with_cost_seg, canonical_investor)
+        fast = run_proforma_fast(canonical_assumptions_with_cost_seg, canonical_investor)
+        assert len(fast.yearly_projections) == len(exact.yearly_projections)
+        for e, f in zip(exact.yearly_projections, fast.yearly_projections):
+            assert f.gross_rent == e.gross_rent
+            assert abs(f.noi - e.noi) <= Decimal("0.05")
+            assert abs(f.loan_balance - e.loan_balance) <= Decimal("0.50")
+            assert abs(f.cash_flow_after_tax - e.cash_flow_after_tax) <= Decimal("0.50")
+            assert f.total_depreciation == e.total_depreciation
+        assert abs(fast.after_tax_irr - exact.after_tax_irr) <= Decimal("0.0001")
+
+    def test_rehab_rent_months(self, canonical_assumptions, canonical_investor):
         rehab = estimate_rehab_budget(
-            sqft=1500, year_built=2005, condition_grade=ConditionGrade.HEAVY
+            sqft=1500, year_built=2005, condition_grade=ConditionGrade.MEDIUM
         )
-        assumptions_with_rehab = replace(canonical_assumptions, rehab_budget=rehab)
-        result = run_proforma(assumptions_with_rehab, canonical_investor)
+        result = run_proforma_fast(
+            replace(canonical_assumptions, rehab_budget=rehab), canonical_investor
+        )
+        assert result.yearly_projections[0].rent_months == 9
+        assert result.yearly_projections[1].rent_months == 12
 
-        assert result.rehab_total_cost == rehab.total_cost
-        assert result.rehab_months == rehab.rehab_months
+
+class TestProformaBatch:
+    def test_matches_decimal_proforma(
+        self, canonical_assumptions, canonical_assumptions_with_cost_seg, canonical_investor
+    ):
+        scenarios = [canonical_assumptions, canonical_assumptions_with_cost_seg]
+        batch = run_proforma_batch(scenarios, canonical_investor)
+        assert batch["cash_flow_after_tax"].shape == (2, 7)
+        for i, assumptions in enumerate(scenarios):
+            exact = run_proforma(assumptions, canonical_investor)
+            for year, proj in enumerate(exact.yearly_projections):
+                assert abs(batch["noi"][i, year] - float(proj.noi)) <= 0.05
+                cash_flow = batch["cash_flow_after_tax"][i, year]
+                assert abs(cash_flow - float(proj.cash_flow_after_tax)) <= 0.5
+            assert abs(batch["after_tax_irr"][i] - float(exact.after_tax_irr)) <= 0.0001
+
+    def test_requires_common_hold(self, canonical_assumptions, canonical_investor):
+        scenarios = [canonical_assumptions, replace(canonical_assumptions, hold_years=10)]
+        with pytest.raises(ValueError):
+            run_proforma_batch(scenarios, canonical_investor)
+
+
+class TestProformaParallel:
+    def test_matches_serial(
+        self, canonical_assumptions, canonical_assumptions_with_cost_seg, canonical_investor
+    ):
+        scenarios = [canonical_assumptions, canonical_assumptions_with_cost_seg] * 2
+        results = run_proforma_parallel(scenarios, canonical_investor, max_workers=2)
+        assert results == [run_proforma(a, canonical_investor) for a in scenarios]
+
+    def test_after_batch(self, canonical_assumptions, canonical_investor):
+        """A batch run first starts numba's threads; the pool must not fork them."""
+        scenarios = [canonical_assumptions] * 2
+        run_proforma_batch(scenarios, canonical_investor)
+        results = run_proforma_parallel(scenarios, canonical_investor, max_workers=2)
+        assert results == [run_proforma(a, canonical_investor) for a in scenarios]
+
+
+class TestProjectionArrays:
+    def test_columns_match_projections(self, baseline_proforma):
+        result = baseline_proforma
+        arrays = result.projection_arrays()
+        assert arrays["year"].tolist() == [1, 2, 3, 4, 5, 6, 7]
+        for name in ("noi", "cash_flow_after_tax", "loan_balance", "cash_on_cash"):
+            expected = [float(getattr(p, name)) for p in result.yearly_projections]
+            assert arrays[name].tolist() == expected
+        average = float(result.average_cash_on_cash)
+        assert arrays["cash_on_cash"].mean() == pytest.approx(average, abs=1e-4)
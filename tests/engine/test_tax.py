@@ -1,8 +1,11 @@
 from decimal import Decimal
 
+import numpy as np
+
 from src.engine.tax import (
     compute_passive_activity,
     build_passive_activity_ledger,
+    build_passive_activity_ledger_batch,
     taxable_rental_income,
 )
 from src.models.investor import InvestorTaxProfile, FilingStatus
@@ -132,3 +135,52 @@ class TestPassiveIncomeOffsetsLosses:
         # Year 2: $15K income, $10K suspended released
         assert ledger.entries[1].cumulative_suspended == Decimal("0")
         assert ledger.entries[1].tax_benefit > 0
+
+
+class TestPassiveActivityLedger:
+    def test_columns_match_entries(self, low_income_investor):
+        losses = [Decimal("-30000"), Decimal("-5000"), Decimal("40000")]
+        ledger = build_passive_activity_ledger(losses, low_income_investor)
+
+        entries = list(ledger.entries)
+        assert [e.year for e in entries] == [1, 2, 3]
+        assert ledger.entries[-1] == entries[2]
+        assert ledger.total_tax_benefit == sum((e.tax_benefit for e in entries), Decimal("0"))
+        assert ledger.total_suspended == entries[-1].cumulative_suspended
+        arrays = ledger.as_arrays()
+        assert arrays["tax_benefit"].sum() == float(ledger.total_tax_benefit)
+
+    def test_batch_matches_per_scenario_ledgers(self, low_income_investor):
+        scenarios = [
+            [Decimal("-30000"), Decimal("-5000"), Decimal("40000")],
+            [Decimal("10000"), Decimal("-60000"), Decimal("-1000")],
+        ]
+        batch = build_passive_activity_ledger_batch(
+            np.array([[float(v) for v in row] for row in scenarios]), low_income_investor
+        )
+        assert batch["cumulative_suspended"].shape == (2, 3)
+        for i, losses in enumerate(scenarios):
+            arrays = build_passive_activity_ledger(losses, low_income_investor).as_arrays()
+            for name, column in arrays.items():
+                assert batch[name][i].tolist() == column.tolist()
+
+
+class TestBulkRentalLossAllowance:
+    def test_matches_scalar_property(self):
+        agis = [
+            Decimal("80000"), Decimal("100000"), Decimal("120000"),
+            Decimal("149999"), Decimal("150000"),
+        ]
+        profiles = [
+            InvestorTaxProfile(
+                FilingStatus.MFJ, agi, Decimal("0.24"), Decimal("0.05"), "TX",
+                is_re_professional=pro,
+            )
+            for pro in (False, True)
+            for agi in agis
+        ]
+        bulk = InvestorTaxProfile.bulk_rental_loss_allowance(
+            np.array([float(p.agi) for p in profiles]),
+            np.array([p.is_re_professional for p in profiles]),
+        )
+        assert bulk.tolist() == [float(p.rental_loss_allowance) for p in profiles]